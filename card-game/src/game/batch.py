@@ -0,0 +1,369 @@
+"""
+Vectorized engine that plays thousands of rounds in lockstep.
+
+BatchEngine stores N rounds as NumPy arrays (hand bitmasks, deck and table
+card ids, top card and the pending effect fields) and advances every
+unfinished round by one move per step(), using PLAYABLE_MASKS as a
+vectorized legality lookup and a vectorized baseline policy. The rules
+follow GameState.apply move for move; the rare reshuffle is done per
+round in Python with the reshuffle stream Game and GameState share
+(deck.seeded_shuffle), so a batch dealt from seeded Games ends exactly
+where those games do when they play lowest_card_policy.
+
+NumPy is optional: HAS_NUMPY tells whether the engine is available, and
+constructing a BatchEngine without it raises ImportError. The rest of the
+game never imports this module.
+"""
+try:
+    import numpy as np
+except ImportError:  # The batched engine is optional
+    np = None
+
+from .card import RANK_MASKS, SUIT_MASKS, popcount
+from .deck import seeded_shuffle
+from .game import Game
+from .hand import RANK_POINTS
+from .rng import RandomStream, derive_seed
+from .rules import PLAYABLE_MASKS, ENFORCED_STATES, SIX_STATES, EMPTY_TABLE, UNKNOWN_SUIT, NOT_ENFORCED, SIX_OPPONENT, NO_SIX
+from .state import GameState, Move, DRAW, MAX_SIX_COVER_DRAWS
+
+HAS_NUMPY = np is not None
+
+if HAS_NUMPY:
+    _ONE = np.uint64(1)
+    _BITS = np.array([1 << card_id for card_id in range(52)], dtype=np.uint64)
+    _PLAYABLE = np.array(PLAYABLE_MASKS, dtype=np.uint64)
+    _RANK_MASKS = np.array(RANK_MASKS[1:], dtype=np.uint64)  # Indexed by rank - 1
+    _NON_JACK_SUIT_MASKS = [np.uint64(SUIT_MASKS[suit] & ~RANK_MASKS[11]) for suit in range(4)]
+    _POINT_MASKS = [(np.uint64(RANK_MASKS[rank]), points) for rank, points in RANK_POINTS.items()]
+    _BYTE_COUNTS = np.array([bin(byte).count('1') for byte in range(256)], dtype=np.int64)
+
+
+def _popcount(masks):
+    """Number of set bits in each element of a uint64 array"""
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(masks).astype(np.int64)
+    masks = np.ascontiguousarray(masks, dtype=np.uint64)
+    return _BYTE_COUNTS[masks.view(np.uint8).reshape(masks.shape + (8,))].sum(axis=-1)
+
+
+def _lowest_card(masks):
+    """Id of the lowest set bit of each (non-zero) mask"""
+    low = masks & (~masks + _ONE)
+    # Powers of two convert to float64 exactly, so log2 is exact
+    return np.log2(low.astype(np.float64)).astype(np.int64)
+
+
+def _hand_points(masks):
+    total = np.zeros(len(masks), dtype=np.int64)
+    for rank_mask, points in _POINT_MASKS:
+        total += points * _popcount(masks & rank_mask)
+    return total
+
+
+def lowest_card_policy(state):
+    """
+    The batch baseline policy for a single GameState: play the lowest-id
+    playable card followed by every other card of its rank in id order.
+    Jacks choose the suit with the most non-Jack cards in hand (ties go to
+    the lower suit index, and a hand of only Jacks keeps the Jack's suit).
+    Draws only when nothing is playable.
+    """
+    hand = state.masks[state.current]
+    playable = state.playable_mask() & hand
+    if not playable:
+        return DRAW
+    first = (playable & -playable).bit_length() - 1
+    rank = first % 13 + 1
+    others = tuple(card_id for card_id in range(rank - 1, 52, 13) if card_id != first and hand >> card_id & 1)
+    suit = None
+    if rank == 11:
+        counts = [popcount(hand & SUIT_MASKS[s] & ~RANK_MASKS[11]) for s in range(4)]
+        suit = counts.index(max(counts)) if max(counts) else first // 13
+    return Move((first,) + others, suit)
+
+
+class BatchEngine:
+    """
+    N rounds stored as NumPy arrays and played in lockstep.
+
+    Attributes:
+        size: Number of rounds
+        hands: (N, 2) uint64 hand bitmasks
+        deck, deck_len: (N, 52) card ids and the number still in each deck (drawn from the end)
+        table, table_len: (N, 52) card ids and the pile size (the last one is the top card)
+        current: Index of the player to move
+        draw_cards, skip_turn: Pending draw and skip effects for the next player
+        requires_six, six_chain, six_owner, six_suit: 6-covering state (-1 when unset)
+        enforced_suit: Suit index chosen by a Jack, or -1 if no suit is enforced
+        multiplier: Point multiplier per round
+        points: (N, 2) player scores
+        round_over: Whether each round has been scored
+        seeds: Python ints seeding each round's next reshuffle
+    """
+
+    def __init__(self, size):
+        if not HAS_NUMPY:
+            raise ImportError("BatchEngine requires numpy (pip install numpy)")
+        self.size = size
+        self.hands = np.zeros((size, 2), dtype=np.uint64)
+        self.deck = np.zeros((size, 52), dtype=np.int64)
+        self.deck_len = np.zeros(size, dtype=np.int64)
+        self.table = np.zeros((size, 52), dtype=np.int64)
+        self.table_len = np.zeros(size, dtype=np.int64)
+        self.current = np.zeros(size, dtype=np.int64)
+        self.draw_cards = np.zeros(size, dtype=np.int64)
+        self.skip_turn = np.zeros(size, dtype=bool)
+        self.requires_six = np.zeros(size, dtype=bool)
+        self.six_chain = np.zeros(size, dtype=np.int64)
+        self.six_owner = np.full(size, -1, dtype=np.int64)
+        self.six_suit = np.full(size, -1, dtype=np.int64)
+        self.enforced_suit = np.full(size, -1, dtype=np.int64)
+        self.multiplier = np.ones(size, dtype=np.int64)
+        self.points = np.zeros((size, 2), dtype=np.int64)
+        self.round_over = np.zeros(size, dtype=bool)
+        self.seeds = [0] * size
+
+    @classmethod
+    def deal(cls, size, seed=None):
+        """
+        Deal size fresh rounds, round i through Game(seed=round_seeds(size,
+        seed)[i]), so each round deals and reshuffles exactly as that game.
+        """
+        games = [Game(headless=True, seed=round_seed) for round_seed in cls.round_seeds(size, seed)]
+        for game in games:
+            game.start_game()
+        return cls.from_states([GameState.from_game(game) for game in games])
+
+    @staticmethod
+    def round_seeds(size, seed=None):
+        """The Game seeds deal(size, seed) uses, one per round"""
+        seed = RandomStream(seed).seed_value
+        return [derive_seed(seed, 'round', i) for i in range(size)]
+
+    @classmethod
+    def from_states(cls, states):
+        """Build a batch from GameState snapshots (hand order is not kept)"""
+        engine = cls(len(states))
+        for i, state in enumerate(states):
+            engine.hands[i] = state.masks
+            engine.deck[i, :len(state.deck)] = state.deck
+            engine.deck_len[i] = len(state.deck)
+            engine.table[i, :len(state.table)] = state.table
+            engine.table_len[i] = len(state.table)
+            engine.current[i] = state.current
+            engine.draw_cards[i] = state.draw_cards
+            engine.skip_turn[i] = state.skip_turn
+            engine.requires_six[i] = state.requires_six
+            engine.six_chain[i] = state.six_chain
+            engine.six_owner[i] = -1 if state.six_owner is None else state.six_owner
+            engine.six_suit[i] = -1 if state.six_suit is None else state.six_suit
+            engine.enforced_suit[i] = -1 if state.enforced_suit is None else state.enforced_suit
+            engine.multiplier[i] = state.multiplier
+            engine.points[i] = state.points
+            engine.round_over[i] = state.round_over
+            engine.seeds[i] = state.seed
+        return engine
+
+    def run(self, max_steps=100000):
+        """Step until every round is over (or max_steps); returns the number of steps"""
+        steps = 0
+        while steps < max_steps and self.step():
+            steps += 1
+        return steps
+
+    def step(self):
+        """
+        Make one move in every unfinished round (see GameState.apply) and
+        return the number of rounds still running.
+        """
+        live = np.flatnonzero(~self.round_over)
+        if not live.size:
+            return 0
+        playable = self._playable(live) & self.hands[live, self.current[live]]
+        stuck = playable == 0
+        self._forced_draw(live[stuck])
+        self._play(live[~stuck], playable[~stuck])
+        return int(np.count_nonzero(~self.round_over))
+
+    def _playable(self, idx):
+        """PLAYABLE_MASKS lookup for the player to move in each round"""
+        length = self.table_len[idx]
+        top = np.where(length > 0, self.table[idx, np.maximum(length - 1, 0)], EMPTY_TABLE)
+        enforced = self.enforced_suit[idx]
+        enforced = np.where(enforced < 0, NOT_ENFORCED, enforced)
+        six_suit = self.six_suit[idx]
+        six = np.where(~self.requires_six[idx], NO_SIX,
+                       np.where(self.six_owner[idx] != self.current[idx], SIX_OPPONENT,
+                                np.where(six_suit < 0, UNKNOWN_SUIT, six_suit)))
+        return _PLAYABLE[(top * ENFORCED_STATES + enforced) * SIX_STATES + six]
+
+    def _draw(self, idx):
+        """
+        Draw one card for the player to move in each round, reshuffling the
+        table into empty decks. Returns (drawn, cards) where drawn marks the
+        rounds that got a card and cards holds their ids.
+        """
+        for i in idx[self.deck_len[idx] == 0]:
+            self._reshuffle(int(i))
+        drawn = self.deck_len[idx] > 0
+        take = idx[drawn]
+        position = self.deck_len[take] - 1
+        cards = np.full(len(idx), -1, dtype=np.int64)
+        cards[drawn] = self.deck[take, position]
+        self.deck_len[take] = position
+        self.hands[take, self.current[take]] |= _BITS[cards[drawn]]
+        return drawn, cards
+
+    def _reshuffle(self, i):
+        # Same stream as Game.reshuffle_table_cards and GameState._reshuffle
+        length = int(self.table_len[i])
+        if length <= 1:
+            return False
+        cards, self.seeds[i] = seeded_shuffle(self.table[i, :length - 1].tolist(), self.seeds[i])
+        self.deck[i, :len(cards)] = cards
+        self.deck_len[i] = len(cards)
+        self.table[i, 0] = self.table[i, length - 1]
+        self.table_len[i] = 1
+        self.multiplier[i] += 1
+        return True
+
+    def _drew_playable(self, idx, drawn, cards):
+        hit = np.zeros(len(idx), dtype=bool)
+        hit[drawn] = (self._playable(idx[drawn]) & _BITS[cards[drawn]]) != 0
+        return hit
+
+    def _forced_draw(self, idx):
+        # draw_until_playable draws a single card
+        plain = idx[~self.requires_six[idx]]
+        drawn, cards = self._draw(plain)
+        failed = [plain[~self._drew_playable(plain, drawn, cards)]]
+
+        # draw_until_six_covered draws up to MAX_SIX_COVER_DRAWS cards
+        pending = idx[self.requires_six[idx]]
+        for _ in range(MAX_SIX_COVER_DRAWS):
+            if not pending.size:
+                break
+            drawn, cards = self._draw(pending)
+            hit = self._drew_playable(pending, drawn, cards)
+            failed.append(pending[~drawn])
+            pending = pending[drawn & ~hit]
+        failed.append(pending)
+        self._end_turn(np.concatenate(failed))
+
+    def _play(self, idx, playable):
+        if not idx.size:
+            return
+        current = self.current[idx]
+        hands = self.hands[idx, current]
+        first = _lowest_card(playable)
+        rank = first % 13  # Rank - 1
+        group = hands & _RANK_MASKS[rank]
+        count = _popcount(group)
+
+        suit = np.full(len(idx), -1, dtype=np.int64)
+        jacks = rank == 10
+        if jacks.any():
+            counts = np.stack([_popcount(hands[jacks] & mask) for mask in _NON_JACK_SUIT_MASKS], axis=1)
+            suit[jacks] = np.where(counts.max(axis=1) > 0, counts.argmax(axis=1), first[jacks] // 13)
+
+        self.hands[idx, current] = hands & ~group
+        position = self.table_len[idx].copy()
+        self.table[idx, position] = first
+        position += 1
+        for s in range(4):
+            card = rank + 13 * s
+            take = ((group & _BITS[card]) != 0) & (card != first)
+            self.table[idx[take], position[take]] = card[take]
+            position += take
+        self.table_len[idx] = position
+
+        self._apply_card_effects(idx, first, rank, count, suit, current)
+        # Only a player covering their own 6 (with cards left) keeps the turn
+        keep = self.requires_six[idx] & (self.six_owner[idx] == current) & (self.hands[idx, current] != 0)
+        self._end_turn(idx[~keep])
+
+    def _apply_card_effects(self, idx, first, rank, count, chosen_suit, current):
+        # Mirrors GameState._apply_card_effects with 0-based ranks
+        first_suit = first // 13
+        lifted = idx[(rank != 10) & (self.enforced_suit[idx] == first_suit)]
+        self.enforced_suit[lifted] = -1
+
+        covered = idx[self.requires_six[idx] & (rank != 5)]
+        self.requires_six[covered] = False
+        self.six_chain[covered] = 0
+        self.six_owner[covered] = -1
+        self.six_suit[covered] = -1
+
+        eights = rank == 7
+        self.draw_cards[idx[eights]] += 2 * count[eights]
+        self.skip_turn[idx[eights | (rank == 0)]] = True
+        sevens = rank == 6
+        self.draw_cards[idx[sevens]] += count[sevens]
+        sixes = rank == 5
+        six_idx = idx[sixes]
+        self.requires_six[six_idx] = True
+        self.six_chain[six_idx] += count[sixes]
+        self.six_owner[six_idx] = current[sixes]
+        self.six_suit[six_idx] = first_suit[sixes]
+        jacks = rank == 10
+        self.enforced_suit[idx[jacks]] = chosen_suit[jacks]
+
+    def _end_turn(self, idx):
+        # Mirrors GameState._end_turn
+        if not idx.size:
+            return
+        idx = idx[~self._check_round_over(idx)]
+        self.current[idx] ^= 1
+
+        need = idx[self.draw_cards[idx] > 0]
+        remaining = self.draw_cards[need]
+        self.draw_cards[need] = 0
+        while need.size:
+            drawn, _ = self._draw(need)
+            remaining = remaining - 1
+            keep = drawn & (remaining > 0)
+            need, remaining = need[keep], remaining[keep]
+
+        skipped = idx[self.skip_turn[idx]]
+        self.skip_turn[skipped] = False
+        self.current[skipped] ^= 1
+
+    def _check_round_over(self, idx):
+        # Mirrors GameState._check_round_over; returns which rounds ended
+        over = np.zeros(len(idx), dtype=bool)
+        for winner in (0, 1):
+            out = (self.hands[idx, winner] == 0) & ~over
+            if not out.any():
+                continue
+            ended = idx[out]
+            loser = winner ^ 1
+            multiplier = self.multiplier[ended]
+            self.points[ended, loser] += _hand_points(self.hands[ended, loser]) * multiplier
+            self.points[ended, winner] -= 20 * self._trailing_jacks(ended) * multiplier
+            over |= out
+
+        empty = ~over & (self.deck_len[idx] == 0)
+        if empty.any():
+            candidates = idx[empty]
+            playable = self._playable(candidates)
+            hands = self.hands[candidates]
+            stuck = ((playable & hands[:, 0]) == 0) & ((playable & hands[:, 1]) == 0)
+            ended = candidates[stuck]
+            multiplier = self.multiplier[ended]
+            self.points[ended, 0] += _hand_points(hands[stuck, 1]) * multiplier
+            self.points[ended, 1] += _hand_points(hands[stuck, 0]) * multiplier
+            over[np.flatnonzero(empty)[stuck]] = True
+
+        self.round_over[idx[over]] = True
+        return over
+
+    def _trailing_jacks(self, idx):
+        count = np.zeros(len(idx), dtype=np.int64)
+        running = np.ones(len(idx), dtype=bool)
+        for back in range(1, 5):
+            position = self.table_len[idx] - back
+            jack = running & (position >= 0) & (self.table[idx, np.maximum(position, 0)] % 13 == 10)
+            count += jack
+            running = jack
+        return count
@@ -1,21 +1,101 @@
+SUITS = ('Hearts', 'Diamonds', 'Clubs', 'Spades')
+SUIT_CODES = ('H', 'D', 'C', 'S')
+RANKS = tuple(range(1, 14))  # 1 = Ace, 11 = Jack, 12 = Queen, 13 = King
+
+# Both the full suit names and the single-letter codes map to the same index
+SUIT_INDEX = {}
+for _index, (_name, _code) in enumerate(zip(SUITS, SUIT_CODES)):
+    SUIT_INDEX[_name] = _index
+    SUIT_INDEX[_code] = _index
+
+RANK_NAMES = {1: "Ace", 11: "Jack", 12: "Queen", 13: "King"}
+
+
+def suit_index(suit):
+    """Return the index (0-3) for a suit name or code, or None if unknown"""
+    return SUIT_INDEX.get(suit)
+
+
+def card_id(rank, suit):
+    """Return the canonical integer (0-51) for a rank and suit index"""
+    return suit * 13 + rank - 1
+
+
 class Card:
-    def __init__(self, rank, suit):
-        self.rank = rank
-        self.suit = suit
+    """
+    A playing card.
+
+    The 52 standard cards are interned: Card(rank, suit) always returns the
+    same instance for a given rank and suit, so equality is identity and
+    creating a card never allocates. Suits may be given as names ('Hearts')
+    or codes ('H'); interned cards always report the full name.
+
+    Attributes:
+        rank: 1-13 (Ace = 1, Jack = 11, Queen = 12, King = 13)
+        suit: Suit name
+        suit_index: Suit as a small int (0-3), or None for non-standard cards
+        id: Canonical encoding 0-51 (suit_index * 13 + rank - 1), or None
+        bit: 1 << id, or 0 for non-standard cards
+    """
+    __slots__ = ('rank', 'suit', 'suit_index', 'id', 'bit')
+
+    def __new__(cls, rank, suit):
+        index = SUIT_INDEX.get(suit)
+        if index is not None and rank in RANKS:
+            return CARDS[card_id(rank, index)]
+        # Non-standard cards (e.g. from tests) are plain, uninterned instances
+        return cls._create(rank, suit, index, None)
+
+    @classmethod
+    def _create(cls, rank, suit, index, cid):
+        card = object.__new__(cls)
+        card.rank = rank
+        card.suit = suit
+        card.suit_index = index
+        card.id = cid
+        card.bit = 0 if cid is None else 1 << cid
+        return card
+
+    def __reduce__(self):
+        # Unpickling and copying resolve back to the interned instance
+        return (Card, (self.rank, self.suit))
+
+    def __repr__(self):
+        return f"Card({self.rank!r}, {self.suit!r})"
 
     def get_card_info(self):
         rank_name = self.get_rank_name()
         return f"{rank_name} of {self.suit}"
-        
+
+    def __str__(self):
+        return self.get_card_info()
+
     def get_rank_name(self):
         """Convert numeric rank to card name"""
-        if self.rank == 1:
-            return "Ace"
-        elif self.rank == 11:
-            return "Jack"
-        elif self.rank == 12:
-            return "Queen"
-        elif self.rank == 13:
-            return "King"
-        else:
-            return str(self.rank)
\ No newline at end of file
+        return RANK_NAMES.get(self.rank, str(self.rank))
+
+
+# The 52 interned cards, indexed by card id
+CARDS = tuple(Card._create(rank, SUITS[suit], suit, card_id(rank, suit))
+              for suit in range(4) for rank in RANKS)
+
+# Bitmask helpers: a set of cards is an int with bit card.id set for each card
+FULL_MASK = (1 << 52) - 1
+SUIT_MASKS = tuple(0x1FFF << (13 * suit) for suit in range(4))
+# Indexed by rank; index 0 is unused
+RANK_MASKS = (0,) + tuple(sum(1 << card_id(rank, suit) for suit in range(4)) for rank in RANKS)
+
+
+def popcount(mask):
+    """Return the number of cards in a card bitmask"""
+    return bin(mask).count('1')
+
+
+def cards_in_mask(mask):
+    """Return the interned cards whose bits are set in mask, in id order"""
+    cards = []
+    while mask:
+        low = mask & -mask
+        cards.append(CARDS[low.bit_length() - 1])
+        mask ^= low
+    return cards
@@ -1,12 +1,101 @@
 import random
-from .card import Card
+from .card import CARDS, RANKS, card_id
+
+# Order of a fresh, unshuffled deck (the interned cards, never copied)
+NEW_DECK_ORDER = tuple(CARDS[card_id(rank, suit)] for rank in RANKS for suit in range(4))
 
 class Deck:
-    def __init__(self):
-        self.cards = [Card(rank, suit) for rank in range(1, 14) for suit in ['Hearts', 'Diamonds', 'Clubs', 'Spades']]
-    
-    def shuffle(self):
-        random.shuffle(self.cards)
+    """
+    The draw pile, with a lazy shuffle.
+
+    shuffle() only marks the cards as unordered; each draw_card() then picks
+    one of the remaining cards at random (one step of a Fisher-Yates
+    shuffle run from the top of the deck). A round that ends after a few
+    dozen draws never orders the rest of the deck.
+
+    Every shuffle takes 32 random bits per card from rng up front, and the
+    pick made with n cards left always uses the same 32 of them. Reading cards
+    finishes the shuffle with the same picks the draws would have made, so
+    it never changes the order cards come out in or what the game's other
+    random choices see. Orders assigned to cards (replays, restored
+    states) are drawn as given, from the end.
+
+    Attributes:
+        cards: The cards in draw order (the last one is drawn next)
+        rng: Source of the shuffle bits (the game's RandomStream, or the global module)
+    """
+
+    def __init__(self, rng=None):
+        self._cards = list(NEW_DECK_ORDER)
+        self._unsettled = 0  # Cards at the bottom whose order is not decided yet
+        self._shuffle_bits = 0
+        self.rng = rng if rng is not None else random  # The game's RandomStream, or the global module
+
+    @property
+    def cards(self):
+        if self._unsettled:
+            self._settle()
+        return self._cards
+
+    @cards.setter
+    def cards(self, cards):
+        self._cards = cards
+        self._unsettled = 0
+
+    def __len__(self):
+        return len(self._cards)
+
+    def reset(self):
+        """Return all 52 cards to the deck in their original order"""
+        self._cards[:] = NEW_DECK_ORDER
+        self._unsettled = 0
+
+    def refill(self, cards, rng=None):
+        """Replace the deck with cards (e.g. the table pile) and shuffle it with rng (see shuffle)"""
+        self._cards[:] = cards
+        self.shuffle(rng)
+
+    def shuffle(self, rng=None):
+        """Mark the cards as unordered, taking the shuffle bits from rng (defaults to the deck's own)"""
+        rng = rng if rng is not None else self.rng
+        self._shuffle_bits = rng.getrandbits(32 * len(self._cards)) if self._cards else 0
+        self._unsettled = len(self._cards)
 
     def draw_card(self):
-        return self.cards.pop() if self.cards else None
\ No newline at end of file
+        cards = self._cards
+        if not cards:
+            return None
+        remaining = self._unsettled
+        if remaining == len(cards):
+            # Pick the top card among the cards not ordered yet
+            last = remaining - 1
+            if last:
+                pick = ((self._shuffle_bits >> (32 * last) & 0xFFFFFFFF) * remaining) >> 32
+                cards[pick], cards[last] = cards[last], cards[pick]
+            self._unsettled = last
+        return cards.pop()
+
+    def _settle(self):
+        # The remaining Fisher-Yates steps, exactly as draw_card would take them
+        _fisher_yates(self._cards, self._shuffle_bits, self._unsettled)
+        self._unsettled = 0
+
+
+def _fisher_yates(cards, bits, count):
+    # Order the first count cards from the top down, 32 bits of bits per pick
+    for last in range(count - 1, 0, -1):
+        pick = ((bits >> (32 * last) & 0xFFFFFFFF) * (last + 1)) >> 32
+        cards[pick], cards[last] = cards[last], cards[pick]
+
+
+def seeded_shuffle(cards, seed):
+    """
+    Shuffle a copy of cards as Deck.refill(cards, random.Random(seed)) orders
+    them. Returns the list and the seed for the next shuffle (the stream's
+    next 64 bits), so a chain of reshuffles is fixed by its first seed:
+    Game, GameState and BatchEngine all reshuffle this way.
+    """
+    rng = random.Random(seed)
+    cards = list(cards)
+    _fisher_yates(cards, rng.getrandbits(32 * len(cards)) if cards else 0, len(cards))
+    return cards, rng.getrandbits(64)
@@ -0,0 +1,148 @@
+"""
+Pending card effects of a game.
+
+PendingEffects holds what the last plays left for the next turns in fixed
+slots, and changes them only through named transitions: draw stacking
+(7s and 8s), skips (Aces and 8s), the six chain and Jack suit enforcement.
+The player who must cover the 6 is stored as a seat number rather than a
+Player, so effects copy and serialize as plain values.
+
+Game.pending_effects is an EffectsView over a game's PendingEffects: the
+dict interface the game used to have, with the same keys, including
+'six_player' as a Player. Existing readers such as the GUI info panel keep
+working through it; the game itself uses the slots directly.
+"""
+from collections.abc import MutableMapping
+
+
+class PendingEffects:
+    """
+    Effects waiting to be applied or covered.
+
+    Attributes:
+        draw_cards: Cards the next player must draw (7s and 8s stack)
+        skip_turn: Whether the next player skips their turn
+        requires_six: Whether a 6 on the table must be covered
+        six_chain: Number of 6s played in the current chain
+        six_owner: Seat of the player who must cover the 6, or None
+        six_suit: Suit code of the most recent 6, or None
+        chosen_suit: Suit code chosen with a Jack, or None
+        suit_enforced: Whether chosen_suit must be followed
+        computer_choosing_suit: Visual indicator flag for the GUI
+    """
+    __slots__ = ('draw_cards', 'skip_turn', 'requires_six', 'six_chain', 'six_owner',
+                 'six_suit', 'chosen_suit', 'suit_enforced', 'computer_choosing_suit')
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Clear every effect (start of a round)"""
+        self.draw_cards = 0
+        self.skip_turn = False
+        self.requires_six = False
+        self.six_chain = 0
+        self.six_owner = None
+        self.six_suit = None
+        self.chosen_suit = None
+        self.suit_enforced = False
+        self.computer_choosing_suit = False
+
+    def copy(self):
+        new = object.__new__(PendingEffects)
+        for name in self.__slots__:
+            setattr(new, name, getattr(self, name))
+        return new
+
+    def __eq__(self, other):
+        if not isinstance(other, PendingEffects):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self):
+        fields = ', '.join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"PendingEffects({fields})"
+
+    # Transitions
+
+    def add_draw(self, count, skip=False):
+        """Stack count more cards for the next player to draw (and a skip for 8s)"""
+        self.draw_cards += count
+        if skip:
+            self.skip_turn = True
+
+    def add_skip(self):
+        self.skip_turn = True
+
+    def take_draw(self):
+        """Return the stacked draw count and clear it"""
+        count = self.draw_cards
+        self.draw_cards = 0
+        return count
+
+    def take_skip(self):
+        """Return whether a skip is pending and clear it"""
+        skip = self.skip_turn
+        self.skip_turn = False
+        return skip
+
+    def play_six(self, seat, suit, count=1):
+        """Extend the six chain: seat must now cover its 6s"""
+        self.requires_six = True
+        self.six_chain += count
+        self.six_owner = seat
+        self.six_suit = suit
+
+    def cover_six(self):
+        """End the six chain"""
+        self.requires_six = False
+        self.six_chain = 0
+        self.six_owner = None
+        self.six_suit = None
+
+    def enforce_suit(self, suit):
+        """Require suit after a Jack"""
+        self.suit_enforced = True
+        self.chosen_suit = suit
+
+    def release_suit(self):
+        """End Jack suit enforcement"""
+        self.suit_enforced = False
+        self.chosen_suit = None
+
+
+class EffectsView(MutableMapping):
+    """The dict-style Game.pending_effects over a game's PendingEffects"""
+    __slots__ = ('_game',)
+
+    def __init__(self, game):
+        self._game = game
+
+    def __getitem__(self, key):
+        effects = self._game.effects
+        if key == 'six_player':
+            seat = effects.six_owner
+            return None if seat is None else self._game.players[seat]
+        if key not in PendingEffects.__slots__:
+            raise KeyError(key)
+        return getattr(effects, key)
+
+    def __setitem__(self, key, value):
+        effects = self._game.effects
+        if key == 'six_player':
+            effects.six_owner = next((seat for seat, player in enumerate(self._game.players)
+                                      if player is value), None)
+        elif key in PendingEffects.__slots__:
+            setattr(effects, key, value)
+        else:
+            raise KeyError(key)
+
+    def __delitem__(self, key):
+        raise TypeError("Pending effects cannot be deleted")
+
+    def __iter__(self):
+        for name in PendingEffects.__slots__:
+            yield 'six_player' if name == 'six_owner' else name
+
+    def __len__(self):
+        return len(PendingEffects.__slots__)
@@ -0,0 +1,140 @@
+"""
+Exact solver for the endgame, once the deck is empty.
+
+With no cards left to draw, the opponent's hand is exactly the cards that
+are neither in your hand nor on the table, so the rest of the round is a
+perfect-information game. The solver runs a memoized negamax over
+GameState, sharing a TranspositionTable keyed by the Zobrist hash, and
+scores each line by the round points it leads to: the loser's hand points
+(Player.calculate_hand_points) times the point multiplier, less the Jack
+bonus, or both hands on a deadlock (see Game.check_round_over). A value is
+the opponent's points gain minus your own, so higher is better for the
+player to move.
+
+A forced draw from the empty deck reshuffles the table when it has more
+than one card, which turns the round random again. Such lines are scored
+with a static estimate (the difference in hand points before the draw,
+at the new multiplier), so the solver is exact whenever the round can
+finish without a reshuffle. The cards drawn after a reshuffle depend on
+the buried table cards, which are not part of the key, so the estimate
+leaves them out.
+
+Positions are keyed by the Zobrist hash, whether the table can be
+reshuffled, and the run of Jacks on top of the table (it scores the Jack
+bonus). A position repeating on the current line (players passing in
+turn) is cut off with the same estimate. A value that went through such a
+cut-off depends on the line it was searched from, so it is not stored.
+
+The search is exponential in the cards held: a dozen cards between the
+two hands solve in milliseconds, twenty can take minutes. solve() takes
+an optional deadline and raises SolverTimeout when it passes it, keeping
+the positions solved so far in the table.
+"""
+import time
+
+from .movegen import legal_moves
+from .state import hand_points
+from .transposition import TranspositionTable, EXACT
+from .zobrist import RESHUFFLE_KEY, TRAILING_JACKS_KEYS
+
+# Nodes searched between two looks at the clock
+DEADLINE_CHECK_NODES = 256
+
+
+class SolverTimeout(Exception):
+    """The endgame search ran past its deadline"""
+
+
+class EndgameSolver:
+    """
+    Memoized negamax over empty-deck GameStates.
+
+    Attributes:
+        table: TranspositionTable of solved positions (can be shared)
+        nodes: Positions searched so far
+        seconds: Time spent searching so far
+    """
+
+    def __init__(self, table=None):
+        self.table = table if table is not None else TranspositionTable(1 << 18)
+        self.nodes = 0
+        self.seconds = 0.0
+        self._path = set()
+        self._deadline = None
+
+    @property
+    def nodes_per_second(self):
+        return self.nodes / self.seconds if self.seconds > 0 else 0.0
+
+    def solve(self, state, deadline=None):
+        """
+        Return (value, move) for the player to move: the best move and the
+        points it gains over the opponent with perfect play from both sides.
+        Raises SolverTimeout if time.perf_counter() passes deadline first.
+        """
+        if state.deck:
+            raise ValueError("The endgame solver needs an empty deck")
+        if state.round_over:
+            raise ValueError("The round is over")
+        start = time.perf_counter()
+        self._path.clear()
+        self._deadline = deadline
+        try:
+            value, move, _ = self._search(state)
+            return value, move
+        finally:
+            self.seconds += time.perf_counter() - start
+
+    def best_move(self, state, deadline=None):
+        """Return the best move for the player to move (see solve)"""
+        return self.solve(state, deadline)[1]
+
+    @staticmethod
+    def _key(state):
+        # The Jack run and whether the table can be reshuffled change the
+        # outcome but are not part of the Zobrist hash
+        return (state.zobrist_hash() ^ TRAILING_JACKS_KEYS[state.trailing_jacks]
+                ^ (RESHUFFLE_KEY if len(state.table) > 1 else 0))
+
+    def _search(self, state):
+        """Return (value, move, exact); exact is False if a repetition cut-off went into the value"""
+        self.nodes += 1
+        if (self._deadline is not None and not self.nodes % DEADLINE_CHECK_NODES
+                and time.perf_counter() > self._deadline):
+            raise SolverTimeout()
+        key = self._key(state)
+        entry = self.table.get(key)
+        if entry is not None:
+            return entry.value, entry.move, True
+        player = state.current
+        if key in self._path:
+            # A position repeating on the current line (players passing in turn)
+            return self._estimate(state, player, state.multiplier), None, False
+
+        self._path.add(key)
+        best_value = best_move = None
+        exact = True
+        for move in legal_moves(state):
+            child = state.apply(move)
+            if child.round_over:
+                opponent = player ^ 1
+                value = ((child.points[opponent] - state.points[opponent])
+                         - (child.points[player] - state.points[player]))
+            elif child.multiplier != state.multiplier:
+                value = self._estimate(state, player, child.multiplier)
+            else:
+                value, _, child_exact = self._search(child)
+                exact = exact and child_exact
+                if child.current != player:
+                    value = -value
+            if best_value is None or value > best_value:
+                best_value, best_move = value, move
+        self._path.discard(key)
+
+        if exact:
+            self.table.put(key, best_value, flag=EXACT, move=best_move)
+        return best_value, best_move, exact
+
+    @staticmethod
+    def _estimate(state, player, multiplier):
+        return (hand_points(state.hands[player ^ 1]) - hand_points(state.hands[player])) * multiplier
@@ -0,0 +1,212 @@
+"""
+Compact binary event log of a game, and a replayer.
+
+Set game.recorder = EventLog() (or EventLog(file) to append straight to an
+open binary file) and every state change of the game is appended as a few
+bytes. Each event starts with one byte holding the event type in the low
+four bits, the seat in bit 4 and a flag in bit 5:
+
+    GAME_START  8-byte game seed
+    DEAL        52 card ids, the deck order before dealing
+    PLAY        1 byte (card count << 3 | suit index, 4 for no suit),
+                then one byte per hand index passed to play_cards; the
+                flag marks a play laid in the order of the indices
+    DRAW        card id; the flag marks the optional draw
+    TURN        (seat only); the flag marks a Game.next_turn turn change,
+                which also clears the turn's draw and skip effects
+    RESHUFFLE   card count, then the new deck order
+    ROUND_END   two signed 16-bit scores
+    GAME_END    -
+
+No Python objects are pickled; a typical turn takes 2 to 5 bytes.
+
+replay(data) rebuilds the Game from a log without running any player
+logic: plays go through Game.play_cards, draws take the recorded card and
+everything else is set directly, so replaying is far faster than playing.
+Pass stop to rebuild the position after a given number of events.
+"""
+import struct
+from collections import namedtuple
+
+from .card import CARDS, SUIT_CODES, SUIT_INDEX
+from .deck import Deck
+from .game import Game
+from .player import Player
+
+GAME_START = 0
+DEAL = 1
+PLAY = 2
+DRAW = 3
+TURN = 4
+RESHUFFLE = 5
+ROUND_END = 6
+GAME_END = 7
+
+_SEAT_BIT = 0x10
+_FLAG_BIT = 0x20
+_NO_SUIT = 4
+
+_SEED = struct.Struct('>Q')
+_SCORES = struct.Struct('>hh')
+
+# One decoded event. data depends on the kind: the seed, a tuple of card
+# ids, (indices, suit code), a card id, or a pair of scores.
+Event = namedtuple('Event', ['kind', 'seat', 'flag', 'data'])
+
+
+class EventLog:
+    """
+    Append-only binary recorder for a Game (assign it to game.recorder).
+
+    Attributes:
+        file: Binary file events are written to, or None to keep them in memory
+        events: Number of events recorded
+    """
+
+    def __init__(self, file=None):
+        self.file = file
+        self.events = 0
+        self._buffer = bytearray()
+
+    def _append(self, kind, payload=b'', seat=0, flag=False):
+        header = kind | (_SEAT_BIT if seat else 0) | (_FLAG_BIT if flag else 0)
+        self.events += 1
+        if self.file is not None:
+            self.file.write(bytes((header,)) + payload)
+        else:
+            self._buffer.append(header)
+            self._buffer += payload
+
+    def to_bytes(self):
+        """Return the log recorded in memory"""
+        return bytes(self._buffer)
+
+    def game_start(self, seed):
+        self._append(GAME_START, _SEED.pack(seed & 0xFFFFFFFFFFFFFFFF))
+
+    def deal(self, card_ids):
+        self._append(DEAL, bytes(card_ids))
+
+    def play(self, seat, indices, chosen_suit, in_order=False):
+        suit = SUIT_INDEX.get(chosen_suit, _NO_SUIT) if chosen_suit else _NO_SUIT
+        self._append(PLAY, bytes((len(indices) << 3 | suit,)) + bytes(indices), seat, in_order)
+
+    def draw(self, seat, card_id, optional=False):
+        self._append(DRAW, bytes((card_id,)), seat, optional)
+
+    def turn(self, seat, reset=True):
+        self._append(TURN, b'', seat, reset)
+
+    def reshuffle(self, card_ids):
+        self._append(RESHUFFLE, bytes((len(card_ids),)) + bytes(card_ids))
+
+    def round_end(self, scores):
+        self._append(ROUND_END, _SCORES.pack(*scores))
+
+    def game_end(self):
+        self._append(GAME_END)
+
+
+def read_events(data):
+    """Decode a log into a sequence of Events"""
+    position = 0
+    end = len(data)
+    while position < end:
+        header = data[position]
+        kind = header & 0x0F
+        seat = 1 if header & _SEAT_BIT else 0
+        flag = bool(header & _FLAG_BIT)
+        position += 1
+        if kind == PLAY:
+            packed = data[position]
+            count = packed >> 3
+            suit = packed & 7
+            indices = tuple(data[position + 1:position + 1 + count])
+            payload = (indices, SUIT_CODES[suit] if suit != _NO_SUIT else None)
+            position += 1 + count
+        elif kind == DRAW:
+            payload = data[position]
+            position += 1
+        elif kind == TURN or kind == GAME_END:
+            payload = None
+        elif kind == DEAL:
+            payload = tuple(data[position:position + 52])
+            position += 52
+        elif kind == RESHUFFLE:
+            count = data[position]
+            payload = tuple(data[position + 1:position + 1 + count])
+            position += 1 + count
+        elif kind == ROUND_END:
+            payload = _SCORES.unpack_from(data, position)
+            position += _SCORES.size
+        elif kind == GAME_START:
+            payload = _SEED.unpack_from(data, position)[0]
+            position += _SEED.size
+        else:
+            raise ValueError(f"Unknown event type {kind} at byte {position - 1}")
+        yield Event(kind, seat, flag, payload)
+
+
+def replay(data, stop=None):
+    """
+    Rebuild the headless Game described by a log, applying the first stop
+    events (all of them by default).
+    """
+    game = Game(headless=True)
+    game.players = [Player("Player"), Player("Computer")]
+    game.deck = Deck(game.rng)
+    for count, event in enumerate(read_events(data)):
+        if stop is not None and count >= stop:
+            break
+        apply_event(game, event)
+    return game
+
+
+def apply_event(game, event):
+    """Apply one decoded event to a Game"""
+    kind = event.kind
+    if kind == PLAY:
+        indices, suit = event.data
+        if not game.play_cards(game.players[event.seat], list(indices), suit, in_order=event.flag):
+            raise ValueError(f"Recorded play {indices} is not legal in the replayed game")
+    elif kind == DRAW:
+        card = CARDS[event.data]
+        cards = game.deck.cards
+        if cards and cards[-1] is card:
+            cards.pop()
+        else:
+            cards.remove(card)
+        game.players[event.seat].add_card(card)
+        if event.flag:
+            game.optional_draw_used = True
+    elif kind == TURN:
+        game.current_player_index = event.seat
+        game.is_human_turn = event.seat == 0
+        if event.flag:
+            game.optional_draw_used = False
+            game.effects.draw_cards = 0
+            game.effects.skip_turn = False
+    elif kind == DEAL:
+        if game.round_over:
+            game.round_number += 1
+        game._reset_round()
+        game.deck.cards = [CARDS[card_id] for card_id in event.data]
+        for player in game.players:
+            player.hand.clear()
+        game._deal_initial_cards()
+    elif kind == RESHUFFLE:
+        game.table_cards = game.table_cards[-1:]
+        game.deck.cards = [CARDS[card_id] for card_id in event.data]
+        game.point_multiplier += 1
+    elif kind == ROUND_END:
+        for player, score in zip(game.players, event.data):
+            player.points = score
+        game.round_over = True
+    elif kind == GAME_START:
+        game.seed = event.data
+        game.is_running = True
+        game.round_number = 1
+        for player in game.players:
+            player.points = 0
+    elif kind == GAME_END:
+        game.is_running = False
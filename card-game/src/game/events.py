@@ -0,0 +1,122 @@
+"""
+Structured event bus for game messages.
+
+Instead of printing, the game publishes Messages: a template, its fields,
+a level and a source. Subscribers decide what to do with them, and the
+text is only formatted when a subscriber asks for message.text. With no
+subscriber at or below a message's level, publish() returns immediately,
+so headless games pay almost nothing for their messages.
+
+bus is the shared bus of the interactive game. It starts with stdout
+(print_message) subscribed, and the GUI message log subscribes to it as
+well; either can be unsubscribed. Headless games get a private bus with
+no subscribers.
+"""
+import datetime
+import time
+from collections import deque
+
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+
+
+class Message:
+    """
+    One published event.
+
+    Attributes:
+        template: str.format template of the text (or the text itself)
+        fields: Values for the template
+        level: DEBUG, INFO, WARNING or ERROR
+        source: Who published it ('game', 'gui', ...)
+        time: time.time() when it was published
+    """
+    __slots__ = ('template', 'fields', 'level', 'source', 'time')
+
+    def __init__(self, template, fields, level=INFO, source=None):
+        self.template = template
+        self.fields = fields
+        self.level = level
+        self.source = source
+        self.time = time.time()
+
+    @property
+    def text(self):
+        """The formatted message (formatted on each access; subscribers keep what they need)"""
+        return self.template.format(**self.fields) if self.fields else self.template
+
+    def __repr__(self):
+        return f"Message({self.text!r}, level={self.level}, source={self.source!r})"
+
+
+class EventBus:
+    """Delivers published Messages to subscribers filtered by level"""
+
+    def __init__(self):
+        self._subscribers = []
+        self._min_level = None
+
+    @property
+    def active(self):
+        return bool(self._subscribers)
+
+    def subscribe(self, callback, level=INFO):
+        """Call callback(message) for every message at or above level; returns callback"""
+        self._subscribers.append((callback, level))
+        self._update_min_level()
+        return callback
+
+    def unsubscribe(self, callback):
+        """Stop delivering messages to callback"""
+        self._subscribers = [(subscriber, level) for subscriber, level in self._subscribers
+                             if subscriber != callback]
+        self._update_min_level()
+
+    def _update_min_level(self):
+        self._min_level = min((level for _, level in self._subscribers), default=None)
+
+    def publish(self, template, level=INFO, source=None, **fields):
+        """Publish a message; nothing is built unless some subscriber wants this level"""
+        if self._min_level is None or level < self._min_level:
+            return
+        message = Message(template, fields, level, source)
+        for callback, min_level in self._subscribers:
+            if level >= min_level:
+                callback(message)
+
+
+def print_message(message):
+    """Subscriber that writes messages to stdout"""
+    print(message.text)
+
+
+class MessageLog:
+    """
+    Subscriber keeping the most recent messages as timestamped text.
+
+    Attributes:
+        entries: deque of "[HH:MM:SS] text" strings, oldest first
+        version: Incremented on every change, so readers can tell the log changed
+        appended: Messages added since the log was created (clear() keeps it)
+    """
+
+    def __init__(self, max_messages=50):
+        self.entries = deque(maxlen=max_messages)
+        self.version = 0
+        self.appended = 0
+
+    def __call__(self, message):
+        timestamp = datetime.datetime.fromtimestamp(message.time).strftime("%H:%M:%S")
+        self.entries.append(f"[{timestamp}] {message.text}")
+        self.version += 1
+        self.appended += 1
+
+    def clear(self):
+        self.entries.clear()
+        self.version += 1
+
+
+bus = EventBus()
+bus.subscribe(print_message)
@@ -1,53 +1,84 @@
+from .card import SUIT_CODES, SUIT_INDEX
+from .rules import (PLAYABLE_MASKS, rule_key, EMPTY_TABLE, NONSTANDARD_TOP,
+                    UNKNOWN_SUIT, NOT_ENFORCED, SIX_OPPONENT, NO_SIX)
 from .deck import Deck
 from .player import Player
-import sys
+from .table import Table
+from .rng import RandomStream, derive_seed
+from .effects import PendingEffects, EffectsView
+from . import events
 import random
-
-def display_message(message):
-    """Display a message to the user."""
-    print(message)
+import sys
 
 class Game:
-    def __init__(self):
+    def __init__(self, headless=False, seed=None, event_bus=None):
+        self.headless = headless  # No console output or computer autoplay (batch simulation)
+        # Messages go to event_bus; by default the shared bus (stdout and the GUI log),
+        # or a private bus with no subscribers when headless
+        if event_bus is None:
+            event_bus = events.EventBus() if headless else events.bus
+        self.events = event_bus
+        self.rng = RandomStream(seed)  # All of this game's randomness; the same seed replays the same game
+        self.seed = self.rng.seed_value
+        # Reshuffles have a stream of their own, shared with GameState and BatchEngine
+        self.reshuffle_seed = derive_seed(self.seed, 'reshuffle')
         self.players = []
         self.deck = None
         self.is_running = False
         self.current_player_index = 0
-        self.table_cards = []  # Cards placed on the table
+        self.table_cards = []  # Cards placed on the table (a Table, which tracks the Jacks on top)
         self.is_human_turn = True  # True for human player, False for computer
         self.must_draw = False  # Flag to indicate when the human player must draw
         self.optional_draw_used = False  # Flag to track if the player has used their optional draw
         self.point_multiplier = 1  # Point multiplier increases with each reshuffle
         self.round_number = 1  # Track the current round number
         self.round_end_message = None  # Message to display when a round ends
+        self.round_over = False  # Set once the current round has been scored
+        self.computer_strategy = None  # Optional player with play_turn(game, player) replacing computer_turn's heuristic
+        self.recorder = None  # Optional EventLog that records every deal, play, draw, turn and round end
         
         # Callback for notifying GUI of player effects
         self.on_player_effect_callback = None
 
-        self.pending_effects = {
-            'draw_cards': 0,     # Number of cards to draw (for 8s and 7s)
-            'skip_turn': False,  # Whether the next player should skip a turn (for Aces and 8s)
-            'requires_six': False,  # Whether the next card must be a 6 or suit match
-            'six_chain': 0,      # Track how many 6s have been played in sequence
-            'six_player': None,   # Track which player played the 6 (to enforce same-player rule)
-            'six_suit': None,    # Track the suit of the most recent 6 that needs to be covered
-            'chosen_suit': None,  # Track the suit chosen after a Jack is played
-            'suit_enforced': False,  # Flag to indicate if a specific suit is being enforced
-            'computer_choosing_suit': False  # Flag for visual indicator when computer chooses suit
-        }
+        # Draws and skips for the next player, the six chain and Jack suit enforcement
+        self.effects = PendingEffects()
+
+    @property
+    def table_cards(self):
+        """The cards on the table as a list, backed by a Table"""
+        return self._table_cards
+
+    @table_cards.setter
+    def table_cards(self, cards):
+        self._table_cards = cards if isinstance(cards, Table) else Table(cards)
+
+    @property
+    def pending_effects(self):
+        """Dict-style view of self.effects (with 'six_player' as a Player)"""
+        return EffectsView(self)
+
+    @pending_effects.setter
+    def pending_effects(self, values):
+        self.effects.reset()
+        EffectsView(self).update(values)
 
     def create_deck(self):
         """Create and return a shuffled deck"""
-        deck = Deck()
+        deck = Deck(self.rng)
         deck.shuffle()
         return deck
 
+    def _message(self, template, level=events.INFO, **fields):
+        """Publish a game event; it is only formatted if a subscriber reads its text."""
+        self.events.publish(template, level, 'game', **fields)
+
     def start_game(self):
         """Start the game with human vs computer"""
         self.is_running = True
+        self.round_over = False
         self.current_player_index = 0
         self.is_human_turn = True
-        if not self.deck:
+        if self.deck is None:
             self.deck = self.create_deck()
         
         # Make sure we have exactly 2 players: human and computer
@@ -55,12 +86,33 @@ class Game:
             Player("Player"),  # Human player
             Player("Computer")  # Computer player
         ]
+        if self.recorder:
+            self.recorder.game_start(self.seed)
         
         self._deal_initial_cards()
 
     def start_new_round(self):
         """Start a new round of the game"""
         self.round_number += 1
+        self._reset_round()
+        
+        # Reuse the existing deck (cards are interned, nothing is allocated)
+        if self.deck is not None:
+            self.deck.reset()
+            self.deck.shuffle()
+        else:
+            self.deck = self.create_deck()
+        
+        # Clear players' hands but keep their points
+        for player in self.players:
+            player.hand.clear()
+        
+        # Deal cards for the new round
+        self._deal_initial_cards()
+
+    def _reset_round(self):
+        """Reset the table, turn and pending effects for a new round"""
+        self.round_over = False
         self.table_cards = []
         self.is_human_turn = True
         self.current_player_index = 0
@@ -69,63 +121,51 @@ class Game:
         self.point_multiplier = 1
         
         # Reset all pending effects
-        self.pending_effects = {
-            'draw_cards': 0,
-            'skip_turn': False,
-            'requires_six': False,
-            'six_chain': 0,
-            'six_player': None,
-            'six_suit': None,
-            'chosen_suit': None,
-            'suit_enforced': False,
-            'computer_choosing_suit': False
-        }
-        
-        # Create a fresh deck
-        self.deck = self.create_deck()
-        
-        # Clear players' hands but keep their points
-        for player in self.players:
-            player.hand = []
-        
-        # Deal cards for the new round
-        self._deal_initial_cards()
+        self.effects.reset()
         
-        display_message(f"\nRound {self.round_number} starts!")
+        self._message("\nRound {round_number} starts!", round_number=self.round_number)
 
     def _deal_initial_cards(self):
         """Deal initial cards to all players"""
+        if self.recorder:
+            self.recorder.deal([card.id for card in self.deck.cards])
         for _ in range(5):  # Deal 5 cards to each player
             for player in self.players:
                 card = self.deck.draw_card()
                 if card:
                     player.add_card(card)
     
-    def play_cards(self, player, card_indices, chosen_suit=None):
-        """Place multiple cards of the same rank from the player's hand onto the table"""
+    def play_cards(self, player, card_indices, chosen_suit=None, in_order=False):
+        """
+        Place multiple cards of the same rank from the player's hand onto the table.
+        
+        The cards land highest hand index first, or in the order of card_indices
+        if in_order is set (the first must then be playable, the last ends on top).
+        """
         if not card_indices or not all(0 <= idx < len(player.hand) for idx in card_indices):
             return None
         
         # Get all cards but don't remove them yet
-        cards_to_play = [player.hand[idx] for idx in sorted(card_indices, reverse=True)]
+        landing_order = list(card_indices) if in_order else sorted(card_indices, reverse=True)
+        cards_to_play = [player.hand[idx] for idx in landing_order]
         
         # Check if all cards have the same rank
         first_rank = cards_to_play[0].rank
         if not all(card.rank == first_rank for card in cards_to_play):
-            display_message("All cards played together must be of the same rank")
+            self._message("All cards played together must be of the same rank", events.WARNING)
             return None
         
         # Check if the first card can be played according to the rules
         if self.can_play_card(cards_to_play[0]):
-            # Remove and play all cards (in reverse order to keep indices valid)
-            played_cards = []
+            # Remove the cards (in reverse order to keep indices valid) and play them
             for idx in sorted(card_indices, reverse=True):
-                played_card = player.hand.pop(idx)
+                player.hand.pop(idx)
+            played_cards = cards_to_play
+            for played_card in played_cards:
                 self.table_cards.append(played_card)
-                played_cards.append(played_card)
             
             # Display the play
-            display_message(f"{player.name} played {len(played_cards)} cards of rank {first_rank}")
+            self._message("{name} played {count} cards of rank {rank}", name=player.name, count=len(played_cards), rank=first_rank)
             
             # Apply card effects based on the rank of the played cards (multiplied by count)
             # For Jacks, pass the chosen suit
@@ -136,6 +176,8 @@ class Game:
                 player.hand.extend(played_cards)
                 return None
             
+            if self.recorder:
+                self.recorder.play(self.players.index(player), card_indices, chosen_suit, in_order)
             return played_cards
         return None
     
@@ -150,62 +192,54 @@ class Game:
         
     def apply_card_effects(self, card, player, count=1, chosen_suit=None):
         """Apply special effects based on the card(s) that were just played"""
+        effects = self.effects
         # Handle suit enforcement reset logic
         if card.rank == 11:  # New Jack played
             # Will set new suit enforcement below
             pass
-        elif self.pending_effects['suit_enforced'] and self.pending_effects['chosen_suit']:
+        elif effects.suit_enforced and effects.chosen_suit:
             # If a non-Jack card is played and matches the enforced suit, reset enforcement
-            if card.suit == self.pending_effects['chosen_suit']:
-                self.pending_effects['suit_enforced'] = False
-                self.pending_effects['chosen_suit'] = None
-                display_message(f"Suit enforcement ended - {player.name} played a matching card")
+            if card.suit_index == SUIT_INDEX.get(effects.chosen_suit):
+                effects.release_suit()
+                self._message("Suit enforcement ended - {name} played a matching card", name=player.name)
         
         # Reset six chain if a non-six card was played
-        if self.pending_effects['requires_six'] and card.rank != 6:
+        if effects.requires_six and card.rank != 6:
             # Only the same player can play a non-6 card, and it must match suit
-            if player == self.pending_effects['six_player']:
-                self.pending_effects['requires_six'] = False
-                self.pending_effects['six_chain'] = 0
-                self.pending_effects['six_player'] = None
-                self.pending_effects['six_suit'] = None
+            if effects.six_owner is not None and self.players.index(player) == effects.six_owner:
+                effects.cover_six()
             else:
                 # Different player cannot play on a 6 with anything other than continuing their own turn
-                self.pending_effects['draw_cards'] += 1
-                display_message(f"{player.name} cannot play on opponent's 6 - Must draw a card")
+                effects.add_draw(1)
+                self._message("{name} cannot play on opponent's 6 - Must draw a card", name=player.name)
                 return False
         
         # Apply effects based on card rank (multiplied by the number of cards played)
         if card.rank == 8:
             # Multiple 8s: Next player draws 2 cards per 8 and skips turn
-            self.pending_effects['draw_cards'] += 2 * count
-            self.pending_effects['skip_turn'] = True
-            display_message(f"Effect: {player.name} played {count} 8s - Next player must draw {2 * count} cards and skip their turn")
+            effects.add_draw(2 * count, skip=True)
+            self._message("Effect: {name} played {count} 8s - Next player must draw {draw_count} cards and skip their turn", name=player.name, count=count, draw_count=2 * count)
             
         elif card.rank == 7:
             # Multiple 7s: Next player draws 1 card per 7
-            self.pending_effects['draw_cards'] += count
-            display_message(f"Effect: {player.name} played {count} 7s - Next player must draw {count} cards")
+            effects.add_draw(count)
+            self._message("Effect: {name} played {count} 7s - Next player must draw {count} cards", name=player.name, count=count)
             
         elif card.rank == 1:  # Ace
             # Multiple Aces: Next player skips turn and next player plays
-            self.pending_effects['skip_turn'] = True
-            display_message(f"Effect: {player.name} played {count} Aces - Next player skips their turn")
+            effects.add_skip()
+            self._message("Effect: {name} played {count} Aces - Next player skips their turn", name=player.name, count=count)
             
         elif card.rank == 6:
             # Multiple 6s: Must be covered by matching number of 6s or same suit cards from the SAME player during SAME turn
-            self.pending_effects['requires_six'] = True
-            self.pending_effects['six_chain'] += count
-            self.pending_effects['six_player'] = player
-            self.pending_effects['six_suit'] = card.suit  # Track the suit of the most recent 6
-            display_message(f"Effect: {player.name} played {count} 6s - Only they can cover them during their turn with same suit cards or more 6s")
+            effects.play_six(self.players.index(player), card.suit, count)  # Track the suit of the most recent 6
+            self._message("Effect: {name} played {count} 6s - Only they can cover them during their turn with same suit cards or more 6s", name=player.name, count=count)
             
         elif card.rank == 11:  # Jack
             # For Jack, player can choose the next suit
-            self.pending_effects['suit_enforced'] = True
-            self.pending_effects['chosen_suit'] = chosen_suit if chosen_suit else card.suit
-            suit_name = self.get_suit_name(self.pending_effects['chosen_suit'])
-            display_message(f"Effect: {player.name} played a Jack and chose {suit_name} as the next suit")
+            effects.enforce_suit(chosen_suit if chosen_suit else card.suit)
+            suit_name = self.get_suit_name(effects.chosen_suit)
+            self._message("Effect: {name} played a Jack and chose {suit} as the next suit", name=player.name, suit=suit_name)
             
         return True
         
@@ -219,17 +253,25 @@ class Game:
         }
         return suit_names.get(suit, suit)
         
-    def computer_turn(self):
-        """Handle the computer's turn - find valid cards to play with enhanced strategy"""
-        computer_player = self.players[1]  # Computer is always second player
+    def computer_turn(self, player=None):
+        """
+        Handle the computer's turn - find valid cards to play with enhanced strategy
+
+        Args:
+            player: Player to move with this strategy (defaults to the computer, always second player)
+        """
+        computer_player = self.players[1] if player is None else player
+        if self.computer_strategy is not None:
+            return self.computer_strategy.play_turn(self, computer_player)
         
         # Track if this is a continuation of the computer's turn due to playing a 6
         played_any_card = False
         
+        seat = self.players.index(computer_player)
         while computer_player.hand:
             # Check if computer must cover its own 6 from a previous play in this same turn
-            if self.pending_effects['requires_six'] and self.pending_effects['six_player'] == computer_player:
-                display_message("Computer must cover its 6 with a same suit card or another 6")
+            if self.effects.requires_six and self.effects.six_owner == seat:
+                self._message("Computer must cover its 6 with a same suit card or another 6")
                 # Computer MUST play a valid card to cover the 6
                 
                 # Look for covering cards: same suit as the top card or another 6
@@ -253,79 +295,76 @@ class Game:
                             break
                 else:
                     # Computer has no valid covering card - this shouldn't happen if game rules are followed
-                    display_message("ERROR: Computer cannot cover its 6! This violates game rules.")
+                    self._message("ERROR: Computer cannot cover its 6! This violates game rules.", events.ERROR)
                     break
             else:
                 # Normal turn logic
                 # First check if computer has any valid card to play
-                has_valid_card = False
-                for card in computer_player.hand:
-                    if self.can_play_card(card):
-                        has_valid_card = True
-                        break
+                has_valid_card = self.has_valid_play(computer_player)
                         
                 # If no valid card, draw until a playable card is found
                 if not has_valid_card:
-                    display_message("Computer has no valid cards to play - drawing from deck...")
+                    self._message("Computer has no valid cards to play - drawing from deck...")
                     # Check if we're in a 6-covering scenario
-                    if self.pending_effects['requires_six']:
+                    if self.effects.requires_six:
                         success = self.draw_until_six_covered(computer_player)
                     else:
                         success = self.draw_until_playable(computer_player)
                     
                     if not success:
                         # No playable card found and deck is empty, skip turn
-                        display_message("Computer couldn't find a playable card after drawing")
+                        self._message("Computer couldn't find a playable card after drawing")
                         break
                 # Sometimes use an optional draw strategically (50% chance if not already drawn)
-                elif not self.optional_draw_used and random.random() < 0.5 and len(self.deck.cards) > 0:
+                elif not self.optional_draw_used and self.rng.random() < 0.5 and len(self.deck) > 0:
                     # Computer decides to use its optional draw
-                    display_message("Computer uses its optional draw")
-                    card = self.deck.draw_card()
+                    self._message("Computer uses its optional draw")
+                    card = self.draw_card_for(computer_player, optional=True)
                     if card:
-                        computer_player.add_card(card)
-                        display_message(f"Computer drew: {card.get_card_info()}")
+                        self._message("Computer drew: {card}", card=card)
                         self.optional_draw_used = True
                 
                 # Enhanced strategy with multiple card play:
-                # First collect all cards by rank for potential multiple plays
-                cards_by_rank = {}
-                for i, card in enumerate(computer_player.hand):
-                    if card.rank not in cards_by_rank:
-                        cards_by_rank[card.rank] = []
-                    cards_by_rank[card.rank].append(i)
+                # the hand indexes its cards by rank for potential multiple plays
+                hand = computer_player.hand
                 
+                # Sets of a rank are laid with a playable card first (see playable_first)
                 # Priority 1: If we can go out with multiple Jacks, do it for the bonus
-                if 11 in cards_by_rank and len(cards_by_rank[11]) == len(computer_player.hand):
+                jacks = hand.rank_positions(11)
+                if jacks and len(jacks) == len(hand) and self.playable_first(hand, jacks):
                     strategic_suit = self.choose_strategic_suit(computer_player)
-                    self.pending_effects['computer_choosing_suit'] = True  # Trigger visual indicator
-                    played_cards = self.play_cards(computer_player, cards_by_rank[11], strategic_suit)
-                    display_message(f"Computer plays {len(cards_by_rank[11])} Jacks to win with a bonus!")
+                    self.effects.computer_choosing_suit = True  # Trigger visual indicator
+                    played_cards = self.play_cards(computer_player, self.playable_first(hand, jacks), strategic_suit, in_order=True)
+                    self._message("Computer plays {count} Jacks to win with a bonus!", count=len(jacks))
                     return played_cards
                     
                 # Priority 2: Play multiple 8s to force bigger draw and skip
-                if 8 in cards_by_rank and self.can_play_card(computer_player.hand[cards_by_rank[8][0]]):
-                    played_cards = self.play_cards(computer_player, cards_by_rank[8])
-                    display_message(f"Computer plays {len(cards_by_rank[8])} 8s - You must draw {2 * len(cards_by_rank[8])} cards and skip your turn!")
+                eights = self.playable_first(hand, hand.rank_positions(8))
+                if eights:
+                    played_cards = self.play_cards(computer_player, eights, in_order=True)
+                    self._message("Computer plays {count} 8s - You must draw {draw_count} cards and skip your turn!", count=len(eights), draw_count=2 * len(eights))
                     return played_cards
                     
                 # Priority 3: Play multiple Aces to force skip
-                if 1 in cards_by_rank and self.can_play_card(computer_player.hand[cards_by_rank[1][0]]):
-                    played_cards = self.play_cards(computer_player, cards_by_rank[1])
-                    display_message(f"Computer plays {len(cards_by_rank[1])} Aces - You must skip your turn!")
+                aces = self.playable_first(hand, hand.rank_positions(1))
+                if aces:
+                    played_cards = self.play_cards(computer_player, aces, in_order=True)
+                    self._message("Computer plays {count} Aces - You must skip your turn!", count=len(aces))
                     return played_cards
                 
                 # Priority 4: Play multiple 7s to force draws
-                if 7 in cards_by_rank and self.can_play_card(computer_player.hand[cards_by_rank[7][0]]):
-                    played_cards = self.play_cards(computer_player, cards_by_rank[7])
-                    display_message(f"Computer plays {len(cards_by_rank[7])} 7s - You must draw {len(cards_by_rank[7])} cards!")
+                sevens = self.playable_first(hand, hand.rank_positions(7))
+                if sevens:
+                    played_cards = self.play_cards(computer_player, sevens, in_order=True)
+                    self._message("Computer plays {count} 7s - You must draw {count} cards!", count=len(sevens))
                     return played_cards
                 
                 # Priority 5: Play multiple cards of matching rank if possible
                 if self.table_cards:
                     top_card = self.table_cards[-1]
-                    if top_card.rank in cards_by_rank and len(cards_by_rank[top_card.rank]) > 1:
-                        played_cards = self.play_cards(computer_player, cards_by_rank[top_card.rank])
+                    same_rank = self.playable_first(hand, hand.rank_positions(top_card.rank))
+                    if same_rank and len(same_rank) > 1:
+                        played_cards = self.play_cards(computer_player, same_rank, in_order=True)
                         played_any_card = True
                         # If we played 6s, we need to continue to cover them
                         if played_cards and played_cards[0].rank == 6:
@@ -333,8 +372,8 @@ class Game:
                         return played_cards
                 
                 # Play a 7 if available (forces opponent to draw)
-                for i, card in enumerate(computer_player.hand):
-                    if card.rank == 7 and self.can_play_card(card):
+                for i in hand.rank_positions(7):
+                    if self.can_play_card(hand[i]):
                         return self.play_card(computer_player, i)
                         
                 # If there's a top card on the table, try to match suit first
@@ -345,15 +384,8 @@ class Game:
                     for i, card in enumerate(computer_player.hand):
                         if card.suit == top_card.suit and self.can_play_card(card):
                             # Only play a 6 if we can cover it
-                            if card.rank == 6:
-                                # Check if we can cover this 6
-                                can_cover = False
-                                for j, cover_card in enumerate(computer_player.hand):
-                                    if j != i and (cover_card.rank == 6 or cover_card.suit == card.suit):
-                                        can_cover = True
-                                        break
-                                if not can_cover:
-                                    continue  # Skip this 6 if we can't cover it
+                            if card.rank == 6 and not computer_player.hand.can_cover_six(i):
+                                continue  # Skip this 6 if we can't cover it
                             
                             played_cards = self.play_card(computer_player, i)
                             played_any_card = True
@@ -366,15 +398,8 @@ class Game:
                     for i, card in enumerate(computer_player.hand):
                         if card.rank == top_card.rank and self.can_play_card(card):
                             # Only play a 6 if we can cover it
-                            if card.rank == 6:
-                                # Check if we can cover this 6
-                                can_cover = False
-                                for j, cover_card in enumerate(computer_player.hand):
-                                    if j != i and (cover_card.rank == 6 or cover_card.suit == card.suit):
-                                        can_cover = True
-                                        break
-                                if not can_cover:
-                                    continue  # Skip this 6 if we can't cover it
+                            if card.rank == 6 and not computer_player.hand.can_cover_six(i):
+                                continue  # Skip this 6 if we can't cover it
                             
                             played_cards = self.play_card(computer_player, i)
                             played_any_card = True
@@ -384,27 +409,20 @@ class Game:
                             return played_cards
                     
                     # Check if we have a Jack to play
-                    for i, card in enumerate(computer_player.hand):
-                        if card.rank == 11 and self.can_play_card(card):
+                    for i in hand.rank_positions(11):
+                        if self.can_play_card(hand[i]):
                             # Choose the most strategic suit based on what's in the computer's hand
                             strategic_suit = self.choose_strategic_suit(computer_player)
-                            self.pending_effects['computer_choosing_suit'] = True  # Trigger visual indicator
-                            display_message(f"Computer plays Jack and chooses {self.get_suit_name(strategic_suit)} as the next suit")
+                            self.effects.computer_choosing_suit = True  # Trigger visual indicator
+                            self._message("Computer plays Jack and chooses {suit} as the next suit", suit=self.get_suit_name(strategic_suit))
                             return self.play_cards(computer_player, [i], strategic_suit)
                     
                     # Fall back to any valid card that's not a 6 (unless we can cover it)
                     for i, card in enumerate(computer_player.hand):
                         if self.can_play_card(card):
                             # Only play a 6 if we can cover it
-                            if card.rank == 6:
-                                # Check if we can cover this 6
-                                can_cover = False
-                                for j, cover_card in enumerate(computer_player.hand):
-                                    if j != i and (cover_card.rank == 6 or cover_card.suit == card.suit):
-                                        can_cover = True
-                                        break
-                                if not can_cover:
-                                    continue  # Skip this 6 if we can't cover it
+                            if card.rank == 6 and not computer_player.hand.can_cover_six(i):
+                                continue  # Skip this 6 if we can't cover it
                             
                             played_cards = self.play_card(computer_player, i)
                             played_any_card = True
@@ -419,12 +437,71 @@ class Game:
         # Return the last played card (if any) to maintain compatibility
         return computer_player.hand if played_any_card else None
     
+    def playable_first(self, hand, positions):
+        """
+        The hand positions reordered so that a playable card lands first (for
+        play_cards with in_order), or None if none of them can be played.
+        """
+        for i, position in enumerate(positions):
+            if self.can_play_card(hand[position]):
+                return [position] + positions[:i] + positions[i + 1:]
+        return None
+
     def next_turn(self):
-        """Switch to the next player's turn"""
+        """Switch to the next player's turn, playing the computer's turns until the human is to move"""
+        # Iterative, so long chains of 7s, 8s and Aces cannot grow the stack
+        while self.step():
+            pass
+
+    def step(self):
+        """
+        Advance the game by one turn: hand the turn to the next player, apply
+        their forced draws and skips and, unless headless, play the computer's
+        turn. Returns True when another step is due before the human moves (the
+        computer left effects for them), otherwise False.
+        """
         # Check if game is over before switching turns
         if self.check_round_over():
-            return
-            
+            return False
+
+        self._start_next_turn()
+
+        # If it's the computer's turn, let it play automatically
+        # (headless callers drive both seats themselves)
+        if self.is_human_turn or self.headless:
+            return False
+
+        # Computer plays its turn
+        played_card = self.computer_turn()
+
+        # Check if game is over after computer's turn
+        if self.check_round_over():
+            return False
+
+        # Check if computer played a card that affects the next turn
+        if played_card and (self.effects.skip_turn or self.effects.draw_cards > 0):
+            # The effects are processed for the human player by the next step
+            self._message("Computer played a special card with effects")
+            return True
+
+        # Then switch back to human if not skipped
+        self.is_human_turn = True
+        self.current_player_index = 0
+        if self.recorder:
+            self.recorder.turn(0, reset=False)
+
+        # Check if human player has any valid cards
+        human_player = self.players[0]
+        if not self.has_valid_play(human_player) and len(self.deck) > 0:
+            # Signal that human must draw (handled in UI)
+            self._message("You have no valid cards to play - you must draw from the deck")
+            self.must_draw = True
+        else:
+            self.must_draw = False
+        return False
+
+    def _start_next_turn(self):
+        """Switch to the next player and apply the forced draws and skips waiting for them"""
         # Switch to the next player
         self.is_human_turn = not self.is_human_turn
         self.current_player_index = 0 if self.is_human_turn else 1
@@ -443,10 +520,10 @@ class Game:
         skip_needed = False
         
         # Handle forced card draws
-        if self.pending_effects['draw_cards'] > 0:
+        if self.effects.draw_cards > 0:
             # Force the player to draw cards
-            cards_to_draw = self.pending_effects['draw_cards']
-            display_message(f"{next_player.name} must draw {cards_to_draw} cards due to card effects")
+            cards_to_draw = self.effects.take_draw()
+            self._message("{name} must draw {count} cards due to card effects", name=next_player.name, count=cards_to_draw)
             
             # Notify GUI that this player is affected by card effects (draw effect)
             if self.on_player_effect_callback:
@@ -454,23 +531,18 @@ class Game:
             
             # Draw the required cards
             for _ in range(cards_to_draw):
-                if len(self.deck.cards) > 0 or self.reshuffle_table_cards():
-                    card = self.deck.draw_card()
+                if len(self.deck) > 0 or self.reshuffle_table_cards():
+                    card = self.draw_card_for(next_player)
                     if card:
-                        next_player.add_card(card)
-                        display_message(f"{next_player.name} drew: {card.get_card_info()}")
+                        self._message("{name} drew: {card}", name=next_player.name, card=card)
                 else:
-                    display_message(f"Deck is empty! {next_player.name} couldn't draw all required cards")
+                    self._message("Deck is empty! {name} couldn't draw all required cards", name=next_player.name)
                     break
-                    
-            # Reset the draw count
-            self.pending_effects['draw_cards'] = 0
         
         # Handle skip turn effect
-        if self.pending_effects['skip_turn']:
-            display_message(f"{next_player.name} must skip their turn due to card effects")
+        if self.effects.take_skip():
+            self._message("{name} must skip their turn due to card effects", name=next_player.name)
             skip_needed = True
-            self.pending_effects['skip_turn'] = False
             
             # Notify GUI that this player is affected by card effects
             if self.on_player_effect_callback:
@@ -478,60 +550,39 @@ class Game:
         
         # If player needs to skip their turn, immediately switch to the next player
         if skip_needed:
-            display_message(f"Turn passes to the next player")
+            self._message("Turn passes to the next player")
             # Since this player is skipped, move directly to the next player's turn
             self.is_human_turn = not self.is_human_turn
             self.current_player_index = 0 if self.is_human_turn else 1
             
             # Get the new current player
             next_player = self.players[self.current_player_index]
-            display_message(f"It's now {next_player.name}'s turn")
+            self._message("It's now {name}'s turn", name=next_player.name)
         
-        # If it's the computer's turn, let it play automatically
-        if not self.is_human_turn:
-            # Computer plays its turn
-            played_card = self.computer_turn()
-            
-            # Check if game is over after computer's turn
-            if not self.check_round_over():
-                # Check if computer played a card that affects the next turn
-                if played_card and (self.pending_effects['skip_turn'] or self.pending_effects['draw_cards'] > 0):
-                    # If computer played a card with effects, we need another next_turn call
-                    # to process these effects for the human player
-                    display_message("Computer played a special card with effects")
-                    return self.next_turn()
-                
-                # Then switch back to human if not skipped
-                self.is_human_turn = True
-                self.current_player_index = 0
-                
-                # Check if human player has any valid cards
-                human_player = self.players[0]
-                if not self.has_valid_play(human_player) and len(self.deck.cards) > 0:
-                    # Signal that human must draw (handled in UI)
-                    display_message("You have no valid cards to play - you must draw from the deck")
-                    self.must_draw = True
-                else:
-                    self.must_draw = False
+        if self.recorder:
+            self.recorder.turn(self.current_player_index, reset=True)
 
     def check_round_over(self):
         """Check if the current round is over (any player has no cards left)"""
+        # The round is only scored once, however often this is polled
+        if self.round_over:
+            return True
+        if not self._score_round():
+            return False
+        if self.recorder:
+            self.recorder.round_end([player.points for player in self.players])
+            if not self.is_running:
+                self.recorder.game_end()
+        return True
+
+    def _score_round(self):
+        """Score the round and return True if it is over"""
         # First check if any player has no cards left
         for player in self.players:
             if len(player.hand) == 0:
-                # Count how many jacks were in the last play
-                jack_count = 0
-                if self.table_cards:
-                    # Look at the last cards played (they must be from the player who went out)
-                    last_rank = self.table_cards[-1].rank
-                    if last_rank == 11:  # It was a Jack
-                        # Count consecutive Jacks from the end
-                        for card in reversed(self.table_cards):
-                            if card.rank == 11:
-                                jack_count += 1
-                            else:
-                                break
-                                
+                # Count how many jacks were in the last play (they must be from the player who went out)
+                jack_count = self.table_cards.trailing_jacks
+                
                 # Calculate and apply the Jack bonus (negative points)
                 jack_bonus = -20 * jack_count * self.point_multiplier if jack_count > 0 else 0
                 
@@ -551,7 +602,8 @@ class Game:
                     # But the overall game is won by the player with FEWER points
                     winner = "Player" if self.players[1].points > self.players[0].points else "Computer"
                     self.round_end_message = f"Game Over! {winner} wins! Final score: Player {self.players[0].points}, Computer {self.players[1].points}"
-                    display_message(self.round_end_message)
+                    self._message(self.round_end_message)
+                    self.round_over = True
                     return True
                 
                 winner = "Player" if player == self.players[0] else "Computer"
@@ -559,24 +611,16 @@ class Game:
                 jack_text = ""
                 
                 # If there was a Jack bonus, include it in the message
-                jack_count = 0
-                if self.table_cards and self.table_cards[-1].rank == 11:
-                    # Count consecutive Jacks from the end
-                    for card in reversed(self.table_cards):
-                        if card.rank == 11:
-                            jack_count += 1
-                        else:
-                            break
-                    if jack_count > 0:
-                        jack_bonus = -20 * jack_count * self.point_multiplier
-                        jack_text = f" {winner} finished with {jack_count} Jack{'s' if jack_count > 1 else ''} (-{abs(jack_bonus)} points)!"
+                if jack_count > 0:
+                    jack_text = f" {winner} finished with {jack_count} Jack{'s' if jack_count > 1 else ''} (-{abs(jack_bonus)} points)!"
                 
                 self.round_end_message = f"Round {self.round_number} over! {winner} wins!{jack_text} {loser} gets {opponent_points} points (×{self.point_multiplier} multiplier). Total score: Player {self.players[0].points}, Computer {self.players[1].points}"
-                display_message(self.round_end_message)
+                self._message(self.round_end_message)
+                self.round_over = True
                 return True
                 
         # Check if both players are deadlocked (neither can play and deck is empty)
-        if not self.deck.cards:
+        if len(self.deck) == 0:
             human = self.players[0]
             computer = self.players[1]
             
@@ -597,11 +641,13 @@ class Game:
                         winner = "Computer" if human.points > 125 else "Player"
                         
                     self.round_end_message = f"Game Over! {winner} wins! Final score: Player {human.points}, Computer {computer.points}"
-                    display_message(self.round_end_message)
+                    self._message(self.round_end_message)
+                    self.round_over = True
                     return True
                 
                 self.round_end_message = f"Round {self.round_number} deadlocked! Both players get points: Player +{computer_points}, Computer +{human_points}. Total score: Player {human.points}, Computer {computer.points}"
-                display_message(self.round_end_message)
+                self._message(self.round_end_message)
+                self.round_over = True
                 return True
                 
         return False
@@ -613,14 +659,14 @@ class Game:
                 self.is_running = False
                 winner = "Player" if player != self.players[0] else "Computer"
                 self.round_end_message = f"Game Over! {winner} wins with fewer points! Final score: Player {self.players[0].points}, Computer {self.players[1].points}"
-                display_message(self.round_end_message)
+                self._message(self.round_end_message)
                 return True
         return False
 
     def end_game(self):
         """End the game gracefully"""
         self.is_running = False
-        display_message("\nGame Over!")
+        self._message("\nGame Over!")
 
     def can_play_card(self, card):
         """
@@ -631,94 +677,117 @@ class Game:
         4. Card can be played if it has the same suit as the top card
         5. Card can be played if it has the same rank as the top card
         6. Special case for 6s: must be followed by another 6, same suit, or any Jack
+        
+        The rules are precomputed per table state (see rules.py), so this is a
+        single table lookup. Non-standard cards are never playable.
         """
-        # If there are no cards on the table, any card can be played
-        if not self.table_cards:
-            return True
-            
-        # Get the top card on the table
-        top_card = self.table_cards[-1]
-        
-        # Special case for 6s: only the same player can play on it during their turn
-        if self.pending_effects['requires_six']:
-            current_player = self.players[self.current_player_index]
-            if current_player != self.pending_effects['six_player']:
-                # Different player cannot interfere with opponent's 6 at all
-                return False
-            
-            # Same player: Must play another 6, same suit as the most recent 6, or any Jack
-            six_suit = self.pending_effects['six_suit']
-            return card.rank == 6 or card.suit == six_suit or card.rank == 11
-            
-        # Any Jack (rank 11) can be played on any card or suit (except when different player tries to cover opponent's 6)
-        if card.rank == 11:
-            return True  # All Jacks are wild - can be played anytime, on any suit
+        return bool(PLAYABLE_MASKS[self.rule_key()] & card.bit)
+
+    def rule_key(self):
+        """Reduce the current table state to its key in rules.PLAYABLE_MASKS"""
+        if self.table_cards:
+            top = self.table_cards[-1].id
+            if top is None:
+                top = NONSTANDARD_TOP
+        else:
+            top = EMPTY_TABLE
+        
+        effects = self.effects
+        if effects.requires_six:
+            # Only the player who played the 6 may cover it
+            if self.current_player_index != effects.six_owner:
+                six = SIX_OPPONENT
+            else:
+                six = SUIT_INDEX.get(effects.six_suit, UNKNOWN_SUIT)
+        else:
+            six = NO_SIX
             
-        # If a suit is being enforced by a Jack
-        if self.pending_effects['suit_enforced'] and self.pending_effects['chosen_suit']:
-            # Can only play the enforced suit or another Jack
-            return card.suit == self.pending_effects['chosen_suit'] or card.rank == 11
+        if effects.suit_enforced and effects.chosen_suit:
+            enforced = SUIT_INDEX.get(effects.chosen_suit, UNKNOWN_SUIT)
+        else:
+            enforced = NOT_ENFORCED
             
-        # Card can be played if same suit or same rank
-        return card.suit == top_card.suit or card.rank == top_card.rank
+        return rule_key(top, enforced, six)
+
+    def playable_mask(self):
+        """
+        Return the bitmask of every card that could be played right now by the
+        current player (see can_play_card). AND it with a hand's mask to get
+        that hand's playable cards.
+        """
+        return PLAYABLE_MASKS[self.rule_key()]
 
     def has_valid_play(self, player):
         """Check if the player has any valid card to play"""
-        for card in player.hand:
-            if self.can_play_card(card):
-                return True
-        return False
+        return bool(self.playable_mask() & player.hand.mask)
 
     def reshuffle_table_cards(self):
         """Reshuffle cards from the table to create a new deck when the current one is empty"""
         if not self.table_cards or len(self.table_cards) <= 1:
             return False  # Not enough cards on the table to reshuffle
             
-        display_message("Reshuffling cards from the table to create a new deck")
+        self._message("Reshuffling cards from the table to create a new deck")
         
         # Keep the last played card on the table
-        top_card = self.table_cards.pop()
+        table = self.table_cards
+        top_card = table.pop()
         
-        # Move all other cards from the table to the deck
-        self.deck.cards = self.table_cards.copy()
-        self.table_cards = [top_card]  # Reset the table cards to only the top card
+        # Move all other cards from the table to the deck and shuffle it lazily,
+        # from the reshuffle stream (the order deck.seeded_shuffle gives)
+        rng = random.Random(self.reshuffle_seed)
+        self.deck.refill(table, rng)
+        self.reshuffle_seed = rng.getrandbits(64)
+        table.clear()
+        table.append(top_card)  # Reset the table cards to only the top card
         
-        # Shuffle the deck
-        self.deck.shuffle()
+        if self.recorder:
+            self.recorder.reshuffle([card.id for card in self.deck.cards])
         
         # Increase the point multiplier for the next round
         self.point_multiplier += 1
         
-        display_message(f"Cards reshuffled! Point multiplier increased to ×{self.point_multiplier}")
+        self._message("Cards reshuffled! Point multiplier increased to ×{multiplier}", multiplier=self.point_multiplier)
         return True
 
+    def draw_card_for(self, player, optional=False):
+        """
+        Draw the top card of the deck into a player's hand and return it
+        (None if the deck is empty). optional marks the once-per-turn
+        optional draw in the event log; callers still set optional_draw_used.
+        """
+        card = self.deck.draw_card()
+        if card:
+            player.add_card(card)
+            if self.recorder:
+                self.recorder.draw(self.players.index(player), card.id, optional)
+        return card
+
     def draw_until_playable(self, player):
         """Draw one card when player has no playable cards. If still no playable card, turn is skipped."""
         # If deck is empty, try to reshuffle cards from the table
-        if not self.deck.cards:
+        if len(self.deck) == 0:
             if self.reshuffle_table_cards():
-                display_message(f"Deck was empty! Cards reshuffled for {player.name}")
+                self._message("Deck was empty! Cards reshuffled for {name}", name=player.name)
             else:
-                display_message(f"Deck is empty and cannot reshuffle! {player.name} skips their turn")
+                self._message("Deck is empty and cannot reshuffle! {name} skips their turn", name=player.name)
                 return False
         
         # Draw exactly one card
-        card = self.deck.draw_card()
+        card = self.draw_card_for(player)
         
         if card:
-            player.add_card(card)
-            display_message(f"{player.name} has no playable cards - drew: {card.get_card_info()}")
+            self._message("{name} has no playable cards - drew: {card}", name=player.name, card=card)
             
             # Check if the card is playable
             if self.can_play_card(card):
-                display_message(f"{player.name} can now play the card they drew")
+                self._message("{name} can now play the card they drew", name=player.name)
                 return True
             else:
-                display_message(f"{player.name} still has no playable cards - turn skipped")
+                self._message("{name} still has no playable cards - turn skipped", name=player.name)
                 return False
         else:
             # Couldn't draw a card even after potential reshuffle
-            display_message(f"{player.name} couldn't draw a card - turn skipped")
+            self._message("{name} couldn't draw a card - turn skipped", name=player.name)
             return False
 
     def draw_until_six_covered(self, player):
@@ -728,31 +797,30 @@ class Game:
         
         while cards_drawn < max_draws:
             # If deck is empty, try to reshuffle cards from the table
-            if not self.deck.cards:
+            if len(self.deck) == 0:
                 if self.reshuffle_table_cards():
-                    display_message(f"Deck was empty! Cards reshuffled for {player.name}")
+                    self._message("Deck was empty! Cards reshuffled for {name}", name=player.name)
                 else:
-                    display_message(f"Deck is empty and cannot reshuffle! {player.name} cannot cover the 6")
+                    self._message("Deck is empty and cannot reshuffle! {name} cannot cover the 6", name=player.name)
                     return False
             
             # Draw a card
-            card = self.deck.draw_card()
+            card = self.draw_card_for(player)
             cards_drawn += 1
             
             if card:
-                player.add_card(card)
-                display_message(f"{player.name} drew: {card.get_card_info()} (trying to cover 6)")
+                self._message("{name} drew: {card} (trying to cover 6)", name=player.name, card=card)
                 
                 # Check if this card can cover the 6
                 if self.can_play_card(card):
-                    display_message(f"{player.name} found a card to cover the 6 after drawing {cards_drawn} cards")
+                    self._message("{name} found a card to cover the 6 after drawing {count} cards", name=player.name, count=cards_drawn)
                     return True
             else:
                 # Couldn't draw a card
-                display_message(f"{player.name} couldn't draw a card - cannot cover the 6")
+                self._message("{name} couldn't draw a card - cannot cover the 6", name=player.name)
                 return False
         
-        display_message(f"{player.name} drew {max_draws} cards but still cannot cover the 6")
+        self._message("{name} drew {count} cards but still cannot cover the 6", name=player.name, count=max_draws)
         return False
     
     def choose_strategic_suit(self, player):
@@ -760,11 +828,8 @@ class Game:
         1. Choose the suit with the most cards in the player's hand
         2. If multiple suits have the same count, prefer hearts, diamonds, clubs, spades in that order
         """
-        # Count cards by suit
-        suit_counts = {'H': 0, 'D': 0, 'C': 0, 'S': 0}
-        for card in player.hand:
-            if card.suit in suit_counts:
-                suit_counts[card.suit] += 1
+        # Cards by suit, kept up to date by the hand (Jacks choose by code)
+        suit_counts = dict(zip(SUIT_CODES, player.hand.suit_counts))
         
         # Find the suit with the most cards
         max_count = 0
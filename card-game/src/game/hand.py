@@ -0,0 +1,157 @@
+from .card import SUIT_MASKS, RANK_MASKS, suit_index
+
+# Points a card is worth when left in hand at the end of a round (2-9 are worth 0)
+RANK_POINTS = {1: 15, 10: 10, 11: 20, 12: 10, 13: 10}
+
+
+class Hand(list):
+    """
+    A player's cards: an ordinary list (the GUI indexes and enumerates it)
+    that also keeps a 52-bit mask of the cards it holds and the running
+    point total, updated on every add and remove.
+
+    Set queries such as "any card of this suit" or "which of these cards
+    are playable" become a few integer operations on the mask instead of a
+    loop over the cards. Non-standard cards (without a card id) are kept in
+    the list and counted for points but never appear in the mask.
+
+    For the computer player, the hand also indexes the positions of its
+    cards by rank and by suit. Appends keep the index current; removals
+    shift positions, so they drop it and the next query rebuilds it once.
+
+    Attributes:
+        mask: Bitmask of the cards held (bit card.id)
+        points: Total points of the cards held
+        suit_counts: Number of cards held of each suit, by suit index
+    """
+    __slots__ = ('mask', 'points', 'suit_counts', '_counts', '_positions')
+
+    def __init__(self, cards=()):
+        super().__init__(cards)
+        self._rebuild()
+
+    def __reduce__(self):
+        return (Hand, (list(self),))
+
+    def _rebuild(self):
+        self.mask = 0
+        self.points = 0
+        self.suit_counts = [0, 0, 0, 0]
+        self._counts = bytearray(52)
+        self._positions = None
+        for card in self:
+            self._added(card)
+
+    def _added(self, card):
+        cid = card.id
+        if cid is not None:
+            self._counts[cid] += 1
+            self.mask |= card.bit
+            self.suit_counts[card.suit_index] += 1
+        self.points += RANK_POINTS.get(card.rank, 0)
+
+    def _removed(self, card):
+        cid = card.id
+        if cid is not None:
+            self._counts[cid] -= 1
+            if not self._counts[cid]:
+                self.mask &= ~card.bit
+            self.suit_counts[card.suit_index] -= 1
+        self.points -= RANK_POINTS.get(card.rank, 0)
+        self._positions = None
+
+    def _indexed(self, card, position):
+        if self._positions is not None:
+            by_rank, by_suit = self._positions
+            by_rank.setdefault(card.rank, []).append(position)
+            by_suit.setdefault(card.suit_index, []).append(position)
+
+    def append(self, card):
+        super().append(card)
+        self._added(card)
+        self._indexed(card, len(self) - 1)
+
+    def insert(self, index, card):
+        super().insert(index, card)
+        self._added(card)
+        self._positions = None
+
+    def extend(self, cards):
+        cards = list(cards)
+        start = len(self)
+        super().extend(cards)
+        for position, card in enumerate(cards, start):
+            self._added(card)
+            self._indexed(card, position)
+
+    def __iadd__(self, cards):
+        self.extend(cards)
+        return self
+
+    def pop(self, index=-1):
+        card = super().pop(index)
+        self._removed(card)
+        return card
+
+    def remove(self, card):
+        super().remove(card)
+        self._removed(card)
+
+    def clear(self):
+        super().clear()
+        self._rebuild()
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self._rebuild()
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._rebuild()
+
+    def sort(self, *, key=None, reverse=False):
+        super().sort(key=key, reverse=reverse)
+        self._positions = None
+
+    def reverse(self):
+        super().reverse()
+        self._positions = None
+
+    def __imul__(self, count):
+        super().__imul__(count)
+        self._rebuild()
+        return self
+
+    def suit_mask(self, suit):
+        """Return the mask of held cards of a suit (name or code)"""
+        index = suit_index(suit)
+        return self.mask & SUIT_MASKS[index] if index is not None else 0
+
+    def _index(self):
+        if self._positions is None:
+            by_rank = {}
+            by_suit = {}
+            for position, card in enumerate(self):
+                by_rank.setdefault(card.rank, []).append(position)
+                by_suit.setdefault(card.suit_index, []).append(position)
+            self._positions = (by_rank, by_suit)
+        return self._positions
+
+    def rank_positions(self, rank):
+        """Return the positions of the held cards of a rank, in hand order"""
+        return list(self._index()[0].get(rank, ()))
+
+    def suit_positions(self, suit):
+        """Return the positions of the held cards of a suit (name or code), in hand order"""
+        return list(self._index()[1].get(suit_index(suit), ()))
+
+    def can_cover_six(self, position):
+        """Whether another held card (a 6 or a card of its suit) could cover the 6 at position"""
+        by_rank, by_suit = self._index()
+        six = self[position]
+        return (any(other != position for other in by_rank.get(6, ()))
+                or any(other != position for other in by_suit.get(six.suit_index, ())))
+
+    def rank_mask(self, rank):
+        """Return the mask of held cards of a rank"""
+        return self.mask & RANK_MASKS[rank] if rank in range(1, 14) else 0
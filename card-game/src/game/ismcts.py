@@ -0,0 +1,361 @@
+"""
+Information-set Monte Carlo tree search computer player.
+
+The player to move knows their own hand, the table and the number of
+cards held by the opponent and left in the deck, but not which cards
+those are. Each iteration of the search:
+    1. determinizes: deals the unseen cards (opponent hand plus deck) at
+       random, keeping hand and deck sizes
+    2. descends the shared tree, choosing among the moves that are legal
+       in this determinization with UCB weighted by how often each move
+       was available
+    3. expands one untried move and plays the round out with random single
+       cards, on bitmasks and lists updated in place (_playout follows
+       GameState.apply without building a state for every move)
+    4. backs up the change in round points from each mover's point of view
+
+The most visited root move is played when the wall-clock budget runs out.
+One core runs about 4,500 iterations a second from a mid-round position,
+so the default 0.2 s budget searches some 900 playouts per move.
+Once the deck is empty nothing is hidden any more, and when the hands are
+small enough (ENDGAME_MAX_CARDS) the move comes from the exact
+EndgameSolver instead. The solver gets the same time budget; if it runs
+out, the search plays the move as usual.
+
+Use it as the computer opponent with game.computer_strategy = ISMCTSPlayer(),
+or as a whole-turn policy for Simulator and tournaments.
+"""
+import math
+import random
+import time
+
+from .card import CARDS, SUIT_CODES, RANK_MASKS, popcount
+from .deck import seeded_shuffle
+from .endgame import EndgameSolver, SolverTimeout
+from .hand import RANK_POINTS
+from .movegen import legal_moves
+from .rules import PLAYABLE_MASKS, ENFORCED_STATES, SIX_STATES, EMPTY_TABLE, NOT_ENFORCED, UNKNOWN_SUIT, SIX_OPPONENT, NO_SIX
+from .state import GameState, MAX_SIX_COVER_DRAWS
+
+# Half the reward range corresponds to this many points of difference
+REWARD_SCALE = 100
+# Playouts that last longer than this are scored on the hands held
+MAX_PLAYOUT_MOVES = 300
+_RANKS = tuple(card.rank for card in CARDS)
+_SUITS = tuple(card.suit_index for card in CARDS)
+_POINT_MASKS = tuple((RANK_MASKS[rank], points) for rank, points in RANK_POINTS.items())
+
+# Empty-deck positions with at most this many cards in the two hands go to
+# the endgame solver (they take milliseconds; the time grows exponentially)
+ENDGAME_MAX_CARDS = 12
+
+
+class _Node:
+    """A tree node reached by playing move; player is the one who played it"""
+    __slots__ = ('move', 'parent', 'player', 'children', 'visits', 'availability', 'reward')
+
+    def __init__(self, move=None, parent=None, player=None):
+        self.move = move
+        self.parent = parent
+        self.player = player
+        self.children = {}
+        self.visits = 0
+        self.availability = 0
+        self.reward = 0.0
+
+
+class ISMCTSPlayer:
+    """
+    Computer player that searches with information-set MCTS.
+
+    Attributes:
+        budget: Wall-clock seconds to spend on each move
+        exploration: UCB exploration constant
+        rng: Random stream for determinizations and playouts
+        endgame_solver: EndgameSolver used once the deck is empty (None to always search)
+        last_iterations: Number of playouts run for the last move
+        last_seconds: Time spent on the last move
+    """
+    plays_whole_turn = True  # Usable as a Simulator / tournament policy
+
+    def __init__(self, budget=0.2, exploration=0.7, seed=None, endgame_solver=None):
+        self.budget = budget
+        self.exploration = exploration
+        self.rng = random.Random(seed)
+        self.endgame_solver = endgame_solver if endgame_solver is not None else EndgameSolver()
+        self.last_iterations = 0
+        self.last_seconds = 0.0
+
+    def __call__(self, game, player):
+        return self.play_turn(game, player)
+
+    def play_turn(self, game, player):
+        """
+        Play a whole turn for player in a live Game, as Game.computer_turn
+        does. Returns the player's hand if a card was played, otherwise None.
+        """
+        played_any_card = False
+        index = game.players.index(player)
+        while player.hand and not game.round_over:
+            state = GameState.from_game(game, seed=self.rng.getrandbits(64))
+            if state.current != index:
+                break
+            move = self.choose_move(state)
+
+            if not move.cards:
+                if game.has_valid_play(player):
+                    # Optional draw
+                    game.draw_card_for(player, optional=True)
+                    game.optional_draw_used = True
+                    continue
+                if game.effects.requires_six:
+                    found = game.draw_until_six_covered(player)
+                else:
+                    found = game.draw_until_playable(player)
+                if not found:
+                    break
+                continue
+
+            chosen_suit = SUIT_CODES[move.suit] if move.suit is not None else None
+            if not game.play_cards(player, self._positions(player, move.cards), chosen_suit, in_order=True):
+                raise ValueError(f"ISMCTS chose an illegal move: {move}")
+            played_any_card = True
+            effects = game.effects
+            if not (effects.requires_six and effects.six_owner == index):
+                break
+        return player.hand if played_any_card else None
+
+    @staticmethod
+    def _positions(player, card_ids):
+        """Hand positions of the cards, in the order given (the order they must land in)"""
+        positions = {card.id: i for i, card in enumerate(player.hand)}
+        return [positions[card_id] for card_id in card_ids]
+
+    def choose_move(self, state):
+        """Return the best move for the player to move in state within the time budget"""
+        moves = legal_moves(state)
+        if len(moves) == 1:
+            self.last_iterations = 0
+            self.last_seconds = 0.0
+            return moves[0]
+        start = time.perf_counter()
+        deadline = start + self.budget
+        if (not state.deck and self.endgame_solver is not None
+                and len(state.hands[0]) + len(state.hands[1]) <= ENDGAME_MAX_CARDS):
+            try:
+                move = self.endgame_solver.best_move(state, deadline)
+            except SolverTimeout:
+                pass  # Search for the rest of the budget
+            else:
+                self.last_iterations = 0
+                self.last_seconds = time.perf_counter() - start
+                return move
+
+        rng = self.rng
+        root = _Node()
+        iterations = 0
+        while True:
+            self._iterate(root, self.determinize(state, rng), rng)
+            iterations += 1
+            if time.perf_counter() >= deadline:
+                break
+        self.last_iterations = iterations
+        self.last_seconds = time.perf_counter() - start
+        best = max(moves, key=lambda move: root.children[move].visits if move in root.children else -1)
+        return best
+
+    @staticmethod
+    def determinize(state, rng):
+        """Deal the cards unseen by the player to move at random, keeping hand and deck sizes"""
+        opponent = state.current ^ 1
+        unseen = list(state.hands[opponent] + state.deck)
+        rng.shuffle(unseen)
+        size = len(state.hands[opponent])
+        opponent_hand = tuple(unseen[:size])
+        mask = 0
+        for card_id in opponent_hand:
+            mask |= 1 << card_id
+        hands = list(state.hands)
+        masks = list(state.masks)
+        hands[opponent] = opponent_hand
+        masks[opponent] = mask
+        return state.replace(hands=tuple(hands), masks=tuple(masks), deck=tuple(unseen[size:]),
+                             seed=rng.getrandbits(64))
+
+    def _iterate(self, root, state, rng):
+        start_points = state.points
+        node = root
+        exploration = self.exploration
+
+        # Selection: descend while every legal move has been tried
+        while not state.round_over:
+            moves = legal_moves(state)
+            untried = [move for move in moves if move not in node.children]
+            for move in moves:
+                child = node.children.get(move)
+                if child is not None:
+                    child.availability += 1
+            if untried:
+                # Expansion
+                move = rng.choice(untried)
+                child = node.children[move] = _Node(move, node, state.current)
+                child.availability = 1
+                node = child
+                state = state.apply(move)
+                break
+            children = node.children
+            best_score = -1.0
+            for move in moves:
+                child = children[move]
+                score = (child.reward / child.visits
+                         + exploration * math.sqrt(math.log(child.availability) / child.visits))
+                if score > best_score:
+                    best_score, node = score, child
+            state = state.apply(node.move)
+
+        if state.round_over:
+            round_over, points, masks = True, state.points, state.masks
+        else:
+            round_over, points, masks = self._playout(state, rng)
+
+        # Backpropagation
+        if round_over:
+            gained = (points[0] - start_points[0], points[1] - start_points[1])
+        else:
+            gained = (_mask_points(masks[0]), _mask_points(masks[1]))
+        while node is not root:
+            node.visits += 1
+            mover = node.player
+            margin = (gained[mover ^ 1] - gained[mover]) / (2 * REWARD_SCALE)
+            node.reward += min(1.0, max(0.0, 0.5 + margin))
+            node = node.parent
+        root.visits += 1
+
+    @staticmethod
+    def _playout(state, rng):
+        """
+        Play random single cards (random suits for Jacks) until the round
+        ends, drawing only when nothing is playable. Returns (round_over,
+        points, masks).
+
+        The round is kept in local variables changed in place, with the
+        PLAYABLE_MASKS key parts as plain ints; the rules follow
+        GameState.apply move for move (reshuffles included), so the result
+        is the one applying the same moves to the state would give.
+        """
+        masks = list(state.masks)
+        deck = list(state.deck)
+        table = list(state.table)
+        points = list(state.points)
+        current = state.current
+        draw_cards = state.draw_cards
+        skip_turn = state.skip_turn
+        requires_six = state.requires_six
+        six_owner = state.six_owner
+        six_suit = state.six_suit if state.six_suit is not None else UNKNOWN_SUIT
+        enforced = state.enforced_suit if state.enforced_suit is not None else NOT_ENFORCED
+        multiplier = state.multiplier
+        seed = state.seed
+        jacks = state.trailing_jacks
+        top = table[-1] if table else EMPTY_TABLE
+        random_unit = rng.random
+
+        def draw(player):
+            # Draw one card, reshuffling the table into an empty deck first
+            # (GameState._reshuffle); returns the card's bit, or 0 for none
+            nonlocal table, deck, multiplier, seed, jacks
+            if not deck:
+                if len(table) <= 1:
+                    return 0
+                deck, seed = seeded_shuffle(table[:-1], seed)
+                table = table[-1:]
+                multiplier += 1
+                jacks = min(jacks, 1)
+            bit = 1 << deck.pop()
+            masks[player] |= bit
+            return bit
+
+        def playable():
+            # GameState.playable_mask
+            if requires_six:
+                six = six_suit if six_owner == current else SIX_OPPONENT
+            else:
+                six = NO_SIX
+            return PLAYABLE_MASKS[(top * ENFORCED_STATES + enforced) * SIX_STATES + six]
+
+        for _ in range(MAX_PLAYOUT_MOVES):
+            hand = playable() & masks[current]
+            if hand:
+                # A random playable card: skip a random number of the set bits
+                for _ in range(int(random_unit() * popcount(hand))):
+                    hand &= hand - 1
+                bit = hand & -hand
+                top = bit.bit_length() - 1
+                masks[current] ^= bit
+                table.append(top)
+                rank = _RANKS[top]
+                suit = _SUITS[top]
+
+                # GameState._apply_card_effects for a single card
+                if rank == 11:
+                    jacks += 1
+                    enforced = int(random_unit() * 4)
+                else:
+                    jacks = 0
+                    if suit == enforced:
+                        enforced = NOT_ENFORCED
+                if requires_six and rank != 6:
+                    requires_six = False
+                    six_owner = None
+                    six_suit = UNKNOWN_SUIT
+                if rank == 8:
+                    draw_cards += 2
+                    skip_turn = True
+                elif rank == 7:
+                    draw_cards += 1
+                elif rank == 1:
+                    skip_turn = True
+                elif rank == 6:
+                    requires_six = True
+                    six_owner = current
+                    six_suit = suit
+                if requires_six and six_owner == current and masks[current]:
+                    continue  # Covering their own 6: the turn goes on
+            else:
+                # Forced draw (_draw_until_playable / _draw_until_six_covered)
+                found = False
+                for _ in range(MAX_SIX_COVER_DRAWS if requires_six else 1):
+                    bit = draw(current)
+                    if not bit:
+                        break
+                    if playable() & bit:
+                        found = True
+                        break
+                if found:
+                    continue
+
+            # GameState._end_turn, starting with _check_round_over
+            if not masks[0] or not masks[1]:
+                winner = 0 if not masks[0] else 1
+                points[winner ^ 1] += _mask_points(masks[winner ^ 1]) * multiplier
+                points[winner] -= 20 * jacks * multiplier
+                return True, points, masks
+            if not deck and not playable() & (masks[0] | masks[1]):
+                points[0] += _mask_points(masks[1]) * multiplier
+                points[1] += _mask_points(masks[0]) * multiplier
+                return True, points, masks
+            current ^= 1
+            if draw_cards:
+                for _ in range(draw_cards):
+                    if not draw(current):
+                        break
+                draw_cards = 0
+            if skip_turn:
+                skip_turn = False
+                current ^= 1
+        return False, points, masks
+
+
+def _mask_points(mask):
+    """Points of the cards in a mask (hand_points for bitmasks)"""
+    return sum(popcount(mask & rank_mask) * points for rank_mask, points in _POINT_MASKS)
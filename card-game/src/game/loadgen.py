@@ -0,0 +1,151 @@
+"""
+Local load generator for the game server.
+
+Opens a few connections and plays many tables over each of them at once,
+every table with a simple client that plays the first playable card or
+draws. Each table keeps one request in flight; the generator reports
+moves (plays and draws) per second and request latency percentiles.
+
+By default it starts a GameServer in the same process (and so on the
+same core) on a free port; pass --port or --unix to load a running
+server instead.
+
+Run from the src directory:
+    python -m game.loadgen --tables 2000 --seconds 10
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import time
+from collections import namedtuple
+
+from .server import GameServer
+
+LoadSummary = namedtuple('LoadSummary', [
+    'tables', 'games', 'moves', 'errors', 'seconds', 'moves_per_second', 'p50_ms', 'p90_ms', 'p99_ms',
+])
+
+
+class Client:
+    """One connection with many requests in flight, matched to replies by id"""
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.pending = {}
+        self._ids = itertools.count(1)
+        self._reader_task = asyncio.get_running_loop().create_task(self._read_replies())
+
+    async def _read_replies(self):
+        while True:
+            line = await self.reader.readline()
+            if not line:
+                break
+            reply = json.loads(line)
+            future = self.pending.pop(reply.get('id'), None)
+            if future is not None:
+                future.set_result(reply)
+        for future in self.pending.values():
+            future.set_exception(ConnectionError("The server closed the connection"))
+
+    async def request(self, **fields):
+        """Send one request and wait for its reply"""
+        fields['id'] = request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self.pending[request_id] = future
+        self.writer.write(json.dumps(fields, separators=(',', ':')).encode() + b'\n')
+        return await future
+
+    async def close(self):
+        # Half-close, so the server sees the end of the requests and closes its side first
+        self.writer.write_eof()
+        await self._reader_task
+        self.writer.close()
+        await self.writer.wait_closed()
+
+
+async def play_table(client, deadline, latencies, counts, seed):
+    """Play games on one table until the deadline"""
+    while time.perf_counter() < deadline:
+        reply = await client.request(op='new', seed=seed)
+        seed += 1
+        table = reply['state']['table']
+        state = reply['state']
+        while state['running'] and time.perf_counter() < deadline:
+            if state['playable']:
+                request = {'op': 'play', 'table': table, 'cards': state['playable'][:1]}
+            else:
+                request = {'op': 'draw', 'table': table}
+            start = time.perf_counter()
+            reply = await client.request(**request)
+            latencies.append(time.perf_counter() - start)
+            if not reply['ok']:
+                counts['errors'] += 1
+                break
+            counts['moves'] += 1
+            state = reply['state']
+        counts['games'] += 1
+        await client.request(op='close', table=table)
+
+
+async def run_load(tables=1000, seconds=10.0, connections=4, host='127.0.0.1', port=None, unix=None, seed=0):
+    """Run the load and return a LoadSummary"""
+    listener = None
+    if port is None and unix is None:
+        listener = await GameServer().start(host, 0)
+        port = listener.sockets[0].getsockname()[1]
+    clients = []
+    for _ in range(connections):
+        if unix:
+            reader, writer = await asyncio.open_unix_connection(unix, limit=1 << 20)
+        else:
+            reader, writer = await asyncio.open_connection(host, port, limit=1 << 20)
+        clients.append(Client(reader, writer))
+
+    latencies = []
+    counts = {'moves': 0, 'games': 0, 'errors': 0}
+    start = time.perf_counter()
+    deadline = start + seconds
+    await asyncio.gather(*(play_table(clients[i % connections], deadline, latencies, counts, seed + i * 1000003)
+                           for i in range(tables)))
+    elapsed = time.perf_counter() - start
+
+    for client in clients:
+        await client.close()
+    if listener is not None:
+        listener.close()
+        await listener.wait_closed()
+
+    latencies.sort()
+
+    def percentile(fraction):
+        if not latencies:
+            return 0.0
+        return latencies[min(len(latencies) - 1, int(fraction * len(latencies)))] * 1000
+
+    return LoadSummary(tables, counts['games'], counts['moves'], counts['errors'], elapsed,
+                       counts['moves'] / elapsed if elapsed > 0 else 0.0,
+                       percentile(0.5), percentile(0.9), percentile(0.99))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure the game server under many concurrent tables")
+    parser.add_argument('--tables', type=int, default=1000, help="tables played at once")
+    parser.add_argument('--seconds', type=float, default=10.0, help="how long to run")
+    parser.add_argument('--connections', type=int, default=4, help="client connections the tables share")
+    parser.add_argument('--host', default='127.0.0.1', help="server address")
+    parser.add_argument('--port', type=int, default=None, help="load a running server on this port")
+    parser.add_argument('--unix', default=None, help="load a running server on this Unix socket")
+    parser.add_argument('--seed', type=int, default=0, help="seed of the first table's first game")
+    args = parser.parse_args(argv)
+
+    summary = asyncio.run(run_load(args.tables, args.seconds, args.connections, args.host, args.port,
+                                   args.unix, args.seed))
+    print(f"{summary.tables} tables: {summary.moves} moves in {summary.seconds:.2f}s "
+          f"({summary.moves_per_second:.0f} moves/s), {summary.games} games, {summary.errors} errors")
+    print(f"Latency: p50 {summary.p50_ms:.2f} ms, p90 {summary.p90_ms:.2f} ms, p99 {summary.p99_ms:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Legal move generation for GameState.
+
+legal_moves(state) lists every distinct legal move for the player to move:
+    - every playable single card
+    - every same-rank group, once per distinct (first card, top card) pair;
+      the first card is checked against the rules and drives the card
+      effects, the top card decides what can follow, and the order of the
+      cards in between does not matter (they are listed by card id)
+    - Jack plays once per chosen suit
+    - DRAW, either as the optional draw or as the only move when nothing
+      is playable
+
+Covering your own 6 needs nothing special: after a 6 is played the same
+player is still to move and the generator lists the covering moves.
+
+The per-rank move lists are built once for each combination of held and
+playable cards of that rank and cached, so generating moves is a few mask
+operations plus list concatenation.
+"""
+from itertools import combinations
+
+from .card import RANK_MASKS, card_id
+from .state import Move, DRAW
+
+# Maps the bits of one rank (at positions rank - 1 + 13 * suit, shifted down
+# to rank 1) to a 4-bit suit pattern
+_SUIT_PATTERNS = {sum(1 << (13 * suit) for suit in range(4) if pattern >> suit & 1): pattern
+                  for pattern in range(16)}
+
+_PLAY_CACHE = {}
+
+
+def legal_moves(state):
+    """Return the list of legal moves for the player to move (empty if the round is over)"""
+    if state.round_over:
+        return []
+    hand = state.masks[state.current]
+    playable = state.playable_mask() & hand
+    if not playable:
+        return [DRAW]
+
+    moves = []
+    seen_ranks = 0
+    remaining = playable
+    while remaining:
+        low = remaining & -remaining
+        remaining ^= low
+        rank = (low.bit_length() - 1) % 13 + 1
+        if seen_ranks >> rank & 1:
+            continue
+        seen_ranks |= 1 << rank
+        key = (rank,
+               _SUIT_PATTERNS[(hand & RANK_MASKS[rank]) >> (rank - 1)],
+               _SUIT_PATTERNS[(playable & RANK_MASKS[rank]) >> (rank - 1)])
+        plays = _PLAY_CACHE.get(key)
+        if plays is None:
+            plays = _PLAY_CACHE[key] = _build_plays(*key)
+        moves.extend(plays)
+
+    if state.can_optional_draw():
+        moves.append(DRAW)
+    return moves
+
+
+def _build_plays(rank, held, playable):
+    """All distinct plays of one rank given which suits are held and which are playable"""
+    held_ids = [card_id(rank, suit) for suit in range(4) if held >> suit & 1]
+    suits = range(4) if rank == 11 else (None,)
+    plays = []
+    for suit in range(4):
+        if not playable >> suit & 1:
+            continue
+        first = card_id(rank, suit)
+        rest = [other for other in held_ids if other != first]
+        for size in range(len(rest) + 1):
+            for group in combinations(rest, size):
+                for top in (group or (None,)):
+                    middle = tuple(other for other in group if other != top)
+                    cards = (first,) + middle + ((top,) if top is not None else ())
+                    for chosen_suit in suits:
+                        plays.append(Move(cards, chosen_suit))
+    return tuple(plays)
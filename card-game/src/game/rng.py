@@ -0,0 +1,54 @@
+"""
+Seeded random streams for games.
+
+Every Game draws from its own RandomStream instead of the global random
+module, so a game is fully determined by its seed and can be replayed
+bit-for-bit. Streams spawn independent child streams whose seeds are
+derived by hashing the parent seed with a key, which gives each worker
+process, shard or game its own stream without any coordination:
+
+    root = RandomStream(2024)
+    shard = root.child(7)             # same stream in any process
+    game_seed = shard.child(41).seed_value
+    Game(seed=game_seed)              # re-runs game 41 of shard 7
+"""
+import hashlib
+import random
+
+
+def derive_seed(seed, *key):
+    """Derive a 64-bit child seed from a seed and a key path"""
+    text = ':'.join(str(part) for part in (seed,) + key)
+    return int.from_bytes(hashlib.sha256(text.encode()).digest()[:8], 'big')
+
+
+class RandomStream(random.Random):
+    """
+    A random.Random that remembers its seed and can spawn child streams.
+
+    Attributes:
+        seed_value: The seed that recreates this stream
+        spawned: Number of children handed out by spawn()
+    """
+
+    def __init__(self, seed=None):
+        if seed is None:
+            # Follow the global random module, so random.seed() still
+            # controls code that does not pass seeds around
+            seed = random.getrandbits(64)
+        self.seed_value = seed
+        self.spawned = 0
+        super().__init__(seed)
+
+    def child(self, *key):
+        """Return the child stream for a key (the same key always gives the same stream)"""
+        return RandomStream(derive_seed(self.seed_value, *key))
+
+    def spawn(self):
+        """Return the next of a sequence of independent child streams"""
+        child = self.child('spawn', self.spawned)
+        self.spawned += 1
+        return child
+
+    def __repr__(self):
+        return f"RandomStream({self.seed_value})"
@@ -0,0 +1,70 @@
+"""
+Precomputed card legality.
+
+Everything can_play_card depends on reduces to a small key:
+    top      - id of the top table card (0-51), EMPTY_TABLE or NONSTANDARD_TOP
+    enforced - suit index chosen by a Jack (0-3), UNKNOWN_SUIT or NOT_ENFORCED
+    six      - suit index of a 6 the current player must cover (0-3),
+               UNKNOWN_SUIT, SIX_OPPONENT (someone else's 6) or NO_SIX
+
+PLAYABLE_MASKS maps every key to the 52-bit mask of cards that may be
+played, so checking a card is one lookup and an AND with card.bit, and a
+whole hand is checked with an AND against Hand.mask.
+"""
+from .card import CARDS, FULL_MASK, SUIT_MASKS, RANK_MASKS
+
+EMPTY_TABLE = 52
+NONSTANDARD_TOP = 53
+TOP_STATES = 54
+
+UNKNOWN_SUIT = 4
+NOT_ENFORCED = 5
+ENFORCED_STATES = 6
+
+SIX_OPPONENT = 5
+NO_SIX = 6
+SIX_STATES = 7
+
+
+def rule_key(top, enforced, six):
+    """Pack the three rule state components into a PLAYABLE_MASKS index"""
+    return (top * ENFORCED_STATES + enforced) * SIX_STATES + six
+
+
+def legal_mask(top, enforced, six):
+    """
+    Return the mask of playable cards for one rule state. This is the rule
+    set itself; it is only evaluated when building PLAYABLE_MASKS.
+    1. If the table is empty, any card can be played
+    2. Only the player who played a 6 may cover it, with a 6, a card of
+       the 6's suit or any Jack
+    3. Jacks can be played on anything else
+    4. If a suit is enforced by a Jack, only that suit (or a Jack) can follow
+    5. Otherwise the card must match the top card's suit or rank
+    """
+    if top == EMPTY_TABLE:
+        return FULL_MASK
+
+    if six != NO_SIX:
+        if six == SIX_OPPONENT:
+            return 0
+        mask = RANK_MASKS[6] | RANK_MASKS[11]
+        if six != UNKNOWN_SUIT:
+            mask |= SUIT_MASKS[six]
+        return mask
+
+    if enforced != NOT_ENFORCED:
+        if enforced == UNKNOWN_SUIT:
+            return RANK_MASKS[11]
+        return RANK_MASKS[11] | SUIT_MASKS[enforced]
+
+    if top == NONSTANDARD_TOP:
+        return RANK_MASKS[11]
+    top_card = CARDS[top]
+    return RANK_MASKS[11] | SUIT_MASKS[top_card.suit_index] | RANK_MASKS[top_card.rank]
+
+
+PLAYABLE_MASKS = tuple(legal_mask(top, enforced, six)
+                       for top in range(TOP_STATES)
+                       for enforced in range(ENFORCED_STATES)
+                       for six in range(SIX_STATES))
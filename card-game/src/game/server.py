@@ -0,0 +1,328 @@
+"""
+Asyncio game server hosting many tables in one process.
+
+Each table is a headless Game between a client (seat 0) and a bot (seat 1)
+with its own EventBus, random stream and request queue, served by one
+task; nothing is shared between tables. Clients talk JSON lines over TCP
+or a Unix socket. Every request is an object with an "op" and an optional
+"id", which is echoed in the reply so a connection can keep requests for
+many tables in flight:
+
+    {"id": 1, "op": "new", "seed": 7, "bot": "computer", "messages": false}
+    {"id": 2, "op": "play", "table": 1, "cards": [3, 5], "suit": "H"}
+    {"id": 3, "op": "draw", "table": 1}
+    {"id": 4, "op": "state", "table": 1}
+    {"id": 5, "op": "close", "table": 1}
+
+Replies are {"id": ..., "ok": true, "state": {...}} or {"id": ..., "ok":
+false, "error": "..."}. A state holds the client's hand as card ids
+(suit * 13 + rank - 1) and the hand positions it can play, the top card,
+the deck and opponent card counts, the pending effects, the scores, the
+round results since the last reply and, with "messages", the table's
+game messages. Cards are played by hand position, as in Game.play_cards:
+1 to 4 different positions, with "suit" one of H, D, C, S or null.
+Requests are checked in full before the game is changed, and a "table"
+that is not the number of a table this connection opened gets "Unknown
+table".
+
+A play ends the client's turn unless it left a 6 of theirs to cover. A
+draw with a playable card is the optional draw; without one it draws as
+Game.draw_until_playable (or draw_until_six_covered) does, and ends the
+turn if nothing playable came. The bot then moves until it is the
+client's turn again; finished rounds are scored and the next one dealt.
+Search bots ("ismcts") think for their whole time budget on every move,
+so their tables handle requests in a worker thread, and the event loop
+keeps serving the other tables meanwhile.
+
+Run from the src directory:
+    python -m game.server --port 8765
+    python -m game.server --unix /tmp/cardgame.sock
+"""
+import argparse
+import asyncio
+import json
+
+from .events import EventBus, MessageLog
+from .game import Game
+from .simulation import Simulator, first_playable_policy
+from .tournament import CONTESTANTS
+
+CLIENT = 0
+BOT = 1
+
+# Suits a client may name for a Jack (None keeps the Jack's own suit)
+SUITS = (None, 'H', 'D', 'C', 'S')
+
+# Bot turns in a row after which a table is abandoned (see Simulator.max_turns)
+MAX_BOT_TURNS = 1000
+
+# Bots that search for a time budget on each move; their tables handle
+# requests in the loop's default executor instead of on the event loop
+THREADED_BOTS = frozenset({'ismcts'})
+
+
+class TableSession:
+    """
+    One table: a Game, its bot and the queue of requests for it.
+
+    Attributes:
+        table_id: Number of the table within its server
+        game: The headless Game
+        log: MessageLog of the game's messages, or None if not requested
+        results: Round results not yet sent to the client
+        threaded: Whether requests are handled in a worker thread (see THREADED_BOTS)
+    """
+
+    def __init__(self, table_id, seed=None, bot='computer', messages=False):
+        if bot not in CONTESTANTS:
+            raise ValueError(f"Unknown bot {bot!r}")
+        self.table_id = table_id
+        events = EventBus()
+        self.log = events.subscribe(MessageLog()) if messages else None
+        self.game = Game(headless=True, seed=seed, event_bus=events)
+        self.simulator = Simulator([first_playable_policy, CONTESTANTS[bot](self.game.rng.child('bot'))])
+        self.results = []
+        self.threaded = bot in THREADED_BOTS
+        self.requests = asyncio.Queue()
+        self.game.start_game()
+
+    async def run(self):
+        """Serve queued (request, connection) pairs until the table is closed"""
+        while True:
+            request, connection = await self.requests.get()
+            if request is None:
+                return
+            try:
+                if self.threaded:
+                    # Only this task touches the table, so the thread has it to itself
+                    reply = await asyncio.get_running_loop().run_in_executor(None, self.handle, request)
+                else:
+                    reply = self.handle(request)
+            except Exception as error:
+                # A bug in one request must not take the table down with it
+                reply = {'id': request.get('id'), 'ok': False, 'error': f"Internal error: {error!r}"}
+            connection.send(reply)
+
+    def handle(self, request):
+        """Apply one request and return the reply"""
+        op = request.get('op')
+        try:
+            if op == 'play':
+                self.play(request.get('cards'), request.get('suit'))
+            elif op == 'draw':
+                self.draw()
+            elif op not in ('state', 'new'):
+                raise ValueError(f"Unknown op {op!r}")
+        except (ValueError, TypeError) as error:
+            return {'id': request.get('id'), 'ok': False, 'error': str(error)}
+        return {'id': request.get('id'), 'ok': True, 'state': self.state()}
+
+    def _check_turn(self):
+        game = self.game
+        if not game.is_running:
+            raise ValueError("The game is over")
+        if game.current_player_index != CLIENT:
+            raise ValueError("It is not your turn")
+
+    def play(self, cards, suit=None):
+        """Play the cards at the given hand positions"""
+        self._check_turn()
+        game = self.game
+        player = game.players[CLIENT]
+        # Check everything before touching the game: play_cards changes it as it goes
+        if (not isinstance(cards, list) or not 1 <= len(cards) <= 4
+                or not all(type(index) is int and 0 <= index < len(player.hand) for index in cards)
+                or len(set(cards)) != len(cards)):
+            raise ValueError("cards must be a list of 1 to 4 different hand positions")
+        if suit not in SUITS:
+            raise ValueError(f"suit must be one of {', '.join(str(allowed) for allowed in SUITS)}")
+        if not game.play_cards(player, cards, suit):
+            raise ValueError("Illegal move")
+        # Only a player covering their own 6 continues the turn
+        effects = game.effects
+        self._advance(not (effects.requires_six and effects.six_owner == CLIENT and player.hand))
+
+    def draw(self):
+        """Take the optional draw, or draw for a turn without a playable card"""
+        self._check_turn()
+        game = self.game
+        player = game.players[CLIENT]
+        if game.has_valid_play(player):
+            if game.optional_draw_used:
+                raise ValueError("The optional draw is already used this turn")
+            if len(game.deck) == 0:
+                raise ValueError("The deck is empty")
+            game.draw_card_for(player, optional=True)
+            game.optional_draw_used = True
+            self._advance(False)
+        elif game.effects.requires_six:
+            self._advance(not game.draw_until_six_covered(player))
+        else:
+            self._advance(not game.draw_until_playable(player))
+
+    def _advance(self, turn_over):
+        """Score a finished round, or end the client's turn and let the bot move"""
+        game = self.game
+        if not game.check_round_over() and turn_over:
+            for _ in range(MAX_BOT_TURNS):
+                game.step()
+                if game.round_over or game.current_player_index == CLIENT:
+                    break
+                self.simulator.play_turn(game, BOT)
+                if game.check_round_over():
+                    break
+            else:
+                game.is_running = False
+                self.results.append({'round': game.round_number, 'abandoned': True})
+                return
+        if game.round_over:
+            self.results.append({'round': game.round_number, 'points': [player.points for player in game.players],
+                                 'message': game.round_end_message})
+            if game.is_running:
+                game.start_new_round()
+
+    def state(self):
+        """The client's view of the table"""
+        game = self.game
+        player, bot = game.players
+        effects = game.effects
+        turn = game.is_running and game.current_player_index == CLIENT
+        playable = game.playable_mask() if turn else 0
+        state = {
+            'table': self.table_id,
+            'hand': [card.id for card in player.hand],
+            'playable': [i for i, card in enumerate(player.hand) if card.bit & playable],
+            'top': game.table_cards[-1].id if game.table_cards else None,
+            'deck': len(game.deck),
+            'opponent': len(bot.hand),
+            'turn': turn,
+            'optional_draw_used': game.optional_draw_used,
+            'suit': effects.chosen_suit if effects.suit_enforced else None,
+            'six': effects.requires_six,
+            'points': [player.points, bot.points],
+            'round': game.round_number,
+            'running': game.is_running,
+            'rounds': self.results,
+        }
+        self.results = []
+        if self.log is not None:
+            state['messages'] = list(self.log.entries)
+            self.log.clear()
+        return state
+
+
+class Connection:
+    """A client connection and the tables it opened"""
+
+    def __init__(self, writer):
+        self.writer = writer
+        self.tables = set()
+
+    def send(self, reply):
+        if not self.writer.is_closing():
+            self.writer.write(json.dumps(reply, separators=(',', ':')).encode() + b'\n')
+
+
+class GameServer:
+    """
+    Routes JSON-lines requests to TableSessions.
+
+    Attributes:
+        tables: Open TableSessions by table id
+        requests: Requests received so far
+    """
+
+    def __init__(self):
+        self.tables = {}
+        self.requests = 0
+        self._next_table = 1
+        self._tasks = {}
+
+    async def start(self, host='127.0.0.1', port=8765):
+        """Listen on TCP and return the asyncio Server"""
+        return await asyncio.start_server(self._serve_client, host, port)
+
+    async def start_unix(self, path):
+        """Listen on a Unix socket and return the asyncio Server"""
+        return await asyncio.start_unix_server(self._serve_client, path)
+
+    async def _serve_client(self, reader, writer):
+        connection = Connection(writer)
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                    if not isinstance(request, dict):
+                        raise ValueError("A request must be a JSON object")
+                except ValueError as error:
+                    connection.send({'id': None, 'ok': False, 'error': str(error)})
+                    continue
+                self.dispatch(request, connection)
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            for table_id in list(connection.tables):
+                self.close_table(table_id)
+            writer.close()
+
+    def dispatch(self, request, connection):
+        """Queue a request on its table (or open a new table)"""
+        self.requests += 1
+        op = request.get('op')
+        if op == 'new':
+            try:
+                session = TableSession(self._next_table, request.get('seed'), request.get('bot', 'computer'),
+                                       bool(request.get('messages')))
+            except (ValueError, TypeError) as error:
+                connection.send({'id': request.get('id'), 'ok': False, 'error': str(error)})
+                return
+            self._next_table += 1
+            self.tables[session.table_id] = session
+            self._tasks[session.table_id] = asyncio.get_running_loop().create_task(session.run())
+            connection.tables.add(session.table_id)
+        else:
+            table_id = request.get('table')
+            session = self.tables.get(table_id) if type(table_id) is int else None
+            if session is None or session.table_id not in connection.tables:
+                connection.send({'id': request.get('id'), 'ok': False, 'error': "Unknown table"})
+                return
+            if op == 'close':
+                self.close_table(session.table_id)
+                connection.tables.discard(session.table_id)
+                connection.send({'id': request.get('id'), 'ok': True})
+                return
+        session.requests.put_nowait((request, connection))
+
+    def close_table(self, table_id):
+        session = self.tables.pop(table_id, None)
+        if session is not None:
+            session.requests.put_nowait((None, None))
+            self._tasks.pop(table_id, None)
+
+
+async def serve(host='127.0.0.1', port=8765, unix=None):
+    server = GameServer()
+    listener = await (server.start_unix(unix) if unix else server.start(host, port))
+    async with listener:
+        await listener.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve many card game tables over JSON lines")
+    parser.add_argument('--host', default='127.0.0.1', help="TCP address to listen on")
+    parser.add_argument('--port', type=int, default=8765, help="TCP port to listen on")
+    parser.add_argument('--unix', default=None, help="listen on this Unix socket path instead of TCP")
+    args = parser.parse_args(argv)
+    print(f"Serving on {args.unix or f'{args.host}:{args.port}'}")
+    try:
+        asyncio.run(serve(args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+"""
+Headless batch simulation of complete matches.
+
+Plays whole games (until a player passes 125 points) between two
+programmatic players on top of the regular Game rules, without pygame,
+console output or per-event message formatting. Intended for AI tuning
+and rule balancing where hundreds of thousands of games are needed.
+
+Run from the src directory:
+    python -m game.simulation --games 10000
+"""
+import argparse
+import time
+from collections import Counter, namedtuple
+
+from .game import Game
+from .rng import RandomStream
+
+# Compact record of one finished match. winner is the seat index (0 or 1)
+# of the player with fewer points, or None for a tie or an abandoned match.
+# seed replays the match: Simulator(policies).play_match(seed=result.seed).
+MatchResult = namedtuple('MatchResult', ['winner', 'points', 'rounds', 'turns', 'seed'])
+MatchResult.__new__.__defaults__ = (None,)
+
+# Aggregate of a batch run; games_per_second is the headline metric.
+BatchSummary = namedtuple('BatchSummary', ['games', 'wins', 'abandoned', 'seconds', 'games_per_second'])
+
+
+def first_playable_policy(game, player):
+    """
+    Baseline policy: play the first playable card together with every
+    other card of the same rank that can follow it.
+
+    A policy receives the game and the player to move, and returns a
+    (card_indices, chosen_suit) pair suitable for Game.play_cards. It is
+    only called when the player has at least one playable card.
+    """
+    hand = player.hand
+    playable = game.playable_mask()
+    for i, card in enumerate(hand):
+        if not card.bit & playable:
+            continue
+        # play_cards checks the card with the highest index, so only group
+        # same-rank cards up to the last playable one of this rank
+        last = i
+        for j in range(i + 1, len(hand)):
+            if hand[j].rank == card.rank and hand[j].bit & playable:
+                last = j
+        indices = [j for j in range(last + 1) if hand[j].rank == card.rank]
+        chosen_suit = most_common_suit(hand, exclude_rank=11) if card.rank == 11 else None
+        return indices, chosen_suit
+    return None
+
+
+def computer_policy(game, player):
+    """
+    The built-in computer_turn heuristic as a policy for either seat.
+
+    Unlike move policies it plays the whole turn itself (draws, optional
+    draw and 6-covering included), which the plays_whole_turn flag tells
+    Simulator.play_turn.
+    """
+    game.computer_turn(player)
+
+computer_policy.plays_whole_turn = True
+
+
+def most_common_suit(hand, exclude_rank=None):
+    """Return the most frequent suit in a hand, ignoring cards of exclude_rank"""
+    counts = Counter(card.suit for card in hand if card.rank != exclude_rank)
+    if not counts:
+        return hand[0].suit if hand else None
+    return counts.most_common(1)[0][0]
+
+
+class Simulator:
+    """
+    Drives complete headless matches between two policies.
+
+    Attributes:
+        policies: Pair of policy callables, one per seat
+        max_turns: Safety limit on turns per match; longer matches are abandoned
+    """
+
+    def __init__(self, policies=None, max_turns=5000):
+        self.policies = list(policies) if policies else [first_playable_policy, first_playable_policy]
+        self.max_turns = max_turns
+
+    def play_match(self, seed=None):
+        """
+        Play one complete match and return its MatchResult. The same seed
+        (and deterministic policies) replays the same match.
+        """
+        game = Game(headless=True, seed=seed)
+        game.start_game()
+        turns = 0
+
+        while game.is_running:
+            if turns >= self.max_turns:
+                return MatchResult(None, self._points(game), game.round_number, turns, game.seed)
+
+            self.play_turn(game, game.current_player_index)
+            turns += 1
+            game.step()
+
+            if game.round_over and game.is_running:
+                game.start_new_round()
+
+        points = self._points(game)
+        if points[0] == points[1]:
+            winner = None
+        else:
+            winner = 0 if points[0] < points[1] else 1
+        return MatchResult(winner, points, game.round_number, turns, game.seed)
+
+    def play_turn(self, game, index):
+        """
+        Play a single turn for the player at the given seat.
+
+        Mirrors the computer's turn structure: draw when nothing is
+        playable, play the policy's move, and keep playing while the
+        player has to cover their own 6.
+        """
+        player = game.players[index]
+        policy = self.policies[index]
+        if getattr(policy, 'plays_whole_turn', False):
+            policy(game, player)
+            return
+
+        while player.hand:
+            if not game.has_valid_play(player):
+                if game.effects.requires_six:
+                    found = game.draw_until_six_covered(player)
+                else:
+                    found = game.draw_until_playable(player)
+                if not found:
+                    return
+
+            card_indices, chosen_suit = policy(game, player)
+            if not game.play_cards(player, card_indices, chosen_suit):
+                raise ValueError(f"Policy for seat {index} returned an illegal move: {card_indices}")
+
+            # Only a player covering their own 6 continues the turn
+            effects = game.effects
+            if not (effects.requires_six and effects.six_owner == index):
+                return
+
+    def run(self, games, seed=None):
+        """
+        Play a batch of matches and return a BatchSummary. Each match gets
+        its own stream spawned from seed.
+        """
+        stream = RandomStream(seed)
+        wins = [0, 0]
+        abandoned = 0
+        start = time.perf_counter()
+        for _ in range(games):
+            result = self.play_match(stream.spawn().seed_value)
+            if result.winner is not None:
+                wins[result.winner] += 1
+            elif result.turns >= self.max_turns:
+                abandoned += 1
+        seconds = time.perf_counter() - start
+        rate = games / seconds if seconds > 0 else float('inf')
+        return BatchSummary(games, tuple(wins), abandoned, seconds, rate)
+
+    @staticmethod
+    def _points(game):
+        return (game.players[0].points, game.players[1].points)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run headless card game simulations")
+    parser.add_argument('--games', type=int, default=1000, help="number of matches to play")
+    parser.add_argument('--seed', type=int, default=None, help="seed for reproducible runs")
+    args = parser.parse_args(argv)
+
+    summary = Simulator().run(args.games, args.seed)
+    print(f"Played {summary.games} games in {summary.seconds:.2f}s "
+          f"({summary.games_per_second:.1f} games/s)")
+    print(f"Wins: seat 0 = {summary.wins[0]}, seat 1 = {summary.wins[1]}, abandoned = {summary.abandoned}")
+
+
+if __name__ == "__main__":
+    main()
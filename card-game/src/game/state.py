@@ -0,0 +1,415 @@
+"""
+Immutable game state snapshots for search and what-if analysis.
+
+GameState holds only rule state: hands, deck order, table pile, pending
+effects, multiplier, scores and whose turn it is, all as ints and tuples
+of card ids. It carries no Player objects, GUI callbacks or mutable
+dicts, so sharing one between search branches is free and applying a
+move to get a new state takes microseconds.
+
+A turn is a sequence of moves by the current player:
+    Move(cards, suit) - play same-rank cards; cards are card ids in the
+                        order they land on the table (the first card is the
+                        one checked against the rules, the last ends on top)
+                        and suit is the suit index chosen for Jacks
+    DRAW              - the optional draw (once per turn, while a card is
+                        playable), or the forced draw when nothing is
+                        playable (draw_until_playable / draw_until_six_covered)
+
+Turn changes, forced effect draws, skips and round scoring follow
+Game.next_turn and Game.check_round_over. Reshuffles are driven by the
+state's own seed, so apply() is a pure function of (state, move).
+"""
+from collections import namedtuple
+
+from .card import CARDS, SUITS, SUIT_CODES, SUIT_INDEX, RANK_MASKS
+from .deck import Deck, seeded_shuffle
+from .hand import RANK_POINTS
+from .rules import PLAYABLE_MASKS, rule_key, EMPTY_TABLE, UNKNOWN_SUIT, NOT_ENFORCED, SIX_OPPONENT, NO_SIX
+from .zobrist import HAND_KEYS, TOP_KEYS, cards_hash, fields_hash
+
+Move = namedtuple('Move', ['cards', 'suit'])
+Move.__new__.__defaults__ = (None,)
+
+DRAW = Move((), None)
+
+WINNING_SCORE = 125
+MAX_SIX_COVER_DRAWS = 10
+
+
+class GameState:
+    """
+    A snapshot of the rule state of a two-player round. States are treated
+    as immutable values: apply() works on a fresh copy and never modifies
+    the state it is called on.
+
+    Attributes:
+        hands: Pair of tuples of card ids, in hand order
+        masks: Pair of card bitmasks matching hands
+        deck: Tuple of card ids; cards are drawn from the end
+        table: Tuple of card ids; the last one is the top card
+        current: Index of the player to move
+        draw_cards: Cards the next player must draw
+        skip_turn: Whether the next player skips their turn
+        requires_six: Whether a 6 must be covered
+        six_chain: Number of 6s played in sequence
+        six_owner: Index of the player who must cover the 6, or None
+        six_suit: Suit index of the 6 to cover, or None
+        enforced_suit: Suit index chosen by a Jack, or None if no suit is enforced
+        optional_draw_used: Whether the current player used their optional draw
+        multiplier: Point multiplier (increases with each reshuffle)
+        points: Pair of player scores
+        round_number: Current round number
+        round_over: Whether the round has been scored
+        game_over: Whether a player has passed the winning score
+        seed: Seed for the next reshuffle
+        card_hash: Zobrist hash of the hands and top card, kept up to date
+                   as cards move (see zobrist_hash)
+    """
+    FIELDS = ('hands', 'masks', 'deck', 'table', 'current', 'draw_cards', 'skip_turn',
+              'requires_six', 'six_chain', 'six_owner', 'six_suit', 'enforced_suit',
+              'optional_draw_used', 'multiplier', 'points', 'round_number',
+              'round_over', 'game_over', 'seed', 'card_hash')
+    __slots__ = FIELDS + ('_hash',)
+
+    def __eq__(self, other):
+        if not isinstance(other, GameState):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in GameState.FIELDS)
+
+    def zobrist_hash(self):
+        """64-bit Zobrist hash of the rule state (see the zobrist module)"""
+        # Computed once per state: apply() and replace() only change fresh clones
+        value = self._hash
+        if value is None:
+            value = self._hash = self.card_hash ^ fields_hash(self)
+        return value
+
+    __hash__ = zobrist_hash
+
+    @property
+    def trailing_jacks(self):
+        """Number of consecutive Jacks at the top of the table (as Table.trailing_jacks)"""
+        count = 0
+        for card_id in reversed(self.table):
+            if not (1 << card_id) & RANK_MASKS[11]:
+                break
+            count += 1
+        return count
+
+    def _clone(self):
+        # Copy-on-write: apply() clones, then only ever modifies the clone
+        new = object.__new__(GameState)
+        new.hands = self.hands
+        new.masks = self.masks
+        new.deck = self.deck
+        new.table = self.table
+        new.current = self.current
+        new.draw_cards = self.draw_cards
+        new.skip_turn = self.skip_turn
+        new.requires_six = self.requires_six
+        new.six_chain = self.six_chain
+        new.six_owner = self.six_owner
+        new.six_suit = self.six_suit
+        new.enforced_suit = self.enforced_suit
+        new.optional_draw_used = self.optional_draw_used
+        new.multiplier = self.multiplier
+        new.points = self.points
+        new.round_number = self.round_number
+        new.round_over = self.round_over
+        new.game_over = self.game_over
+        new.seed = self.seed
+        new.card_hash = self.card_hash
+        new._hash = None
+        return new
+
+    @classmethod
+    def from_game(cls, game, seed=None):
+        """
+        Snapshot a live Game. seed drives reshuffles in apply(); by default
+        it is the game's own reshuffle seed, so apply() reshuffles exactly
+        as the game will.
+        """
+        effects = game.effects
+        players = game.players
+        state = object.__new__(cls)
+        hands = tuple(tuple(card.id for card in player.hand) for player in players)
+        enforced = None
+        if effects.suit_enforced and effects.chosen_suit:
+            enforced = SUIT_INDEX.get(effects.chosen_suit, UNKNOWN_SUIT)
+        values = {
+            'hands': hands,
+            'masks': tuple(player.hand.mask for player in players),
+            'deck': tuple(card.id for card in game.deck.cards) if game.deck is not None else (),
+            'table': tuple(card.id for card in game.table_cards),
+            'current': game.current_player_index,
+            'draw_cards': effects.draw_cards,
+            'skip_turn': effects.skip_turn,
+            'requires_six': effects.requires_six,
+            'six_chain': effects.six_chain,
+            'six_owner': effects.six_owner,
+            'six_suit': SUIT_INDEX.get(effects.six_suit),
+            'enforced_suit': enforced,
+            'optional_draw_used': game.optional_draw_used,
+            'multiplier': game.point_multiplier,
+            'points': tuple(player.points for player in players),
+            'round_number': game.round_number,
+            'round_over': game.round_over,
+            'game_over': game.round_over and not game.is_running,
+            'seed': game.reshuffle_seed if seed is None else seed,
+        }
+        values['card_hash'] = cards_hash(values['masks'], values['table'])
+        for name, value in values.items():
+            setattr(state, name, value)
+        state._hash = None
+        return state
+
+    def restore(self, game):
+        """Write this state into a live Game (which must already have its two players)"""
+        for player, ids, points in zip(game.players, self.hands, self.points):
+            player.hand = [CARDS[card_id] for card_id in ids]
+            player.points = points
+        if game.deck is None:
+            game.deck = Deck(game.rng)
+        game.deck.cards = [CARDS[card_id] for card_id in self.deck]
+        game.table_cards = [CARDS[card_id] for card_id in self.table]
+        enforced = self.enforced_suit
+        effects = game.effects
+        effects.reset()
+        effects.draw_cards = self.draw_cards
+        effects.skip_turn = self.skip_turn
+        effects.requires_six = self.requires_six
+        effects.six_chain = self.six_chain
+        effects.six_owner = self.six_owner
+        effects.six_suit = SUITS[self.six_suit] if self.six_suit is not None else None
+        effects.chosen_suit = SUIT_CODES[enforced] if enforced is not None and enforced < 4 else None
+        effects.suit_enforced = enforced is not None
+        game.current_player_index = self.current
+        game.is_human_turn = self.current == 0
+        game.optional_draw_used = self.optional_draw_used
+        game.must_draw = False
+        game.point_multiplier = self.multiplier
+        game.reshuffle_seed = self.seed
+        game.round_number = self.round_number
+        game.round_over = self.round_over
+        game.is_running = not self.game_over
+
+    def replace(self, **fields):
+        """Return a copy with some fields replaced (masks must be kept consistent with hands)"""
+        state = self._clone()
+        for name, value in fields.items():
+            if name not in GameState.FIELDS:
+                raise AttributeError(f"GameState has no field {name!r}")
+            setattr(state, name, value)
+        if 'masks' in fields or 'table' in fields:
+            state.card_hash = cards_hash(state.masks, state.table)
+        return state
+
+    def rule_key(self):
+        """Key of this state in rules.PLAYABLE_MASKS (see Game.rule_key)"""
+        top = self.table[-1] if self.table else EMPTY_TABLE
+        if self.requires_six:
+            if self.six_owner != self.current:
+                six = SIX_OPPONENT
+            else:
+                six = self.six_suit if self.six_suit is not None else UNKNOWN_SUIT
+        else:
+            six = NO_SIX
+        enforced = self.enforced_suit if self.enforced_suit is not None else NOT_ENFORCED
+        return rule_key(top, enforced, six)
+
+    def playable_mask(self):
+        """Mask of the cards the current player may play"""
+        return PLAYABLE_MASKS[self.rule_key()]
+
+    def must_cover_six(self):
+        """Whether the current player is covering their own 6 (and so keeps the turn)"""
+        return self.requires_six and self.six_owner == self.current
+
+    def can_optional_draw(self):
+        """Whether the current player may take their optional draw"""
+        return (not self.optional_draw_used and bool(self.deck)
+                and not self.must_cover_six()
+                and bool(self.playable_mask() & self.masks[self.current]))
+
+    def apply(self, move):
+        """
+        Return the state after the current player makes a move. Raises
+        ValueError if the move is not legal.
+        """
+        if self.round_over:
+            raise ValueError("The round is over")
+        state = self._clone()
+        player = state.current
+
+        if not move.cards:
+            if state.playable_mask() & state.masks[player]:
+                if not state.can_optional_draw():
+                    raise ValueError("Optional draw is not available")
+                state._draw(player)
+                state.optional_draw_used = True
+                return state
+            # Nothing playable: forced draw, which may end the turn
+            if state.requires_six:
+                found = state._draw_until_six_covered(player)
+            else:
+                found = state._draw_until_playable(player)
+            if not found:
+                state._end_turn()
+            return state
+
+        state._play(player, move)
+        if state.must_cover_six() and state.hands[player]:
+            return state
+        state._end_turn()
+        return state
+
+    def _play(self, player, move):
+        cards = move.cards
+        first = CARDS[cards[0]]
+        bits = 0
+        for card_id in cards:
+            card = CARDS[card_id]
+            if card.rank != first.rank:
+                raise ValueError("All cards played together must be of the same rank")
+            bits |= card.bit
+        hand_mask = self.masks[player]
+        if bits & hand_mask != bits or len(set(cards)) != len(cards):
+            raise ValueError("Cards are not in the player's hand")
+        if not PLAYABLE_MASKS[self.rule_key()] & first.bit:
+            raise ValueError(f"{first} cannot be played")
+
+        self._set_hand(player, tuple(card_id for card_id in self.hands[player] if not (1 << card_id) & bits),
+                       hand_mask & ~bits)
+        self.card_hash ^= TOP_KEYS[self.table[-1] if self.table else EMPTY_TABLE] ^ TOP_KEYS[cards[-1]]
+        self.table = self.table + tuple(cards)
+        self._apply_card_effects(first, player, len(cards), move.suit)
+
+    def _apply_card_effects(self, card, player, count, chosen_suit):
+        # Mirrors Game.apply_card_effects; card is the first card played
+        rank = card.rank
+        if rank != 11 and self.enforced_suit is not None and card.suit_index == self.enforced_suit:
+            self.enforced_suit = None
+
+        if self.requires_six and rank != 6:
+            self.requires_six = False
+            self.six_chain = 0
+            self.six_owner = None
+            self.six_suit = None
+
+        if rank == 8:
+            self.draw_cards = self.draw_cards + 2 * count
+            self.skip_turn = True
+        elif rank == 7:
+            self.draw_cards = self.draw_cards + count
+        elif rank == 1:
+            self.skip_turn = True
+        elif rank == 6:
+            self.requires_six = True
+            self.six_chain = self.six_chain + count
+            self.six_owner = player
+            self.six_suit = card.suit_index
+        elif rank == 11:
+            self.enforced_suit = chosen_suit if chosen_suit is not None else card.suit_index
+
+    def _set_hand(self, player, hand, mask):
+        # Update the hash for the cards that came or went (hand_delta, inlined)
+        changed = self.masks[player] ^ mask
+        keys = HAND_KEYS[player]
+        card_hash = self.card_hash
+        while changed:
+            low = changed & -changed
+            card_hash ^= keys[low.bit_length() - 1]
+            changed ^= low
+        self.card_hash = card_hash
+        if player:
+            self.hands = (self.hands[0], hand)
+            self.masks = (self.masks[0], mask)
+        else:
+            self.hands = (hand, self.hands[1])
+            self.masks = (mask, self.masks[1])
+
+    def _draw(self, player):
+        card_id = self.deck[-1]
+        self.deck = self.deck[:-1]
+        self._set_hand(player, self.hands[player] + (card_id,), self.masks[player] | (1 << card_id))
+        return card_id
+
+    def _reshuffle(self):
+        # Mirrors Game.reshuffle_table_cards
+        if len(self.table) <= 1:
+            return False
+        cards, self.seed = seeded_shuffle(self.table[:-1], self.seed)
+        self.deck = tuple(cards)
+        self.table = self.table[-1:]
+        self.multiplier = self.multiplier + 1
+        return True
+
+    def _draw_until_playable(self, player):
+        if not self.deck and not self._reshuffle():
+            return False
+        card_id = self._draw(player)
+        return bool(self.playable_mask() & (1 << card_id))
+
+    def _draw_until_six_covered(self, player):
+        for _ in range(MAX_SIX_COVER_DRAWS):
+            if not self.deck and not self._reshuffle():
+                return False
+            card_id = self._draw(player)
+            if self.playable_mask() & (1 << card_id):
+                return True
+        return False
+
+    def _end_turn(self):
+        # Mirrors Game.next_turn for two externally driven players
+        if self._check_round_over():
+            return
+        self.current = self.current ^ 1
+        self.optional_draw_used = False
+        if self.draw_cards > 0:
+            for _ in range(self.draw_cards):
+                if self.deck or self._reshuffle():
+                    self._draw(self.current)
+                else:
+                    break
+            self.draw_cards = 0
+        if self.skip_turn:
+            self.skip_turn = False
+            self.current = self.current ^ 1
+
+    def _check_round_over(self):
+        # Mirrors Game.check_round_over
+        for winner in (0, 1):
+            if self.hands[winner]:
+                continue
+            loser = winner ^ 1
+            jack_count = self.trailing_jacks
+            points = list(self.points)
+            points[loser] += hand_points(self.hands[loser]) * self.multiplier
+            points[winner] -= 20 * jack_count * self.multiplier
+            self._finish_round(points, points[loser] > WINNING_SCORE)
+            return True
+
+        if not self.deck:
+            playable = self.playable_mask()
+            if not playable & self.masks[0] and not playable & self.masks[1]:
+                points = [self.points[0] + hand_points(self.hands[1]) * self.multiplier,
+                          self.points[1] + hand_points(self.hands[0]) * self.multiplier]
+                self._finish_round(points, max(points) > WINNING_SCORE)
+                return True
+        return False
+
+    def _finish_round(self, points, game_over):
+        self.points = tuple(points)
+        self.round_over = True
+        self.game_over = game_over
+
+
+def hand_points(card_ids):
+    """Total points of a tuple of card ids (see Player.calculate_hand_points)"""
+    return sum(RANK_POINTS.get(CARDS[card_id].rank, 0) for card_id in card_ids)
+
+
+def apply_move(state, move):
+    """Return the state after applying move (see GameState.apply)"""
+    return state.apply(move)
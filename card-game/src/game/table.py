@@ -0,0 +1,75 @@
+class Table(list):
+    """
+    The cards on the table, oldest first: an ordinary list that also keeps
+    the length of the run of Jacks on top, updated as cards are played.
+
+    A player who goes out on Jacks gets a bonus for every Jack in that run
+    (see Game.check_round_over), so scoring a round reads trailing_jacks
+    instead of walking the table.
+
+    Attributes:
+        trailing_jacks: Number of consecutive Jacks at the top of the table
+    """
+    __slots__ = ('trailing_jacks',)
+
+    def __init__(self, cards=()):
+        super().__init__(cards)
+        self._rebuild()
+
+    def __reduce__(self):
+        return (Table, (list(self),))
+
+    def _rebuild(self):
+        count = 0
+        for card in reversed(self):
+            if card.rank != 11:
+                break
+            count += 1
+        self.trailing_jacks = count
+
+    def append(self, card):
+        super().append(card)
+        self.trailing_jacks = self.trailing_jacks + 1 if card.rank == 11 else 0
+
+    def extend(self, cards):
+        for card in cards:
+            self.append(card)
+
+    def __iadd__(self, cards):
+        self.extend(cards)
+        return self
+
+    def pop(self, index=-1):
+        top = index == -1 or index == len(self) - 1
+        card = super().pop(index)
+        if top and self.trailing_jacks:
+            # Taking a Jack off the top shortens the run by one
+            self.trailing_jacks -= 1
+        else:
+            self._rebuild()
+        return card
+
+    def insert(self, index, card):
+        super().insert(index, card)
+        self._rebuild()
+
+    def remove(self, card):
+        super().remove(card)
+        self._rebuild()
+
+    def clear(self):
+        super().clear()
+        self.trailing_jacks = 0
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self._rebuild()
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._rebuild()
+
+    def __imul__(self, count):
+        super().__imul__(count)
+        self._rebuild()
+        return self
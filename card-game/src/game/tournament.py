@@ -0,0 +1,191 @@
+"""
+Multi-process tournaments between two contestants.
+
+Matches are split into fixed-size shards that run in a process pool. Each
+shard takes its own child RandomStream of the tournament seed and spawns
+one stream per match, so results only depend on the seed and shard size, not on the
+number of workers or the order shards finish in (time-budgeted searchers
+such as ismcts are the exception). Workers send back small
+Standings totals rather than match lists, and the parent merges them as
+they arrive.
+
+Contestants alternate seats from game to game, so neither one always
+gets the first move.
+
+Run from the src directory:
+    python -m game.tournament --games 100000 --workers 8 computer first-playable
+"""
+import argparse
+import os
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from .ismcts import ISMCTSPlayer
+from .rng import RandomStream
+from .simulation import Simulator, computer_policy, first_playable_policy
+
+# Contestants are passed to workers by name so nothing needs to be pickled;
+# each shard calls the factory with its random stream
+CONTESTANTS = {
+    'computer': lambda rng: computer_policy,
+    'first-playable': lambda rng: first_playable_policy,
+    'ismcts': lambda rng: ISMCTSPlayer(budget=0.2, seed=rng.getrandbits(64)),
+}
+
+# Final results; every per-contestant field is a pair in contestant order.
+# Averages are over finished matches (abandoned ones are only counted).
+TournamentSummary = namedtuple('TournamentSummary', [
+    'contestants', 'games', 'wins', 'draws', 'abandoned',
+    'win_rates', 'average_points', 'average_rounds', 'seconds', 'games_per_second',
+])
+
+
+class Standings:
+    """
+    Running totals for a tournament or one shard of it.
+
+    Attributes:
+        games: Matches played
+        wins: Wins per contestant
+        draws: Finished matches with equal points
+        abandoned: Matches stopped at the turn limit
+        points: Total points per contestant in finished matches
+        rounds: Total rounds played in finished matches
+    """
+    __slots__ = ('games', 'wins', 'draws', 'abandoned', 'points', 'rounds')
+
+    def __init__(self):
+        self.games = 0
+        self.wins = [0, 0]
+        self.draws = 0
+        self.abandoned = 0
+        self.points = [0, 0]
+        self.rounds = 0
+
+    def add(self, result, swapped=False, abandoned=False):
+        """
+        Record one MatchResult.
+
+        Args:
+            result: MatchResult from Simulator.play_match
+            swapped: True if the second contestant sat in seat 0
+            abandoned: True if the match hit the turn limit
+        """
+        seats = (1, 0) if swapped else (0, 1)
+        self.games += 1
+        if abandoned and result.winner is None:
+            # A stalled match's partial scores would skew the averages
+            self.abandoned += 1
+            return
+        self.rounds += result.rounds
+        self.points[0] += result.points[seats[0]]
+        self.points[1] += result.points[seats[1]]
+        if result.winner is not None:
+            self.wins[seats.index(result.winner)] += 1
+        else:
+            self.draws += 1
+
+    def merge(self, other):
+        """Add another Standings' totals to this one"""
+        self.games += other.games
+        self.draws += other.draws
+        self.abandoned += other.abandoned
+        self.rounds += other.rounds
+        for i in (0, 1):
+            self.wins[i] += other.wins[i]
+            self.points[i] += other.points[i]
+
+    def summary(self, contestants, seconds):
+        """Return a TournamentSummary of the totals so far"""
+        games = self.games or 1
+        finished = (self.games - self.abandoned) or 1
+        rate = self.games / seconds if seconds > 0 else float('inf')
+        return TournamentSummary(
+            tuple(contestants), self.games, tuple(self.wins), self.draws, self.abandoned,
+            tuple(wins / games for wins in self.wins),
+            tuple(points / finished for points in self.points),
+            self.rounds / finished, seconds, rate)
+
+
+def play_shard(contestants, seed, shard, games, max_turns=5000):
+    """
+    Play one shard of a tournament and return its Standings.
+
+    Match i of the shard is played with the seed of
+    RandomStream(seed).child(shard).spawn() called i + 1 times, so any match
+    can be replayed on its own.
+    """
+    stream = RandomStream(seed).child(shard)
+    policies = [CONTESTANTS[name](stream) for name in contestants]
+    simulators = (Simulator(policies, max_turns), Simulator(policies[::-1], max_turns))
+    standings = Standings()
+    for i in range(games):
+        swapped = i % 2 == 1
+        result = simulators[swapped].play_match(stream.spawn().seed_value)
+        standings.add(result, swapped, result.winner is None and result.turns >= max_turns)
+    return standings
+
+
+def run_tournament(contestants=('computer', 'first-playable'), games=1000, workers=None,
+                   seed=0, shard_size=200, max_turns=5000, on_progress=None):
+    """
+    Play a tournament between two named contestants and return a TournamentSummary.
+
+    Args:
+        contestants: Pair of names from CONTESTANTS
+        games: Number of matches to play
+        workers: Number of worker processes (defaults to the CPU count; 1 runs in-process)
+        seed: Tournament seed; the same seed and shard size give the same results
+        shard_size: Matches per shard
+        max_turns: Turn limit per match
+        on_progress: Optional callable receiving the merged Standings after each shard
+    """
+    for name in contestants:
+        if name not in CONTESTANTS:
+            raise ValueError(f"Unknown contestant {name!r}; choose from {', '.join(CONTESTANTS)}")
+    contestants = tuple(contestants)
+    shards = [(shard, min(shard_size, games - start))
+              for shard, start in enumerate(range(0, games, shard_size))]
+    workers = workers or os.cpu_count() or 1
+    standings = Standings()
+    start = time.perf_counter()
+
+    if workers == 1:
+        for shard, count in shards:
+            standings.merge(play_shard(contestants, seed, shard, count, max_turns))
+            if on_progress:
+                on_progress(standings)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(play_shard, contestants, seed, shard, count, max_turns)
+                       for shard, count in shards]
+            for future in as_completed(futures):
+                standings.merge(future.result())
+                if on_progress:
+                    on_progress(standings)
+
+    return standings.summary(contestants, time.perf_counter() - start)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run a multi-process tournament between two contestants")
+    parser.add_argument('contestants', nargs=2, choices=sorted(CONTESTANTS), help="the two contestants")
+    parser.add_argument('--games', type=int, default=10000, help="number of matches to play")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument('--seed', type=int, default=0, help="tournament seed")
+    parser.add_argument('--shard-size', type=int, default=200, help="matches per worker task")
+    args = parser.parse_args(argv)
+
+    summary = run_tournament(args.contestants, args.games, args.workers, args.seed, args.shard_size)
+    print(f"Played {summary.games} games in {summary.seconds:.2f}s "
+          f"({summary.games_per_second:.1f} games/s)")
+    for i, name in enumerate(summary.contestants):
+        print(f"{name}: {summary.wins[i]} wins ({summary.win_rates[i]:.1%}), "
+              f"{summary.average_points[i]:.1f} points per game")
+    print(f"Draws: {summary.draws}, abandoned: {summary.abandoned}, "
+          f"{summary.average_rounds:.2f} rounds per game")
+
+
+if __name__ == "__main__":
+    main()
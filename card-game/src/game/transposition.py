@@ -0,0 +1,96 @@
+"""
+Bounded transposition table for game-tree search.
+
+Entries are keyed by 64-bit Zobrist hashes (GameState.zobrist_hash) and
+stored in a fixed number of two-slot buckets, so memory use never grows
+past the capacity given:
+    slot 0 - depth-preferred: only replaced by an entry searched at least
+             as deep (or from a newer search generation)
+    slot 1 - always replaced, so recent positions are still found
+One table can be shared by any number of search players; stats() reports
+how useful it has been.
+"""
+from collections import namedtuple
+
+# Bounds of a stored value
+EXACT = 0
+LOWER = 1
+UPPER = 2
+
+Entry = namedtuple('Entry', ['key', 'depth', 'value', 'flag', 'move', 'generation'])
+
+TableStats = namedtuple('TableStats', ['probes', 'hits', 'stores', 'replacements', 'entries', 'hit_rate'])
+
+
+class TranspositionTable:
+    """
+    Fixed-size hash table of search results.
+
+    Attributes:
+        buckets: Number of two-slot buckets (capacity is twice this)
+        generation: Age stamp of new entries; call new_search() to advance it
+    """
+
+    def __init__(self, capacity=1 << 20):
+        self.buckets = max(1, capacity // 2)
+        self.generation = 0
+        self._slots = [None] * (2 * self.buckets)
+        self.probes = 0
+        self.hits = 0
+        self.stores = 0
+        self.replacements = 0
+        self._entries = 0  # Slots in use, counted as they fill
+
+    def __len__(self):
+        return self._entries
+
+    def get(self, key):
+        """Return the Entry stored for key, or None"""
+        self.probes += 1
+        index = 2 * (key % self.buckets)
+        slots = self._slots
+        entry = slots[index]
+        if entry is None or entry.key != key:
+            entry = slots[index + 1]
+            if entry is None or entry.key != key:
+                return None
+        self.hits += 1
+        return entry
+
+    def put(self, key, value, depth=0, flag=EXACT, move=None):
+        """Store a search result for key, following the replacement policy"""
+        self.stores += 1
+        index = 2 * (key % self.buckets)
+        slots = self._slots
+        entry = Entry(key, depth, value, flag, move, self.generation)
+        preferred = slots[index]
+        if (preferred is None or preferred.key == key or depth >= preferred.depth
+                or preferred.generation != self.generation):
+            if preferred is None:
+                self._entries += 1
+            elif preferred.key != key:
+                self.replacements += 1
+            slots[index] = entry
+            return
+        recent = slots[index + 1]
+        if recent is None:
+            self._entries += 1
+        elif recent.key != key:
+            self.replacements += 1
+        slots[index + 1] = entry
+
+    def new_search(self):
+        """Start a new search generation; older entries become replaceable"""
+        self.generation += 1
+
+    def clear(self):
+        """Remove every entry and reset the statistics"""
+        self._slots = [None] * (2 * self.buckets)
+        self.generation = 0
+        self.probes = self.hits = self.stores = self.replacements = 0
+        self._entries = 0
+
+    def stats(self):
+        """Return a TableStats snapshot (hit_rate is hits per probe)"""
+        rate = self.hits / self.probes if self.probes else 0.0
+        return TableStats(self.probes, self.hits, self.stores, self.replacements, len(self), rate)
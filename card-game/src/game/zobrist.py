@@ -0,0 +1,86 @@
+"""
+Zobrist hashing of the rule state.
+
+Every component of the rule state has a table of fixed random 64-bit keys,
+and a state's hash is the XOR of the keys of its current values:
+    - each card in each player's hand (HAND_KEYS[seat][card_id])
+    - the top table card (TOP_KEYS, including EMPTY_TABLE)
+    - whose turn it is, the pending effect fields, the optional draw flag,
+      the point multiplier and the number of cards left in the deck
+
+GameState keeps the card part (hands and top card) up to date as cards
+are played and drawn, since that is what most moves change, and adds the
+few small fields in zobrist_hash(), once per state. Buried table cards,
+the deck order and the scores are not part of the hash.
+
+A live Game keeps no hash: searches run on GameState, while Game's
+hands, table and effects are also assigned directly (restore(), the
+GUI, tests). Hash a game with GameState.from_game(game).zobrist_hash().
+"""
+import random
+
+from .rules import TOP_STATES, EMPTY_TABLE
+
+_rng = random.Random(0x2B7E1516)
+
+
+def _keys(count):
+    return tuple(_rng.getrandbits(64) for _ in range(count))
+
+
+HAND_KEYS = (_keys(52), _keys(52))
+TOP_KEYS = _keys(TOP_STATES)
+CURRENT_KEYS = _keys(2)
+DRAW_CARDS_KEYS = _keys(64)      # Clamped to 63
+SKIP_TURN_KEYS = _keys(2)
+REQUIRES_SIX_KEYS = _keys(2)
+SIX_CHAIN_KEYS = _keys(16)       # Clamped to 15
+SIX_OWNER_KEYS = _keys(3)        # Seat, or 2 for None
+SIX_SUIT_KEYS = _keys(5)         # Suit index, or 4 for None
+ENFORCED_SUIT_KEYS = _keys(6)    # Suit index, UNKNOWN_SUIT, or 5 for None
+OPTIONAL_DRAW_KEYS = _keys(2)
+MULTIPLIER_KEYS = _keys(64)      # Clamped to 63
+DECK_SIZE_KEYS = _keys(53)
+# Not part of hash_state; mixed in by searches that must tell apart positions
+# where the table can be reshuffled (more than one card on it)
+RESHUFFLE_KEY = _keys(1)[0]
+# Not part of hash_state either; the length of the run of Jacks on top of the
+# table, which scores the Jack bonus when a player goes out (0 to 4)
+TRAILING_JACKS_KEYS = _keys(5)
+
+
+def hand_delta(seat, changed):
+    """XOR of the hand keys of the cards set in the mask changed"""
+    keys = HAND_KEYS[seat]
+    value = 0
+    while changed:
+        low = changed & -changed
+        value ^= keys[low.bit_length() - 1]
+        changed ^= low
+    return value
+
+
+def cards_hash(masks, table):
+    """Hash of both hands and the top table card"""
+    top = table[-1] if table else EMPTY_TABLE
+    return hand_delta(0, masks[0]) ^ hand_delta(1, masks[1]) ^ TOP_KEYS[top]
+
+
+def fields_hash(state):
+    """Hash of the turn, pending effects and other small fields of a GameState"""
+    return (CURRENT_KEYS[state.current]
+            ^ DRAW_CARDS_KEYS[min(state.draw_cards, 63)]
+            ^ SKIP_TURN_KEYS[state.skip_turn]
+            ^ REQUIRES_SIX_KEYS[state.requires_six]
+            ^ SIX_CHAIN_KEYS[min(state.six_chain, 15)]
+            ^ SIX_OWNER_KEYS[2 if state.six_owner is None else state.six_owner]
+            ^ SIX_SUIT_KEYS[4 if state.six_suit is None else state.six_suit]
+            ^ ENFORCED_SUIT_KEYS[5 if state.enforced_suit is None else state.enforced_suit]
+            ^ OPTIONAL_DRAW_KEYS[state.optional_draw_used]
+            ^ MULTIPLIER_KEYS[min(state.multiplier, 63)]
+            ^ DECK_SIZE_KEYS[len(state.deck)])
+
+
+def hash_state(state):
+    """Zobrist hash of a GameState computed from scratch"""
+    return cards_hash(state.masks, state.table) ^ fields_hash(state)
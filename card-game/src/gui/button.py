@@ -1,4 +1,6 @@
 import pygame
+from gui.fonts import get_font
+from gui.text_cache import render_text
 
 class Button:
     def __init__(self, text, position, action=None):
@@ -9,7 +11,7 @@ class Button:
         self.rect = pygame.Rect(position[0], position[1], self.width, self.height)
         self.color = (100, 100, 200)
         self.hover_color = (150, 150, 250)
-        self.font = pygame.font.Font(None, 36)
+        self.font = get_font(36)
         self.action = action
 
     def draw(self, screen):
@@ -17,7 +19,7 @@ class Button:
         if self.rect.collidepoint(pygame.mouse.get_pos()):
             current_color = self.hover_color
         pygame.draw.rect(screen, current_color, self.rect)
-        text_surface = self.font.render(self.text, True, (255, 255, 255))
+        text_surface = render_text(self.font, self.text, True, (255, 255, 255))
         text_rect = text_surface.get_rect(center=self.rect.center)
         screen.blit(text_surface, text_rect)
 
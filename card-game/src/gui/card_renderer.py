@@ -1,5 +1,7 @@
 import pygame
 import os
+from gui.fonts import get_font
+from gui.text_cache import render_text
 
 class CardRenderer:
     def __init__(self, screen):
@@ -95,7 +97,7 @@ class CardRenderer:
                 pygame.draw.rect(card_surface, (200, 200, 200), (2, 2, 76, 116), 2)  # Border
                 
                 # Draw rank and suit
-                font = pygame.font.Font(None, 36)
+                font = get_font(36)
                 rank_text = self.get_rank_text(rank)
                 text = font.render(rank_text, True, color)
                 card_surface.blit(text, (10, 10))
@@ -146,8 +148,7 @@ class CardRenderer:
         else:
             # Create a default card visual if image not found
             pygame.draw.rect(self.screen, (255, 255, 255), (position[0], position[1], 80, 120))
-            font = pygame.font.Font(None, 24)
-            text = font.render(card.get_card_info(), True, (0, 0, 0))
+            text = render_text(get_font(24), card.get_card_info(), True, (0, 0, 0))
             self.screen.blit(text, (position[0] + 5, position[1] + 50))
             print(f"Missing card image for {card.get_card_info()}")
 
@@ -0,0 +1,95 @@
+import pygame
+
+class Region:
+    """
+    A part of the screen drawn by one function.
+
+    The region is redrawn when the value returned by key() changes (or when
+    it is invalidated), so key() must capture everything its drawing reads.
+
+    Attributes:
+        rect: Area the drawing stays within (it is clipped to it)
+        draw: Called with the surface to draw the region
+        key: Called every frame; a change marks the region dirty
+    """
+
+    def __init__(self, rect, draw, key):
+        self.rect = pygame.Rect(rect)
+        self.draw = draw
+        self.key = key
+        self.last_key = None
+        self.dirty = True
+
+    def invalidate(self):
+        self.dirty = True
+
+
+class DirtyRenderer:
+    """
+    Redraws only the regions of a screen that changed.
+
+    Regions are drawn in the order they were added, later ones on top. For
+    every dirty area the background is cleared and each region overlapping
+    it is drawn again, clipped to the area, so overlapping regions and
+    translucent overlays come out as in a full redraw. render() returns the
+    rectangles for pygame.display.update(); an idle screen returns none.
+    """
+
+    def __init__(self, background=(0, 0, 0)):
+        self.background = background
+        self.regions = []
+        self._full = True
+
+    def add(self, rect, draw, key):
+        region = Region(rect, draw, key)
+        self.regions.append(region)
+        return region
+
+    def invalidate(self):
+        """Redraw the whole screen on the next render"""
+        self._full = True
+
+    def dirty_rects(self, surface):
+        """Poll every region's key and return the areas of surface to redraw"""
+        rects = []
+        for region in self.regions:
+            key = region.key()
+            if key != region.last_key:
+                region.last_key = key
+                region.dirty = True
+            if region.dirty:
+                region.dirty = False
+                rects.append(region.rect)
+        if self._full:
+            self._full = False
+            return [surface.get_rect()]
+        return merge_rects(rects)
+
+    def render(self, surface):
+        """Draw the dirty areas on surface and return them"""
+        rects = self.dirty_rects(surface)
+        clip = surface.get_clip()
+        for rect in rects:
+            surface.set_clip(rect)
+            surface.fill(self.background, rect)
+            for region in self.regions:
+                if region.rect.colliderect(rect):
+                    region.draw(surface)
+        surface.set_clip(clip)
+        return rects
+
+
+def merge_rects(rects):
+    """Union overlapping rectangles until none overlap"""
+    merged = []
+    for rect in rects:
+        rect = pygame.Rect(rect)
+        i = 0
+        while i < len(merged):
+            if merged[i].colliderect(rect):
+                rect.union_ip(merged.pop(i))
+                i = 0
+            else:
+                i += 1
+        merged.append(rect)
+    return merged
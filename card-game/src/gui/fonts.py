@@ -0,0 +1,44 @@
+import pygame
+
+class FontPool:
+    """
+    Fonts shared by the whole process, created once per (face, size).
+
+    Building a pygame Font loads and parses the font file, so screens ask
+    the pool for their fonts instead of constructing them while drawing.
+    Pooled fonts are also stable keys for the text cache (gui.text_cache).
+
+    Attributes:
+        created: Number of Font objects built so far
+    """
+
+    def __init__(self):
+        self.created = 0
+        self._fonts = {}
+
+    def __len__(self):
+        return len(self._fonts)
+
+    def get(self, size, face=None):
+        """The font for face (a file path, or None for the default font) at size"""
+        key = (face, int(size))
+        font = self._fonts.get(key)
+        if font is None:
+            font = self._fonts[key] = pygame.font.Font(face, key[1])
+            self.created += 1
+        return font
+
+    def clear(self):
+        """Drop every font (e.g. before pygame.font.quit())"""
+        self._fonts.clear()
+
+
+font_pool = FontPool()
+
+def get_font(size, face=None):
+    """Get a font from the shared pool (see FontPool.get)"""
+    return font_pool.get(size, face)
+
+def scaled_size(screen_height, fraction, maximum):
+    """A font size that is fraction of the screen height, up to maximum"""
+    return min(int(screen_height * fraction), maximum)
@@ -1,17 +1,26 @@
 import pygame
 import math  # Added for math.sin()
 from game.game import Game
+from game import events
 from gui.button import Button
 from gui.card_renderer import CardRenderer
-from utils.helpers import get_messages, clear_messages
+from gui.dirty import DirtyRenderer
+from gui.fonts import get_font, scaled_size
+from gui.message_log_view import MessageLogView
+from gui.overlays import overlay_cache
+from gui.text_cache import render_text
+from utils.helpers import message_log
+
+# Brightness steps of the pulsing "Computer choosing suit" glow
+PULSE_FRAMES = 16
 
 class GameScreen:
     def __init__(self, screen, game: Game):
         self.screen = screen
         self.game = game
-        self.font = pygame.font.Font(None, 32)
-        self.small_font = pygame.font.Font(None, 22)
-        self.large_font = pygame.font.Font(None, 28)
+        self.font = get_font(32)
+        self.small_font = get_font(22)
+        self.large_font = get_font(28)
         self.card_renderer = CardRenderer(screen)
         self.error_message = None      # Message to display when an invalid move is made
         self.error_time = 0            # Time when error message was displayed
@@ -30,6 +39,9 @@ class GameScreen:
         self.computer_choice_start_time = 0
         self.computer_choice_duration = 2000  # Show indicator for 2 seconds
         
+        # True while Game.step has more computer turns to play (one per frame)
+        self.ai_turn_pending = False
+        
         # Player effect indicators - track which players are affected by card effects
         self.player_effect_indicators = {
             0: None,  # Human player (index 0)
@@ -40,6 +52,23 @@ class GameScreen:
         self.screen_width = screen.get_width()
         self.screen_height = screen.get_height()
         
+        # Overlay fonts, scaled with the screen (shared through the font pool)
+        self.round_end_font = get_font(scaled_size(self.screen_height, 0.08, 60))
+        self.game_over_font = get_font(scaled_size(self.screen_height, 0.12, 80))
+        self.suit_title_font = get_font(48)
+        self.suit_name_font = get_font(36)
+        self.suit_symbol_font = get_font(80)
+        self.indicator_font = get_font(42)
+        
+        # Overlays and glows are pre-rendered for this resolution
+        overlay_cache.set_resolution((self.screen_width, self.screen_height))
+        
+        # Colours of the pulsing glow, one per animation frame
+        self.choice_glow_colors = []
+        for frame in range(PULSE_FRAMES):
+            pulse = frame / (PULSE_FRAMES - 1)
+            self.choice_glow_colors.append((255, int(100 + pulse * 155), 0, int(50 + pulse * 150)))
+        
         # Define warm color palette
         self.colors = {
             'bg_panel': (85, 60, 40),           # Warm brown background
@@ -90,6 +119,71 @@ class GameScreen:
         
         # Set up callback for player effect notifications
         self.game.set_player_effect_callback(self.on_player_effect_notification)
+        
+        # Message log lines, wrapped and rendered once per message
+        self.message_view = MessageLogView(message_log, self.small_font, self.colors['message_text'],
+                                           self.message_panel_width - 30)
+        
+        # Screen regions, each redrawn only when what it shows changes
+        self.renderer = DirtyRenderer()
+        self.create_regions()
+
+    def create_regions(self):
+        """Split the screen into regions for the dirty-rectangle renderer, bottom layer first"""
+        game = self.game
+        width, height = self.screen_width, self.screen_height
+        add = self.renderer.add
+        
+        # The hands and the table pile span the game area (the panels are drawn over its edges)
+        center_y = height // 2
+        ellipse_height = min(self.game_area_width, height) * 0.3
+        table_top = center_y - max(90, ellipse_height / 2) - 5
+        table_bottom = center_y + max(175, ellipse_height / 2 + 5)
+        human_top = height * 0.75 - 25
+        add((0, 0, self.info_panel_x, height * 0.15 + 125), self.draw_computer_area,
+            lambda: (len(game.players[1].hand), self.player_effect_indicators[1]))
+        add((0, table_top, self.info_panel_x, table_bottom - table_top), self.draw_table_area,
+            lambda: (len(game.table_cards), tuple(card.id for card in game.table_cards[-8:]), len(game.deck),
+                     game.must_draw))
+        add((0, human_top, self.info_panel_x, height - human_top), self.draw_player_area,
+            lambda: (tuple(card.id for card in game.players[0].hand), tuple(self.staged_cards),
+                     game.playable_mask(), game.must_draw, self.player_effect_indicators[0]))
+        
+        # Side panels
+        add((0, 0, self.message_panel_width, height), self.draw_message_log,
+            lambda: (message_log.version, self.message_view.scroll))
+        add((self.info_panel_x, 0, self.info_panel_width, height), self.draw_info_panel,
+            lambda: (game.round_number, len(game.players[0].hand), len(game.players[1].hand), len(game.deck),
+                     game.is_human_turn, self.effects_key()))
+        add((0, height * 0.2 - 30, width, 60), self.display_error_message, self.active_error_message)
+        add((0, height - 155, width, 130),
+            lambda surface: self.display_special_card_rules(surface, self.info_panel_width, height - 150),
+            lambda: None)
+        
+        # Overlays and buttons
+        add((0, 0, width, height), self.draw_suit_selection,
+            lambda: self.waiting_for_suit_choice and bool(self.suit_buttons))
+        for button in self.buttons:
+            add(button.rect, button.draw, lambda button=button: button.rect.collidepoint(pygame.mouse.get_pos()))
+        add(self.new_round_button.rect, self.draw_new_round_button,
+            lambda: self.show_new_round_button and self.new_round_button.rect.collidepoint(pygame.mouse.get_pos()))
+        add((0, 0, width, height), self.draw_round_end,
+            lambda: (game.is_running, game.round_end_message, game.round_number, self.show_new_round_button))
+        choice_x = self.game_area_x + self.game_area_width // 2
+        add((choice_x - 300, height // 2 - 170, 600, 240), self.draw_computer_choice_indicator,
+            lambda: self.computer_choice_frame() if game.effects.computer_choosing_suit else None)
+
+    def effects_key(self):
+        """The pending effects shown in the info panel"""
+        effects = self.game.effects
+        return (effects.draw_cards, effects.skip_turn, effects.requires_six, effects.six_owner, effects.six_suit,
+                effects.suit_enforced, effects.chosen_suit)
+
+    def active_error_message(self):
+        """The error message while it is still shown, otherwise None"""
+        if self.error_message and pygame.time.get_ticks() - self.error_time < 3000:
+            return self.error_message
+        return None
 
     def clear_staged_cards(self):
         """Clear any cards that were staged but not played"""
@@ -172,8 +266,8 @@ class GameScreen:
             if hasattr(self, 'pending_suit_choice'):
                 delattr(self, 'pending_suit_choice')
         
-        # End the player's turn
-        self.game.end_player_turn()
+        # End the player's turn (this plays the computer's first turn)
+        self.ai_turn_pending = self.game.step()
         
         # Check for win condition
         if len(human_player.hand) == 0:
@@ -199,49 +293,45 @@ class GameScreen:
         
         # Log the message using the helper function
         from utils.helpers import display_message
-        display_message(message)
+        display_message(message, events.WARNING if is_error else events.INFO)
 
     def draw(self, surface):
-        """Draw the game screen"""
+        """Redraw the parts of the game screen that changed and return their rectangles"""
         if not self.game.is_running and not self.game.round_end_message:
-            return False  # Nothing to draw
-            
-        # Draw the table setup first
-        self.draw_table_setup(surface)
-        
-        # Draw the message log window (left side)
-        self.draw_message_log(surface)
+            self.renderer.invalidate()  # Start from a full redraw when shown again
+            return []  # Nothing to draw
         
-        # Draw the information panel (right side)
-        self.draw_info_panel(surface)
-        
-        # Draw the suit selection interface if needed
-        self.draw_suit_selection(surface)
-        
-        # Draw buttons
-        for button in self.buttons:
-            button.draw(surface)
+        # End the computer suit choice indicator once its time is up
+        if self.game.pending_effects.get('computer_choosing_suit', False):
+            current_time = pygame.time.get_ticks()
+            if current_time - self.computer_choice_start_time >= self.computer_choice_duration:
+                self.game.pending_effects['computer_choosing_suit'] = False
         
-        # Draw the new round button between rounds if it should be shown
+        return self.renderer.render(surface)
+
+    def draw_new_round_button(self, surface):
+        """Draw the new round button between rounds if it should be shown"""
         if self.show_new_round_button:
             self.new_round_button.draw(surface)
-        
-        # Show game over overlay if needed
+
+    def draw_round_end(self, surface):
+        """Show game over overlay if needed"""
         if not self.game.is_running or self.game.round_end_message:
             self.show_game_over(surface)
-            
-        # Draw computer suit choice visual indicator if active
+
+    def draw_computer_choice_indicator(self, surface):
+        """Draw computer suit choice visual indicator if active"""
         if self.game.pending_effects.get('computer_choosing_suit', False):
             self.draw_computer_choosing_suit(surface)
-            current_time = pygame.time.get_ticks()
-            if current_time - self.computer_choice_start_time >= self.computer_choice_duration:
-                self.game.pending_effects['computer_choosing_suit'] = False
-                
-        # Always update the screen
-        return True
 
     def draw_table_setup(self, surface):
         """Draw the table with players sitting across from each other"""
+        self.draw_computer_area(surface)
+        self.draw_table_area(surface)
+        self.draw_player_area(surface)
+
+    def draw_computer_area(self, surface):
+        """Draw the computer's name, effect indicator and face-down hand"""
         # Get current screen dimensions for game area (excluding info panel)
         screen_width = self.game_area_width
         screen_height = self.screen_height
@@ -249,7 +339,7 @@ class GameScreen:
         
         # First draw the computer's cards (at the top, facing down)
         computer_player = self.game.players[1]
-        text = self.font.render("Computer", True, self.colors['text_primary'])
+        text = render_text(self.font, "Computer", True, self.colors['text_primary'])
         text_rect = text.get_rect(center=(center_x, screen_height * 0.08))
         surface.blit(text, text_rect)
         
@@ -267,7 +357,7 @@ class GameScreen:
                 indicator_text = "⚠ CARD EFFECTS"
                 color = self.colors['text_error']
                 
-            indicator_surface = self.small_font.render(indicator_text, True, color)
+            indicator_surface = render_text(self.small_font, indicator_text, True, color)
             indicator_rect = indicator_surface.get_rect()
             indicator_rect.centerx = center_x
             indicator_rect.top = text_rect.bottom + 5
@@ -286,6 +376,12 @@ class GameScreen:
         computer_card_start_x = center_x - (len(computer_player.hand) * 45)  # Center cards
         for j in range(len(computer_player.hand)):
             self.card_renderer.render_card_back((computer_card_start_x + j * 90, screen_height * 0.15))
+
+    def draw_table_area(self, surface):
+        """Draw the table, the deck and the played cards"""
+        screen_width = self.game_area_width
+        screen_height = self.screen_height
+        center_x = screen_width // 2
         
         # Draw the center table where cards are played
         # Draw a slightly lighter circle in the middle of the table
@@ -298,7 +394,7 @@ class GameScreen:
         
         # Draw the deck - highlight if player must draw
         deck_pos = (center_x - ellipse_width/3, center_y)
-        if self.game.deck.cards:
+        if len(self.game.deck) > 0:
             # Highlight the deck if player must draw
             if self.game.must_draw:
                 # Draw a pulsing highlight around the deck
@@ -307,16 +403,16 @@ class GameScreen:
                               (deck_pos[0] - 5, deck_pos[1] - 5, 90, 130), 3)
                 
                 # Add a message above the deck
-                draw_msg = self.small_font.render("Draw Cards!", True, self.colors['text_warning'])
+                draw_msg = render_text(self.small_font, "Draw Cards!", True, self.colors['text_warning'])
                 surface.blit(draw_msg, (deck_pos[0] - 10, deck_pos[1] - 25))
                 
             self.card_renderer.render_card_back(deck_pos)
-            deck_count = self.font.render(f"{len(self.game.deck.cards)}", True, self.colors['text_primary'])
+            deck_count = render_text(self.font, f"{len(self.game.deck)}", True, self.colors['text_primary'])
             surface.blit(deck_count, (deck_pos[0] + 35, deck_pos[1] + 50))
         else:
             # Show empty deck outline
             pygame.draw.rect(surface, self.colors['table_color'], (deck_pos[0], deck_pos[1], 80, 120), 2)
-            empty_text = self.small_font.render("Empty", True, self.colors['text_primary'])
+            empty_text = render_text(self.small_font, "Empty", True, self.colors['text_primary'])
             surface.blit(empty_text, (deck_pos[0] + 20, deck_pos[1] + 50))
         
         # Draw table cards (played cards) in a staggered layout
@@ -355,9 +451,8 @@ class GameScreen:
                         8: (255, 120, 120, 120)   # Warm red glow for 8s
                     }
                     
-                    # Create a surface for the glow effect
-                    glow = pygame.Surface((90, 130), pygame.SRCALPHA)
-                    pygame.draw.rect(glow, effect_colors[card.rank], (0, 0, 90, 130), 0, 10)
+                    # Pre-rendered surface for the glow effect
+                    glow = overlay_cache.rect((90, 130), effect_colors[card.rank], 10)
                     surface.blit(glow, (card_pos[0] - 5, card_pos[1] - 5))
                 
                 self.card_renderer.render_card(card, card_pos)
@@ -365,13 +460,19 @@ class GameScreen:
             # Show total count of cards on the table if there are hidden cards
             if len(self.game.table_cards) > visible_cards:
                 hidden_count = len(self.game.table_cards) - visible_cards
-                count_text = self.font.render(f"+{hidden_count} more", True, self.colors['text_highlight'])
+                count_text = render_text(self.font, f"+{hidden_count} more", True, self.colors['text_highlight'])
                 count_pos = (base_table_pos[0], base_table_pos[1] - 30)
                 surface.blit(count_text, count_pos)
+
+    def draw_player_area(self, surface):
+        """Draw the human player's name, effect indicator and hand"""
+        screen_width = self.game_area_width
+        screen_height = self.screen_height
+        center_x = screen_width // 2
         
         # Draw the human player's cards at the bottom
         human_player = self.game.players[0]
-        text = self.font.render("You", True, self.colors['text_primary'])
+        text = render_text(self.font, "You", True, self.colors['text_primary'])
         text_rect = text.get_rect(center=(center_x, screen_height * 0.92))
         surface.blit(text, text_rect)
         
@@ -389,7 +490,7 @@ class GameScreen:
                 indicator_text = "⚠ CARD EFFECTS"
                 color = self.colors['text_error']
                 
-            indicator_surface = self.small_font.render(indicator_text, True, color)
+            indicator_surface = render_text(self.small_font, indicator_text, True, color)
             indicator_rect = indicator_surface.get_rect()
             indicator_rect.centerx = center_x
             indicator_rect.bottom = text_rect.top - 5
@@ -407,6 +508,7 @@ class GameScreen:
         # Draw and highlight the human player's cards
         human_card_start_x = center_x - (len(human_player.hand) * 45)  # Center cards
         human_card_y = screen_height * 0.75  # Position cards at 75% of screen height
+        playable = self.game.playable_mask()  # One mask lookup instead of a rules check per card
         
         for j, card in enumerate(human_player.hand):
             card_pos = (human_card_start_x + j * 90, human_card_y)
@@ -420,7 +522,7 @@ class GameScreen:
                               (card_pos[0] - 5, card_pos[1] - 5, 90, 130), 3)
             
             # Draw a subtle indicator for playable cards
-            elif self.game.can_play_card(card) and not self.game.must_draw:
+            elif card.bit & playable and not self.game.must_draw:
                 # Warm green indicator for playable cards
                 pygame.draw.rect(surface, self.colors['card_playable'], 
                               (card_pos[0] - 2, card_pos[1] - 2, 84, 124), 2)
@@ -430,11 +532,21 @@ class GameScreen:
 
     def handle_events(self, event):
         """Handle events for the game screen"""
+        if event.type == pygame.VIDEOEXPOSE:
+            # The window contents were lost; repaint everything
+            self.renderer.invalidate()
+            
+        if event.type == pygame.MOUSEWHEEL and pygame.mouse.get_pos()[0] < self.message_panel_width:
+            # Scroll back through the message history
+            self.message_view.scroll_by(event.y)
+            
         if event.type == pygame.KEYDOWN:
             # Handle keys for toggling fullscreen mode
             if event.key == pygame.K_ESCAPE or event.key == pygame.K_F11:
                 # Toggle fullscreen mode
                 pygame.display.toggle_fullscreen()
+                overlay_cache.set_resolution(pygame.display.get_surface().get_size())
+                self.renderer.invalidate()
                 
             # Add keyboard shortcuts for game actions
             if self.game.is_running and self.game.is_human_turn:
@@ -500,8 +612,8 @@ class GameScreen:
                         if hasattr(self, 'pending_suit_choice'):
                             delattr(self, 'pending_suit_choice')
                         
-                        # End the human player's turn
-                        self.game.end_player_turn()
+                        # End the human player's turn (this plays the computer's first turn)
+                        self.ai_turn_pending = self.game.step()
                         
                         # Check for win condition
                         if len(human_player.hand) == 0:
@@ -580,6 +692,9 @@ class GameScreen:
         if self.game.is_running:
             self.game.check_round_over()
             
+            # Continue a chain of computer turns started by the human's last play
+            self.process_ai_turns()
+            
             # Check if computer is choosing a suit and trigger visual indicator
             if self.game.pending_effects['computer_choosing_suit'] and not self.computer_choosing_suit:
                 self.start_computer_suit_selection()
@@ -589,11 +704,11 @@ class GameScreen:
             # Check if human player has no valid plays but hasn't been told to draw yet
             if self.game.is_human_turn and not self.game.must_draw:
                 human_player = self.game.players[0]
-                if not self.game.has_valid_play(human_player) and len(self.game.deck.cards) > 0:
+                if not self.game.has_valid_play(human_player) and len(self.game.deck) > 0:
                     self.game.must_draw = True
                     self.error_message = "You have no valid cards to play - you must draw!"
                     self.error_time = pygame.time.get_ticks()
-                elif not self.game.optional_draw_used and len(self.game.deck.cards) > 0 and pygame.time.get_ticks() - self.error_time > 3000:
+                elif not self.game.optional_draw_used and len(self.game.deck) > 0 and pygame.time.get_ticks() - self.error_time > 3000:
                     # Remind player they can draw an optional card (after any other error message has cleared)
                     self.error_message = "Remember: You can draw one optional card this turn."
                     self.error_time = pygame.time.get_ticks()
@@ -612,11 +727,12 @@ class GameScreen:
         self.error_message = None      # Clear any error messages
         self.game.must_draw = False    # Reset draw flag
         self.show_new_round_button = False
+        self.renderer.invalidate()     # The menu was showing; repaint everything
         
         # Check if human player needs to draw immediately at game start
         if self.game.is_human_turn:
             human_player = self.game.players[0]
-            if not self.game.has_valid_play(human_player) and len(self.game.deck.cards) > 0:
+            if not self.game.has_valid_play(human_player) and len(self.game.deck) > 0:
                 self.game.must_draw = True
                 self.error_message = "You have no valid cards to play - you must draw!"
                 self.error_time = pygame.time.get_ticks()
@@ -631,15 +747,13 @@ class GameScreen:
         
         if self.game.round_end_message:
             # Create a semi-transparent overlay
-            overlay = pygame.Surface((screen_width, screen_height), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 128))  # Semi-transparent black
+            overlay = overlay_cache.rect((screen_width, screen_height), (0, 0, 0, 128))  # Semi-transparent black
             surface.blit(overlay, (0, 0))
             
             # Create a message box - scale with screen size
             box_width = min(screen_width * 0.7, 800)
             box_height = min(screen_height * 0.4, 300)
-            message_box = pygame.Surface((box_width, box_height), pygame.SRCALPHA)
-            message_box.fill((50, 50, 50, 230))
+            message_box = overlay_cache.rect((box_width, box_height), (50, 50, 50, 230))
             box_rect = message_box.get_rect(center=(center_x, center_y))
             surface.blit(message_box, box_rect.topleft)
             
@@ -647,29 +761,28 @@ class GameScreen:
             pygame.draw.rect(surface, (255, 215, 0), box_rect, 3)
             
             # Show the round end message - may need to split into multiple lines
-            big_font_size = min(int(screen_height * 0.08), 60)
-            big_font = pygame.font.Font(None, big_font_size)
+            big_font = self.round_end_font
             
             if "Game Over!" in self.game.round_end_message:
                 # Game is completely over
-                header = big_font.render("Game Over!", True, (255, 0, 0))
+                header = render_text(big_font, "Game Over!", True, (255, 0, 0))
                 header_rect = header.get_rect(center=(center_x, center_y - box_height * 0.25))
                 surface.blit(header, header_rect)
                 
                 # Split the rest of the message
                 message_parts = self.game.round_end_message.split("Game Over! ")[1].split(". ")
                 for i, part in enumerate(message_parts):
-                    text = self.font.render(part, True, (255, 255, 255))
+                    text = render_text(self.font, part, True, (255, 255, 255))
                     text_rect = text.get_rect(center=(center_x, center_y + i * 40))
                     surface.blit(text, text_rect)
                 
                 # Show final instruction
-                restart_text = self.font.render("Press 'End Game' to return to menu", True, (255, 255, 255))
+                restart_text = render_text(self.font, "Press 'End Game' to return to menu", True, (255, 255, 255))
                 restart_rect = restart_text.get_rect(center=(center_x, center_y + box_height * 0.25))
                 surface.blit(restart_text, restart_rect)
             else:
                 # Just a round end
-                header = big_font.render(f"Round {self.game.round_number} Complete!", True, (255, 215, 0))
+                header = render_text(big_font, f"Round {self.game.round_number} Complete!", True, (255, 215, 0))
                 header_rect = header.get_rect(center=(center_x, center_y - box_height * 0.25))
                 surface.blit(header, header_rect)
                 
@@ -677,20 +790,19 @@ class GameScreen:
                 message_parts = self.game.round_end_message.split(". ")
                 for i, part in enumerate(message_parts):
                     if part and i < 3:  # Limit to 3 lines to avoid overflow
-                        text = self.font.render(part, True, (255, 255, 255))
+                        text = render_text(self.font, part, True, (255, 255, 255))
                         text_rect = text.get_rect(center=(center_x, center_y + i * 40))
                         surface.blit(text, text_rect)
                 
                 # If Next Round button is showing, add instructions
                 if self.show_new_round_button:
-                    next_round_text = self.font.render("Press 'Next Round' to continue", True, (255, 255, 0))
+                    next_round_text = render_text(self.font, "Press 'Next Round' to continue", True, (255, 255, 0))
                     next_rect = next_round_text.get_rect(center=(center_x, center_y + box_height * 0.25))
                     surface.blit(next_round_text, next_rect)
         elif not self.game.is_running:
             # Fallback for old game over behavior
             # Create a semi-transparent overlay
-            overlay = pygame.Surface((screen_width, screen_height), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 128))  # Semi-transparent black
+            overlay = overlay_cache.rect((screen_width, screen_height), (0, 0, 0, 128))  # Semi-transparent black
             surface.blit(overlay, (0, 0))
             
             # Determine winner
@@ -708,14 +820,13 @@ class GameScreen:
                 color = (255, 255, 255)  # White for tie or other
             
             # Create a large font for game over text
-            big_font_size = min(int(screen_height * 0.12), 80)
-            big_font = pygame.font.Font(None, big_font_size)
-            text = big_font.render(winner_text, True, color)
+            big_font = self.game_over_font
+            text = render_text(big_font, winner_text, True, color)
             text_rect = text.get_rect(center=(center_x, center_y))
             surface.blit(text, text_rect)
             
             # Add "Play Again" instruction
-            restart_text = self.font.render("Press 'End Game' to return to menu", True, (255, 255, 255))
+            restart_text = render_text(self.font, "Press 'End Game' to return to menu", True, (255, 255, 255))
             restart_rect = restart_text.get_rect(center=(center_x, center_y + screen_height * 0.1))
             surface.blit(restart_text, restart_rect)
 
@@ -734,15 +845,14 @@ class GameScreen:
                 error_height = min(screen_height * 0.06, 50)
                 
                 # Create a semi-transparent background for the error
-                error_bg = pygame.Surface((error_width, error_height), pygame.SRCALPHA)
-                error_bg.fill((255, 0, 0, 180))  # Semi-transparent red
+                error_bg = overlay_cache.rect((error_width, error_height), (255, 0, 0, 180))  # Semi-transparent red
                 
                 # Position at the top center of the screen
                 bg_rect = error_bg.get_rect(center=(screen_width / 2, screen_height * 0.2))
                 surface.blit(error_bg, bg_rect.topleft)
                 
                 # Render the error text
-                error_text = self.font.render(self.error_message, True, (255, 255, 255))
+                error_text = render_text(self.font, self.error_message, True, (255, 255, 255))
                 text_rect = error_text.get_rect(center=(screen_width / 2, screen_height * 0.2))
                 surface.blit(error_text, text_rect)
             else:
@@ -765,16 +875,15 @@ class GameScreen:
         # Create a semi-transparent background for rules
         rules_width = screen_width * 0.9
         rules_height = len(rules) * rule_spacing + 15
-        rules_bg = pygame.Surface((rules_width, rules_height), pygame.SRCALPHA)
-        rules_bg.fill((0, 0, 0, 80))  # Semi-transparent black
+        rules_bg = overlay_cache.rect((rules_width, rules_height), (0, 0, 0, 80))  # Semi-transparent black
         
         surface.blit(rules_bg, (screen_width/2 - rules_width/2, y_pos - 5))
         
         # Display each rule
         for i, (card, rule, color) in enumerate(rules):
             # Create text with highlighted card name
-            card_text = self.small_font.render(card + ":", True, color)
-            rule_text = self.small_font.render(rule, True, (200, 200, 200))
+            card_text = render_text(self.small_font, card + ":", True, color)
+            rule_text = render_text(self.small_font, rule, True, (200, 200, 200))
             
             # Position and render
             y = y_pos + i * rule_spacing
@@ -817,13 +926,11 @@ class GameScreen:
             return
         
         # Dim the background with a semi-transparent overlay
-        overlay = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))  # Semi-transparent black
+        overlay = overlay_cache.rect((self.screen_width, self.screen_height), (0, 0, 0, 180))  # Semi-transparent black
         surface.blit(overlay, (0, 0))
         
         # Draw title text
-        title_font = pygame.font.Font(None, 48)
-        title = title_font.render("Choose a Suit", True, (255, 255, 255))
+        title = render_text(self.suit_title_font, "Choose a Suit", True, (255, 255, 255))
         title_rect = title.get_rect(center=(self.screen_width / 2, self.screen_height / 2 - 120))
         surface.blit(title, title_rect)
         
@@ -834,15 +941,13 @@ class GameScreen:
             pygame.draw.rect(surface, (255, 255, 255), rect, 3)  # White border
             
             # Draw suit name
-            font = pygame.font.Font(None, 36)
-            text = font.render(name, True, (255, 255, 255))
+            text = render_text(self.suit_name_font, name, True, (255, 255, 255))
             text_rect = text.get_rect(center=(rect.centerx, rect.centery + 30))
             surface.blit(text, text_rect)
             
             # Draw suit symbol
-            symbol_font = pygame.font.Font(None, 80)
             symbol_map = {'H': '♥', 'D': '♦', 'C': '♣', 'S': '♠'}
-            symbol = symbol_font.render(symbol_map[suit], True, (255, 255, 255))
+            symbol = render_text(self.suit_symbol_font, symbol_map[suit], True, (255, 255, 255))
             symbol_rect = symbol.get_rect(center=(rect.centerx, rect.centery - 20))
             surface.blit(symbol, symbol_rect)
 
@@ -851,13 +956,18 @@ class GameScreen:
         self.computer_choosing_suit = True
         self.computer_choice_start_time = pygame.time.get_ticks()
 
-    def draw_computer_choosing_suit(self, surface):
-        """Draw a visual indicator when the computer is choosing a suit"""
-        current_time = pygame.time.get_ticks()
-        elapsed_time = current_time - self.computer_choice_start_time
+    def computer_choice_frame(self):
+        """The (glow frame, dot count) of the computer suit choice animation now"""
+        elapsed_time = pygame.time.get_ticks() - self.computer_choice_start_time
         
-        # Create a pulsing effect
+        # Create a pulsing effect, in PULSE_FRAMES steps
         pulse = (math.sin(elapsed_time * 0.005) + 1) * 0.5
+        dot_count = (elapsed_time // 500) % 4  # 0-3 dots based on time
+        return round(pulse * (PULSE_FRAMES - 1)), dot_count
+
+    def draw_computer_choosing_suit(self, surface):
+        """Draw a visual indicator when the computer is choosing a suit"""
+        glow_frame, dot_count = self.computer_choice_frame()
         
         # Calculate coordinates for the indicator (center of screen)
         screen_center_x = self.game_area_x + (self.game_area_width // 2)
@@ -865,26 +975,21 @@ class GameScreen:
         
         # Background glow with pulsing intensity
         glow_radius = 120
-        glow_color = (255, int(100 + pulse * 155), 0, int(50 + pulse * 150))
-        
-        # Create a surface with alpha for the glow
-        glow_surface = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
-        pygame.draw.circle(glow_surface, glow_color, (glow_radius, glow_radius), glow_radius)
+        glow_surface = overlay_cache.circle(glow_radius, self.choice_glow_colors[glow_frame])
         
         # Draw the glow centered on the indicator position
         surface.blit(glow_surface, (screen_center_x - glow_radius, screen_center_y - glow_radius))
         
         # Draw the text
-        font = pygame.font.Font(None, 42)
+        font = self.indicator_font
         text_color = (255, 255, 255)
-        text = font.render("Computer choosing suit...", True, text_color)
+        text = render_text(font, "Computer choosing suit...", True, text_color)
         text_rect = text.get_rect(center=(screen_center_x, screen_center_y))
         surface.blit(text, text_rect)
         
         # Draw dots for "waiting" animation
-        dot_count = (elapsed_time // 500) % 4  # 0-3 dots based on time
         dots = "." * dot_count
-        dots_text = font.render(dots, True, text_color)
+        dots_text = render_text(font, dots, True, text_color)
         dots_rect = dots_text.get_rect(topleft=(text_rect.right + 5, text_rect.top))
         surface.blit(dots_text, dots_rect)
 
@@ -898,10 +1003,8 @@ class GameScreen:
         self.clear_staged_cards()
         
         # Find all cards with the same rank that can be played
-        same_rank_indices = []
-        for i, card in enumerate(human_player.hand):
-            if card.rank == selected_card.rank and self.game.can_play_card(card):
-                same_rank_indices.append(i)
+        same_rank_indices = [i for i in human_player.hand.rank_positions(selected_card.rank)
+                             if self.game.can_play_card(human_player.hand[i])]
         
         # Stage all found cards
         if same_rank_indices:
@@ -930,9 +1033,8 @@ class GameScreen:
             
         # Draw a card for the human player
         human_player = self.game.players[0]
-        if len(self.game.deck.cards) > 0:
-            card = self.game.deck.draw_card()
-            human_player.hand.append(card)
+        if len(self.game.deck) > 0:
+            card = self.game.draw_card_for(human_player, optional=not self.game.must_draw)
             
             # Reset any error messages
             self.error_message = None
@@ -958,7 +1060,7 @@ class GameScreen:
         human_player = self.game.players[0]
         
         # Check if deck is empty
-        if len(self.game.deck.cards) == 0:
+        if len(self.game.deck) == 0:
             # Try to reshuffle
             if self.game.reshuffle_table_cards():
                 self.set_message("Deck was empty! Cards reshuffled.")
@@ -967,10 +1069,8 @@ class GameScreen:
                 return
         
         # Draw a card
-        card = self.game.deck.draw_card()
+        card = self.game.draw_card_for(human_player)
         if card:
-            human_player.hand.append(card)
-            
             # Reset any error messages
             self.error_message = None
             
@@ -1004,7 +1104,7 @@ class GameScreen:
         pygame.draw.rect(surface, self.colors['panel_border'], panel_rect, 3)
         
         # Draw title
-        title = self.font.render("Game Messages", True, self.colors['text_highlight'])
+        title = render_text(self.font, "Game Messages", True, self.colors['text_highlight'])
         title_rect = title.get_rect(centerx=self.message_panel_width//2, y=15)
         surface.blit(title, title_rect)
         
@@ -1015,51 +1115,9 @@ class GameScreen:
                        (self.message_panel_width - 10, title_rect.bottom + 10), 
                        2)
         
-        # Get messages and render them
-        messages = get_messages()
-        
-        # Starting position for first message
-        y_pos = title_rect.bottom + 30
-        available_height = self.screen_height - y_pos - 20  # 20px bottom margin
-        max_visible_messages = min(len(messages), 15)  # Limit visible messages
-        
-        # If we have more messages than can fit, show the most recent ones
-        start_index = max(0, len(messages) - max_visible_messages)
-        messages_to_show = messages[start_index:]
-        
-        # Draw each message
-        for i, msg in enumerate(messages_to_show):
-            # Wrap text if it's too long
-            words = msg.split()
-            wrapped_lines = []
-            current_line = ""
-            
-            for word in words:
-                test_line = current_line + " " + word if current_line else word
-                # Check if adding this word would make the line too long
-                if self.small_font.size(test_line)[0] < self.message_panel_width - 30:
-                    current_line = test_line
-                else:
-                    wrapped_lines.append(current_line)
-                    current_line = word
-            
-            # Add the last line
-            if current_line:
-                wrapped_lines.append(current_line)
-            
-            # Render each line of the wrapped message
-            for line in wrapped_lines:
-                text_surface = self.small_font.render(line, True, self.colors['message_text'])
-                surface.blit(text_surface, (15, y_pos))
-                y_pos += 20
-            
-            # Add a small gap between messages
-            y_pos += 5
-            
-            # If we're going to exceed the available height, stop rendering
-            if y_pos > self.screen_height - 20:
-                break
-                
+        # Blit the wrapped, pre-rendered messages
+        self.message_view.draw(surface, 15, title_rect.bottom + 30, self.screen_height - 20)
+
     def draw_info_panel(self, surface):
         """Draw information panel on the right side"""
         # Draw panel background
@@ -1068,7 +1126,7 @@ class GameScreen:
         pygame.draw.rect(surface, self.colors['panel_border'], panel_rect, 3)
         
         # Draw title
-        title = self.font.render("Game Information", True, self.colors['text_highlight'])
+        title = render_text(self.font, "Game Information", True, self.colors['text_highlight'])
         title_rect = title.get_rect(centerx=self.info_panel_x + self.info_panel_width//2, y=15)
         surface.blit(title, title_rect)
         
@@ -1084,7 +1142,7 @@ class GameScreen:
         center_x = self.info_panel_x + self.info_panel_width // 2
         
         # -- Display round information --
-        round_text = self.font.render(f"Round: {self.game.round_number}", True, self.colors['text_primary'])
+        round_text = render_text(self.font, f"Round: {self.game.round_number}", True, self.colors['text_primary'])
         round_rect = round_text.get_rect(centerx=center_x, y=y_pos)
         surface.blit(round_text, round_rect)
         y_pos += round_rect.height + 20
@@ -1094,19 +1152,19 @@ class GameScreen:
         computer_player = self.game.players[1]
         
         # Player cards
-        player_text = self.font.render(f"Your cards: {len(human_player.hand)}", True, self.colors['text_primary'])
+        player_text = render_text(self.font, f"Your cards: {len(human_player.hand)}", True, self.colors['text_primary'])
         player_rect = player_text.get_rect(centerx=center_x, y=y_pos)
         surface.blit(player_text, player_rect)
         y_pos += player_rect.height + 10
         
         # Computer cards
-        comp_text = self.font.render(f"Computer cards: {len(computer_player.hand)}", True, self.colors['text_primary'])
+        comp_text = render_text(self.font, f"Computer cards: {len(computer_player.hand)}", True, self.colors['text_primary'])
         comp_rect = comp_text.get_rect(centerx=center_x, y=y_pos)
         surface.blit(comp_text, comp_rect)
         y_pos += comp_rect.height + 10
         
         # Deck cards
-        deck_text = self.font.render(f"Cards in deck: {len(self.game.deck.cards)}", True, self.colors['text_primary'])
+        deck_text = render_text(self.font, f"Cards in deck: {len(self.game.deck)}", True, self.colors['text_primary'])
         deck_rect = deck_text.get_rect(centerx=center_x, y=y_pos)
         surface.blit(deck_text, deck_rect)
         y_pos += deck_rect.height + 30
@@ -1115,18 +1173,18 @@ class GameScreen:
         turn_text = "Your Turn" if self.game.is_human_turn else "Computer's Turn"
         turn_color = self.colors['text_success'] if self.game.is_human_turn else self.colors['text_warning']
         
-        turn_label = self.font.render("Current Turn:", True, self.colors['text_secondary'])
+        turn_label = render_text(self.font, "Current Turn:", True, self.colors['text_secondary'])
         turn_label_rect = turn_label.get_rect(centerx=center_x, y=y_pos)
         surface.blit(turn_label, turn_label_rect)
         y_pos += turn_label_rect.height + 5
         
-        turn_value = self.font.render(turn_text, True, turn_color)
+        turn_value = render_text(self.font, turn_text, True, turn_color)
         turn_value_rect = turn_value.get_rect(centerx=center_x, y=y_pos)
         surface.blit(turn_value, turn_value_rect)
         y_pos += turn_value_rect.height + 30
         
         # -- Display any active effects --
-        effects_label = self.font.render("Active Effects:", True, self.colors['text_secondary'])
+        effects_label = render_text(self.font, "Active Effects:", True, self.colors['text_secondary'])
         effects_label_rect = effects_label.get_rect(centerx=center_x, y=y_pos)
         surface.blit(effects_label, effects_label_rect)
         y_pos += effects_label_rect.height + 10
@@ -1155,36 +1213,27 @@ class GameScreen:
             
         # Display each effect
         for effect in active_effects:
-            effect_text = self.small_font.render(f"• {effect}", True, self.colors['text_primary'])
+            effect_text = render_text(self.small_font, f"• {effect}", True, self.colors['text_primary'])
             effect_rect = effect_text.get_rect(x=self.info_panel_x + 30, y=y_pos)
             surface.blit(effect_text, effect_rect)
             y_pos += effect_rect.height + 5
-            
-        y_pos += 20
         
-        # -- Display error messages if any --
-        self.display_error_message(surface)
-        
-        # -- Display card rules at the bottom --
-        rules_y = self.screen_height - 150
-        self.display_special_card_rules(surface, self.info_panel_width, rules_y)
+        # The error message and the card rules are regions of their own (see create_regions)
 
     def process_ai_turns(self):
-        """Process AI turns until it's the human player's turn again or game ends"""
-        if not self.game.is_running:
+        """Play the next scheduled turn, one per frame, until it's the human player's turn again or game ends"""
+        if not self.game.is_running or not self.ai_turn_pending:
             return
             
-        # Process AI turns until it's human's turn again or game ends
-        while not self.game.is_human_turn and self.game.is_running:
-            # Let the AI play
-            self.game.process_computer_turn()
-            
-            # Check for win condition after AI plays
-            computer_player = self.game.players[1]
-            if len(computer_player.hand) == 0:
-                self.set_message("Computer wins!")
-                self.show_new_round_button = True
-                break
+        # Let the AI play
+        self.ai_turn_pending = self.game.step()
+        
+        # Check for win condition after AI plays
+        computer_player = self.game.players[1]
+        if len(computer_player.hand) == 0:
+            self.set_message("Computer wins!")
+            self.show_new_round_button = True
+            self.ai_turn_pending = False
 
     def set_player_effect_indicator(self, player_index, effect_type):
         """Set an effect indicator for a player when they're affected by card effects"""
@@ -1,5 +1,7 @@
 import pygame
-from pygame import font, display, draw, Rect
+from pygame import display, draw, Rect
+from gui.fonts import get_font, scaled_size
+from gui.text_cache import render_text
 
 class MenuScreen:
     def __init__(self, screen):
@@ -9,9 +11,9 @@ class MenuScreen:
         self.screen_height = screen.get_height()
         
         # Scale font size based on screen height
-        font_size = min(int(self.screen_height * 0.12), 80)
-        self.font = font.Font(None, font_size)
-        self.title = self.font.render("Card Game", True, (255, 255, 255))
+        self.font = get_font(scaled_size(self.screen_height, 0.12, 80))
+        self.small_font = get_font(24)
+        self.title = render_text(self.font, "Card Game", True, (255, 255, 255))
         
         # Calculate button dimensions based on screen size
         button_width = min(self.screen_width * 0.6, 600)
@@ -40,14 +42,13 @@ class MenuScreen:
         self.draw_text("Quit", self.quit_button, surface)
         
         # Add fullscreen toggle hint
-        small_font = pygame.font.Font(None, 24)
-        hint_text = small_font.render("Press ESC or F11 to toggle fullscreen mode", True, (255, 255, 0))
+        hint_text = render_text(self.small_font, "Press ESC or F11 to toggle fullscreen mode", True, (255, 255, 0))
         hint_rect = hint_text.get_rect(center=(self.screen_width / 2, self.screen_height * 0.9))
         surface.blit(hint_text, hint_rect)
 
     def draw_text(self, text, rect, surface):
         """Draw text centered in a rectangle"""
-        text_surface = self.font.render(text, True, (0, 0, 0))
+        text_surface = render_text(self.font, text, True, (0, 0, 0))
         text_rect = text_surface.get_rect(center=rect.center)
         surface.blit(text_surface, text_rect)
 
@@ -0,0 +1,93 @@
+from collections import deque
+
+class MessageLogView:
+    """
+    The message log laid out for the message panel.
+
+    Each message is word-wrapped to the panel width and its lines rendered
+    once, the first time the view sees it; the rendered lines are kept in a
+    ring buffer as long as the log keeps the message. Drawing blits the
+    cached lines of the visible messages, wherever the view is scrolled to.
+
+    Attributes:
+        log: The MessageLog shown (events.MessageLog)
+        font: Font of the message text
+        color: Colour of the message text
+        width: Width the lines must stay under, in pixels
+        messages: Ring buffer of rendered messages, each a tuple of line surfaces, oldest first
+        scroll: Number of newest messages scrolled past (0 shows the latest)
+    """
+
+    def __init__(self, log, font, color, width, visible_messages=15, line_height=20, message_gap=5):
+        self.log = log
+        self.font = font
+        self.color = color
+        self.width = width
+        self.visible_messages = visible_messages
+        self.line_height = line_height
+        self.message_gap = message_gap
+        self.messages = deque(maxlen=log.entries.maxlen)
+        self.scroll = 0
+        self._appended = 0
+        self._version = 0
+
+    def sync(self):
+        """Lay out the messages added to the log since the last call"""
+        log = self.log
+        if log.version == self._version:
+            return
+        added = log.appended - self._appended
+        if log.version - self._version != added:
+            # The log was cleared since: start over from what it holds now
+            self.messages.clear()
+            self.scroll = 0
+            added = len(log.entries)
+        for i in range(max(0, len(log.entries) - added), len(log.entries)):
+            self.messages.append(self.render_message(log.entries[i]))
+        self._appended = log.appended
+        self._version = log.version
+        self.scroll = min(self.scroll, self.max_scroll())
+
+    def render_message(self, message):
+        """Wrap message to the width and render its lines"""
+        words = message.split()
+        wrapped_lines = []
+        current_line = ""
+
+        for word in words:
+            test_line = current_line + " " + word if current_line else word
+            # Check if adding this word would make the line too long
+            if self.font.size(test_line)[0] < self.width:
+                current_line = test_line
+            else:
+                wrapped_lines.append(current_line)
+                current_line = word
+
+        # Add the last line
+        if current_line:
+            wrapped_lines.append(current_line)
+        return tuple(self.font.render(line, True, self.color) for line in wrapped_lines)
+
+    def max_scroll(self):
+        return max(0, len(self.messages) - self.visible_messages)
+
+    def scroll_by(self, messages):
+        """Scroll back (positive) or forward (negative) through the history"""
+        self.sync()
+        self.scroll = max(0, min(self.scroll + messages, self.max_scroll()))
+
+    def draw(self, surface, x, y, bottom):
+        """Blit the visible messages from y down, stopping once past bottom"""
+        self.sync()
+        end = len(self.messages) - self.scroll
+        for i in range(max(0, end - self.visible_messages), end):
+            for line in self.messages[i]:
+                surface.blit(line, (x, y))
+                y += self.line_height
+
+            # Add a small gap between messages
+            y += self.message_gap
+
+            # If we're going to exceed the available height, stop rendering
+            if y > bottom:
+                break
@@ -0,0 +1,66 @@
+import pygame
+
+class OverlayCache:
+    """
+    Pre-rendered translucent surfaces (overlays, panel backgrounds, glows).
+
+    Surfaces are built on first use and kept by size and colour, so drawing
+    an overlay blits a cached surface instead of allocating a new one. Most
+    sizes follow the screen, so the cache empties itself when the
+    resolution changes. The surfaces are shared: blit them, never draw on
+    them.
+
+    Attributes:
+        resolution: Screen size the cached surfaces were made for
+        created: Number of surfaces built so far
+    """
+
+    def __init__(self):
+        self.resolution = None
+        self.created = 0
+        self._surfaces = {}
+
+    def __len__(self):
+        return len(self._surfaces)
+
+    def set_resolution(self, size):
+        """Drop every surface if the screen size changed"""
+        size = tuple(size)
+        if size != self.resolution:
+            self._surfaces.clear()
+            self.resolution = size
+
+    def _get(self, key, build):
+        surface = self._surfaces.get(key)
+        if surface is None:
+            surface = self._surfaces[key] = build()
+            self.created += 1
+        return surface
+
+    def rect(self, size, color, border_radius=0):
+        """A size surface filled with color, with rounded corners if border_radius"""
+        size = (int(size[0]), int(size[1]))
+        color = tuple(color)
+
+        def build():
+            surface = pygame.Surface(size, pygame.SRCALPHA)
+            if border_radius:
+                pygame.draw.rect(surface, color, (0, 0) + size, 0, border_radius)
+            else:
+                surface.fill(color)
+            return surface
+        return self._get(('rect', size, color, border_radius), build)
+
+    def circle(self, radius, color):
+        """A filled circle of radius on a transparent square surface"""
+        color = tuple(color)
+
+        def build():
+            surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(surface, color, (radius, radius), radius)
+            return surface
+        return self._get(('circle', radius, color), build)
+
+
+# Shared by every screen
+overlay_cache = OverlayCache()
@@ -19,7 +19,7 @@ class ScreenManager:
 
     def draw(self, surface):
         if self.current_screen:
-            self.current_screen.draw(surface)
+            return self.current_screen.draw(surface)
 
     def handle_events(self):
         for e in event.get():
@@ -0,0 +1,75 @@
+from collections import OrderedDict
+
+class TextCache:
+    """
+    Bounded cache of rendered text surfaces, least recently used first out.
+
+    Surfaces are keyed on the font object, the text, antialiasing and the
+    colours, so a font must live as long as its entries are useful (create
+    fonts once, not per frame). The surfaces returned are shared between
+    callers: blit them, never draw on them.
+
+    Attributes:
+        max_entries: Number of surfaces kept before the oldest is evicted
+        hits: Renders served from the cache
+        misses: Renders that rasterized the text
+        evictions: Surfaces dropped to stay within max_entries
+    """
+
+    def __init__(self, max_entries=512):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._surfaces = OrderedDict()
+
+    def __len__(self):
+        return len(self._surfaces)
+
+    def render(self, font, text, antialias, color, background=None):
+        """Return font.render(text, antialias, color, background), rendering it only on a miss"""
+        if type(color) is not tuple:
+            color = tuple(color)  # pygame.Color and lists are not hashable
+        if background is not None and type(background) is not tuple:
+            background = tuple(background)
+        key = (font, text, antialias, color, background)
+        surfaces = self._surfaces
+        surface = surfaces.get(key)
+        if surface is not None:
+            surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        if background is None:
+            surface = font.render(text, antialias, color)
+        else:
+            surface = font.render(text, antialias, color, background)
+        surfaces[key] = surface
+        if len(surfaces) > self.max_entries:
+            surfaces.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self):
+        """Counters for display or logging"""
+        return {'entries': len(self._surfaces), 'hits': self.hits, 'misses': self.misses,
+                'evictions': self.evictions, 'hit_rate': self.hit_rate}
+
+    def clear(self):
+        """Drop every surface (e.g. after the fonts were recreated) and reset the counters"""
+        self._surfaces.clear()
+        self.hits = self.misses = self.evictions = 0
+
+
+# Shared by every screen, so identical labels are rasterized once per process
+text_cache = TextCache()
+
+def render_text(font, text, antialias, color, background=None):
+    """Render text through the shared cache (see TextCache.render)"""
+    return text_cache.render(font, text, antialias, color, background)
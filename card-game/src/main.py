@@ -67,10 +67,16 @@ def main():
         # Update game state
         manager.update()
         
-        # Draw current screen
-        screen.fill((0, 0, 0))  # Clear screen
-        manager.draw(screen)
-        pygame.display.flip()
+        # Draw current screen: the game screen redraws only what changed and
+        # returns those rectangles, the menu redraws everything
+        if manager.current_screen == game_screen:
+            dirty_rects = manager.draw(screen)
+            if dirty_rects:
+                pygame.display.update(dirty_rects)
+        else:
+            screen.fill((0, 0, 0))  # Clear screen
+            manager.draw(screen)
+            pygame.display.flip()
         
         # Cap the frame rate
         clock.tick(60)
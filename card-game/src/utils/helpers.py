@@ -1,30 +1,22 @@
-# Global message log for the game
-message_log = []
+from game import events
+
+# Global message log for the game: subscribed to the shared event bus, so it
+# collects both game messages and the ones displayed here
 max_messages = 50  # Keep only the last 50 messages
+message_log = events.MessageLog(max_messages)
+events.bus.subscribe(message_log)
 
-def display_message(message):
-    """Display a message to the user and store it in the message log."""
-    print(message)
-    
-    # Add message to the log with timestamp
-    import datetime
-    timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-    formatted_message = f"[{timestamp}] {message}"
-    
-    message_log.append(formatted_message)
-    
-    # Keep only the last max_messages
-    if len(message_log) > max_messages:
-        message_log.pop(0)
+def display_message(message, level=events.INFO):
+    """Publish a message to the user (stdout and the message log subscribe to it)."""
+    events.bus.publish(message, level, 'gui')
 
 def get_messages():
     """Get all messages from the log."""
-    return message_log.copy()
+    return list(message_log.entries)
 
 def clear_messages():
     """Clear all messages from the log."""
-    global message_log
-    message_log = []
+    message_log.clear()
 
 def validate_input(user_input, valid_options):
     """Validate user input against a list of valid options."""
@@ -32,4 +24,4 @@ def validate_input(user_input, valid_options):
 
 def format_card_info(card):
     """Format the card information for display."""
-    return f"{card.rank} of {card.suit}"
\ No newline at end of file
+    return f"{card.rank} of {card.suit}"
@@ -0,0 +1,86 @@
+import unittest
+from src.game.batch import HAS_NUMPY, BatchEngine, lowest_card_policy
+from src.game.card import SUIT_CODES
+from src.game.game import Game
+from src.game.state import GameState, DRAW
+
+def dealt_state(seed):
+    game = Game(headless=True, seed=seed)
+    game.start_game()
+    return GameState.from_game(game)
+
+def play_lowest_card(game):
+    """Play one lowest_card_policy move in a live Game"""
+    player = game.players[game.current_player_index]
+    effects = game.pending_effects
+    move = lowest_card_policy(GameState.from_game(game))
+    if move is DRAW:
+        if effects['requires_six']:
+            found = game.draw_until_six_covered(player)
+        else:
+            found = game.draw_until_playable(player)
+        if not found:
+            game.next_turn()
+        return
+    ids = [card.id for card in player.hand]
+    indices = [ids.index(card_id) for card_id in move.cards]
+    suit = None if move.suit is None else SUIT_CODES[move.suit]
+    game.play_cards(player, indices, suit, in_order=True)
+    if not (effects['requires_six'] and effects['six_player'] is player and player.hand):
+        game.next_turn()
+
+@unittest.skipUnless(HAS_NUMPY, "numpy is not installed")
+class TestBatchEngine(unittest.TestCase):
+
+    def assert_same_round(self, engine, i, state):
+        length = engine.table_len[i]
+        self.assertEqual(tuple(int(mask) for mask in engine.hands[i]), state.masks)
+        self.assertEqual(tuple(engine.table[i, :length].tolist()), state.table)
+        self.assertEqual(tuple(engine.deck[i, :engine.deck_len[i]].tolist()), state.deck)
+        self.assertEqual(tuple(engine.points[i].tolist()), state.points)
+        self.assertEqual(engine.current[i], state.current)
+        self.assertEqual(engine.multiplier[i], state.multiplier)
+        self.assertEqual(engine.draw_cards[i], state.draw_cards)
+        self.assertEqual(engine.skip_turn[i], state.skip_turn)
+        self.assertEqual(engine.requires_six[i], state.requires_six)
+        self.assertEqual(engine.enforced_suit[i], -1 if state.enforced_suit is None else state.enforced_suit)
+        self.assertEqual(engine.round_over[i], state.round_over)
+        self.assertEqual(engine.seeds[i], state.seed)
+
+    def test_matches_scalar_rules(self):
+        states = [dealt_state(seed) for seed in range(60)]
+        engine = BatchEngine.from_states(states)
+        running = True
+        while running:
+            running = engine.step()
+            for i, state in enumerate(states):
+                if not state.round_over:
+                    states[i] = state = state.apply(lowest_card_policy(state))
+                self.assert_same_round(engine, i, state)
+        self.assertTrue(all(state.round_over for state in states))
+        self.assertGreater(max(engine.multiplier), 1)  # Reshuffles were cross-checked too
+
+    def test_matches_game(self):
+        seeds = BatchEngine.round_seeds(120, seed=7)
+        games = [Game(headless=True, seed=seed) for seed in seeds]
+        for game in games:
+            game.start_game()
+        engine = BatchEngine.deal(len(seeds), seed=7)
+        running = True
+        while running:
+            running = engine.step()
+            for i, game in enumerate(games):
+                if not game.round_over:
+                    play_lowest_card(game)
+                self.assert_same_round(engine, i, GameState.from_game(game))
+        self.assertTrue(all(game.round_over for game in games))
+        self.assertGreater(max(game.point_multiplier for game in games), 1)  # Reshuffled in both engines
+
+    def test_dealt_rounds_finish(self):
+        engine = BatchEngine.deal(500, seed=1)
+        engine.run()
+        self.assertTrue(engine.round_over.all())
+        self.assertTrue(((engine.hands[:, 0] == 0) | (engine.hands[:, 1] == 0) | (engine.deck_len == 0)).all())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,8 @@
 # filepath: c:\Python\BridgeGame\card-game\tests\test_card.py
+import copy
+import pickle
 import unittest
-from src.game.card import Card
+from src.game.card import Card, CARDS
 
 class TestCard(unittest.TestCase):
 
@@ -14,5 +16,19 @@ class TestCard(unittest.TestCase):
     def test_get_card_info(self):
         self.assertEqual(self.card.get_card_info(), 'Ace of Hearts')
 
+    def test_standard_cards_are_interned(self):
+        self.assertIs(Card(6, 'Hearts'), Card(6, 'H'))
+        self.assertIs(copy.deepcopy(Card(11, 'S')), Card(11, 'S'))
+        self.assertIs(pickle.loads(pickle.dumps(Card(1, 'D'))), Card(1, 'D'))
+        self.assertEqual(Card(6, 'H').suit, 'Hearts')
+
+    def test_integer_encoding(self):
+        self.assertEqual(len(CARDS), 52)
+        for index, card in enumerate(CARDS):
+            self.assertEqual(card.id, index)
+            self.assertEqual(card.id, card.suit_index * 13 + card.rank - 1)
+        self.assertIsNone(self.card.id)
+        self.assertEqual(self.card.bit, 0)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -1,7 +1,10 @@
 # filepath: c:\Python\BridgeGame\card-game\tests\test_deck.py
 import unittest
-from src.game.deck import Deck
+import random
+from collections import Counter
+from src.game.deck import Deck, seeded_shuffle
 from src.game.card import Card
+from src.game.rng import RandomStream
 
 class TestDeck(unittest.TestCase):
 
@@ -21,5 +24,46 @@ class TestDeck(unittest.TestCase):
         self.assertIsInstance(card, Card)
         self.assertEqual(len(self.deck.cards), 51)
 
+    def shuffled(self, seed):
+        deck = Deck(RandomStream(seed))
+        deck.shuffle()
+        return deck
+
+    def test_lazy_draws_match_the_settled_order(self):
+        lazy = self.shuffled(8)
+        drawn = [lazy.draw_card() for _ in range(10)]
+        self.assertEqual(len(lazy), 42)
+        settled = self.shuffled(8)
+        order = settled.cards[:]
+        self.assertEqual(drawn, order[::-1][:10])
+        # Reading the cards midway finishes the shuffle without changing it
+        self.assertEqual(lazy.cards, order[:42])
+        self.assertEqual(lazy.draw_card(), order[41])
+
+    def test_refill_and_explicit_orders(self):
+        deck = self.shuffled(3)
+        cards = [deck.draw_card() for _ in range(5)]
+        deck.refill(cards)
+        self.assertEqual(Counter(deck.cards), Counter(cards))
+        deck.cards = cards[:]
+        self.assertEqual([deck.draw_card() for _ in range(5)], cards[::-1])
+        self.assertIsNone(deck.draw_card())
+
+    def test_seeded_shuffle_matches_a_lazy_refill(self):
+        cards = self.shuffled(5).cards[:31]
+        for seed in range(20):
+            order, next_seed = seeded_shuffle(cards, seed)
+            deck = Deck()
+            rng = random.Random(seed)
+            deck.refill(cards, rng)
+            self.assertEqual(next_seed, rng.getrandbits(64))
+            drawn = [deck.draw_card() for _ in range(10)]
+            self.assertEqual(drawn + deck.cards[::-1], order[::-1])
+
+    def test_each_card_is_equally_likely_on_top(self):
+        tops = Counter(self.shuffled(seed).draw_card() for seed in range(5200))
+        self.assertEqual(len(tops), 52)
+        self.assertLess(max(tops.values()), 200)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
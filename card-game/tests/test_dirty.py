@@ -0,0 +1,59 @@
+import unittest
+import pygame
+from src.gui.dirty import DirtyRenderer, merge_rects
+
+class TestDirtyRenderer(unittest.TestCase):
+
+    def setUp(self):
+        self.surface = pygame.Surface((200, 100))
+        self.renderer = DirtyRenderer()
+        self.state = {'left': 0, 'right': 0}
+        self.drawn = []
+        for name, rect, color in (('left', (0, 0, 100, 100), (255, 0, 0)), ('right', (100, 0, 100, 100), (0, 0, 255))):
+            self.renderer.add(rect, self.drawer(name, rect, color), lambda name=name: self.state[name])
+
+    def drawer(self, name, rect, color):
+        def draw(surface):
+            self.drawn.append(name)
+            surface.fill(color, rect)
+        return draw
+
+    def test_first_render_is_full(self):
+        self.assertEqual(self.renderer.render(self.surface), [self.surface.get_rect()])
+        self.assertEqual(sorted(self.drawn), ['left', 'right'])
+
+    def test_idle_frames_draw_nothing(self):
+        self.renderer.render(self.surface)
+        self.drawn.clear()
+        self.assertEqual(self.renderer.render(self.surface), [])
+        self.assertEqual(self.drawn, [])
+
+    def test_only_changed_regions_are_drawn(self):
+        self.renderer.render(self.surface)
+        self.drawn.clear()
+        self.state['right'] += 1
+        self.assertEqual(self.renderer.render(self.surface), [pygame.Rect(100, 0, 100, 100)])
+        self.assertEqual(self.drawn, ['right'])
+        self.assertEqual(self.surface.get_at((150, 50))[:3], (0, 0, 255))
+
+    def test_overlapping_regions_are_redrawn_on_top(self):
+        self.renderer.add((50, 40, 100, 20), self.drawer('banner', (50, 40, 100, 20), (0, 255, 0)), lambda: None)
+        self.renderer.render(self.surface)
+        self.drawn.clear()
+        self.state['left'] += 1
+        self.renderer.render(self.surface)
+        self.assertEqual(self.drawn, ['left', 'banner'])
+        self.assertEqual(self.surface.get_at((60, 50))[:3], (0, 255, 0))
+        self.assertEqual(self.surface.get_at((150, 50))[:3], (0, 0, 255))
+
+    def test_invalidate_redraws_everything(self):
+        self.renderer.render(self.surface)
+        self.renderer.invalidate()
+        self.assertEqual(self.renderer.render(self.surface), [self.surface.get_rect()])
+
+    def test_merge_rects(self):
+        merged = merge_rects([(0, 0, 10, 10), (5, 5, 10, 10), (50, 50, 5, 5)])
+        self.assertEqual(sorted(merged), [pygame.Rect(0, 0, 15, 15), pygame.Rect(50, 50, 5, 5)])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+import random
+import time
+import unittest
+from src.game.card import Card
+from src.game.endgame import EndgameSolver, SolverTimeout
+from src.game.game import Game
+from src.game.ismcts import ENDGAME_MAX_CARDS, ISMCTSPlayer
+from src.game.movegen import legal_moves
+from src.game.state import GameState, Move
+
+def plain_negamax(state):
+    """Unmemoized reference search with the solver's scoring"""
+    player = state.current
+    best = None
+    for move in legal_moves(state):
+        child = state.apply(move)
+        if child.round_over:
+            value = ((child.points[player ^ 1] - state.points[player ^ 1])
+                     - (child.points[player] - state.points[player]))
+        elif child.multiplier != state.multiplier:
+            value = EndgameSolver._estimate(state, player, child.multiplier)
+        else:
+            value = plain_negamax(child)
+            if child.current != player:
+                value = -value
+        best = value if best is None else max(best, value)
+    return best
+
+def empty_deck_state(seed):
+    """Play random moves until the deck runs out"""
+    rng = random.Random(seed)
+    random.seed(seed)
+    game = Game(headless=True)
+    game.start_game()
+    state = GameState.from_game(game, seed=seed)
+    while not state.round_over and state.deck:
+        state = state.apply(rng.choice(legal_moves(state)))
+    return state
+
+class TestEndgameSolver(unittest.TestCase):
+
+    def test_goes_out_when_possible(self):
+        game = Game(headless=True)
+        game.start_game()
+        game.deck.cards = []
+        game.table_cards = [Card(5, 'H')]
+        game.players[0].hand = [Card(9, 'H')]
+        game.players[1].hand = [Card(13, 'S'), Card(12, 'S')]
+        state = GameState.from_game(game, seed=1)
+        value, move = EndgameSolver().solve(state)
+        self.assertEqual(move, Move((Card(9, 'H').id,)))
+        self.assertEqual(value, 20)
+
+    def test_matches_unmemoized_search(self):
+        checked = 0
+        for seed in range(80):
+            state = empty_deck_state(seed)
+            if state.round_over or len(state.hands[0]) + len(state.hands[1]) > 9:
+                continue
+            solver = EndgameSolver()
+            self.assertEqual(solver.solve(state)[0], plain_negamax(state), f"seed {seed}")
+            self.assertGreater(solver.nodes_per_second, 0)
+            checked += 1
+        self.assertGreater(checked, 5)
+
+    def test_tells_apart_runs_of_jacks(self):
+        game = Game(headless=True, seed=1)
+        game.start_game()
+        game.deck.cards = []
+        game.table_cards = [Card(9, 'H'), Card(11, 'H')]
+        game.players[0].hand = [Card(11, 'S')]
+        game.players[1].hand = [Card(13, 'S'), Card(12, 'S')]
+        one_jack = GameState.from_game(game)
+        two_jacks = one_jack.replace(table=(Card(11, 'D').id, Card(11, 'H').id))
+        self.assertEqual(one_jack.zobrist_hash(), two_jacks.zobrist_hash())
+
+        solver = EndgameSolver()
+        self.assertEqual(solver.solve(one_jack)[0], EndgameSolver().solve(one_jack)[0])
+        self.assertEqual(solver.solve(two_jacks)[0], EndgameSolver().solve(two_jacks)[0])
+        self.assertNotEqual(solver.solve(one_jack)[0], solver.solve(two_jacks)[0])
+
+    def test_shared_table_matches_fresh_solves(self):
+        solver = EndgameSolver()
+        checked = 0
+        for seed in range(80):
+            state = empty_deck_state(seed)
+            while not state.round_over and not state.deck:
+                if len(state.hands[0]) + len(state.hands[1]) <= 12:
+                    self.assertEqual(solver.solve(state)[0], EndgameSolver().solve(state)[0], f"seed {seed}")
+                    checked += 1
+                state = state.apply(legal_moves(state)[-1])
+        self.assertGreater(checked, 20)
+
+    def test_stops_at_the_deadline(self):
+        ids = list(range(52))
+        random.Random(7).shuffle(ids)
+        hands = (tuple(ids[11:30]), tuple(ids[30:]))
+        game = Game(headless=True, seed=1)
+        game.start_game()
+        state = GameState.from_game(game).replace(
+            hands=hands, masks=tuple(sum(1 << card_id for card_id in hand) for hand in hands),
+            deck=(), table=tuple(ids[:11]))
+        start = time.perf_counter()
+        with self.assertRaises(SolverTimeout):
+            EndgameSolver().solve(state, deadline=start + 0.05)
+        self.assertLess(time.perf_counter() - start, 1.0)
+
+    def test_rejects_positions_with_cards_to_draw(self):
+        game = Game(headless=True)
+        game.start_game()
+        with self.assertRaises(ValueError):
+            EndgameSolver().solve(GameState.from_game(game, seed=1))
+
+    def test_ismcts_uses_solver_with_empty_deck(self):
+        state = next(state for state in map(empty_deck_state, range(50))
+                     if not state.round_over and len(legal_moves(state)) > 1
+                     and len(state.hands[0]) + len(state.hands[1]) <= ENDGAME_MAX_CARDS)
+        player = ISMCTSPlayer(budget=1.0, seed=1)
+        move = player.choose_move(state)
+        self.assertEqual(player.last_iterations, 0)
+        self.assertEqual(move, EndgameSolver().best_move(state))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import io
+import unittest
+from src.game.eventlog import EventLog, replay, read_events, PLAY, DRAW, ROUND_END, GAME_END
+from src.game.game import Game
+from src.game.ismcts import ISMCTSPlayer
+from src.game.simulation import Simulator, computer_policy, first_playable_policy
+from src.game.state import GameState
+
+def record_match(seed, recorder, policies=(computer_policy, first_playable_policy)):
+    """Play a match turn by turn, returning (events so far, snapshot) after each turn"""
+    simulator = Simulator(list(policies))
+    game = Game(headless=True, seed=seed)
+    game.recorder = recorder
+    game.start_game()
+    snapshots = []
+    while game.is_running:
+        simulator.play_turn(game, game.current_player_index)
+        game.next_turn()
+        if game.round_over and game.is_running:
+            game.start_new_round()
+        snapshots.append((recorder.events, GameState.from_game(game, seed=0)))
+    return game, snapshots
+
+class TestEventLog(unittest.TestCase):
+
+    def test_replay_rebuilds_every_position(self):
+        log = EventLog()
+        game, snapshots = record_match(8, log)
+        data = log.to_bytes()
+        for events, state in snapshots[::7] + snapshots[-1:]:
+            self.assertEqual(GameState.from_game(replay(data, stop=events), seed=0), state)
+        final = replay(data)
+        self.assertFalse(final.is_running)
+        self.assertEqual([player.points for player in final.players], [player.points for player in game.players])
+
+    def test_replays_ismcts_plays(self):
+        # ISMCTS lays multi-card plays in its own order; the log must carry that order
+        for seed in range(3):
+            log = EventLog()
+            game, snapshots = record_match(seed, log, (first_playable_policy, ISMCTSPlayer(budget=0.001, seed=seed)))
+            self.assertEqual(GameState.from_game(replay(log.to_bytes()), seed=0), snapshots[-1][1])
+
+    def test_log_is_compact(self):
+        log = EventLog()
+        record_match(9, log)
+        events = list(read_events(log.to_bytes()))
+        self.assertEqual(len(events), log.events)
+        self.assertLess(len(log.to_bytes()) / log.events, 4)
+        kinds = {event.kind for event in events}
+        self.assertTrue({PLAY, DRAW, ROUND_END, GAME_END} <= kinds)
+
+    def test_writes_through_to_file(self):
+        memory, stream = EventLog(), io.BytesIO()
+        record_match(10, memory)
+        record_match(10, EventLog(stream))
+        self.assertEqual(stream.getvalue(), memory.to_bytes())
+
+if __name__ == '__main__':
+    unittest.main()
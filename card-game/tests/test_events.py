@@ -0,0 +1,57 @@
+import unittest
+from src.game import events
+from src.game.events import EventBus, MessageLog, INFO, WARNING, DEBUG
+from src.game.game import Game
+
+class TestEventBus(unittest.TestCase):
+
+    def test_levels_filter_and_text_is_lazy(self):
+        bus = EventBus()
+        received = []
+        bus.subscribe(received.append, WARNING)
+        bus.publish("{name} drew {count} cards", INFO, name="Player", count=2)
+        self.assertEqual(received, [])
+        bus.publish("{name} cannot cover the 6", WARNING, 'game', name="Computer")
+        self.assertEqual(len(received), 1)
+        message = received[0]
+        self.assertEqual(message.fields, {'name': "Computer"})
+        self.assertEqual(message.source, 'game')
+        self.assertEqual(message.text, "Computer cannot cover the 6")
+
+    def test_no_subscribers_builds_nothing(self):
+        bus = EventBus()
+        self.assertFalse(bus.active)
+        # A template that would fail to format is never touched
+        bus.publish("{missing}", INFO)
+        log = bus.subscribe(MessageLog(2))
+        bus.unsubscribe(log)
+        bus.publish("{missing}", INFO)
+        self.assertEqual(len(log.entries), 0)
+
+    def test_message_log_keeps_latest(self):
+        bus = EventBus()
+        log = bus.subscribe(MessageLog(2), DEBUG)
+        for number in range(3):
+            bus.publish("Message {number}", DEBUG, number=number)
+        self.assertEqual(len(log.entries), 2)
+        self.assertTrue(log.entries[0].endswith("] Message 1"))
+        self.assertTrue(log.entries[1].endswith("] Message 2"))
+
+    def test_game_publishes_on_its_bus(self):
+        headless = Game(headless=True)
+        self.assertIsNot(headless.events, events.bus)
+        self.assertFalse(headless.events.active)
+        self.assertIs(Game().events, events.bus)
+
+        bus = EventBus()
+        received = []
+        bus.subscribe(received.append, DEBUG)
+        game = Game(headless=True, seed=3, event_bus=bus)
+        game.start_game()
+        game.start_new_round()
+        self.assertTrue(received)
+        self.assertTrue(all(message.source == 'game' for message in received))
+        self.assertIn("Round 2 starts!", " ".join(message.text for message in received))
+
+if __name__ == '__main__':
+    unittest.main()
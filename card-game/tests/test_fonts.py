@@ -0,0 +1,30 @@
+import unittest
+import pygame
+from src.gui.fonts import FontPool, scaled_size
+
+class TestFontPool(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.font.init()
+
+    def test_fonts_are_created_once_per_face_and_size(self):
+        pool = FontPool()
+        self.assertIs(pool.get(36), pool.get(36))
+        self.assertIs(pool.get(36.0), pool.get(36))
+        self.assertIsNot(pool.get(36), pool.get(48))
+        self.assertEqual(pool.created, 2)
+        self.assertEqual(len(pool), 2)
+
+    def test_clear(self):
+        pool = FontPool()
+        first = pool.get(22)
+        pool.clear()
+        self.assertIsNot(pool.get(22), first)
+
+    def test_scaled_size(self):
+        self.assertEqual(scaled_size(600, 0.08, 60), 48)
+        self.assertEqual(scaled_size(1080, 0.08, 60), 60)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+import random
+import time
+import unittest
+from src.game.game import Game
+from src.game.card import RANK_MASKS, popcount
+from src.game.ismcts import ISMCTSPlayer, MAX_PLAYOUT_MOVES
+from src.game.movegen import legal_moves
+from src.game.simulation import Simulator, first_playable_policy
+from src.game.state import GameState, Move, DRAW
+
+def reference_playout(state, rng):
+    """The playout policy of ISMCTSPlayer._playout, through GameState.apply"""
+    for _ in range(MAX_PLAYOUT_MOVES):
+        if state.round_over:
+            break
+        hand = state.playable_mask() & state.masks[state.current]
+        if not hand:
+            state = state.apply(DRAW)
+            continue
+        for _ in range(int(rng.random() * popcount(hand))):
+            hand &= hand - 1
+        bit = hand & -hand
+        suit = int(rng.random() * 4) if bit & RANK_MASKS[11] else None
+        state = state.apply(Move((bit.bit_length() - 1,), suit))
+    return state
+
+class TestISMCTSPlayer(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(4)
+        self.game = Game(headless=True)
+        self.game.start_game()
+        self.state = GameState.from_game(self.game, seed=4)
+
+    def test_determinize_only_changes_unseen_cards(self):
+        state = self.state
+        sample = ISMCTSPlayer.determinize(state, random.Random(1))
+        self.assertEqual(sample.hands[0], state.hands[0])
+        self.assertEqual(sample.table, state.table)
+        self.assertEqual(len(sample.hands[1]), len(state.hands[1]))
+        self.assertEqual(len(sample.deck), len(state.deck))
+        self.assertEqual(sorted(sample.hands[1] + sample.deck), sorted(state.hands[1] + state.deck))
+        self.assertEqual(sample.masks[1], sum(1 << card_id for card_id in sample.hands[1]))
+
+    def test_playout_follows_game_state(self):
+        reshuffled = 0
+        for seed in range(40):
+            game = Game(headless=True, seed=seed)
+            game.start_game()
+            state = GameState.from_game(game)
+            rng = random.Random(seed)
+            for step in range(20):
+                if state.round_over:
+                    break
+                sample = ISMCTSPlayer.determinize(state, rng)
+                end = reference_playout(sample, random.Random(step))
+                self.assertEqual(ISMCTSPlayer._playout(sample, random.Random(step)),
+                                 (end.round_over, list(end.points), list(end.masks)), f"seed {seed}")
+                reshuffled += end.multiplier > sample.multiplier
+                state = state.apply(rng.choice(legal_moves(state)))
+        self.assertGreater(reshuffled, 0)  # Reshuffles were compared too
+
+    def test_choose_move_is_legal_and_within_budget(self):
+        player = ISMCTSPlayer(budget=0.05, seed=1)
+        move = player.choose_move(self.state)
+        self.assertIn(move, legal_moves(self.state))
+        self.assertGreater(player.last_iterations, 0)
+        self.assertLess(player.last_seconds, 0.5)
+
+    def test_big_empty_deck_position_keeps_to_budget(self):
+        ids = list(range(52))
+        random.Random(7).shuffle(ids)
+        hands = (tuple(ids[11:34]), tuple(ids[34:]))
+        state = self.state.replace(hands=hands, masks=tuple(sum(1 << card_id for card_id in hand) for hand in hands),
+                                   deck=(), table=tuple(ids[:11]))
+        player = ISMCTSPlayer(budget=0.05, seed=1)
+        start = time.perf_counter()
+        move = player.choose_move(state)
+        self.assertLess(time.perf_counter() - start, 1.0)
+        self.assertIn(move, legal_moves(state))
+        self.assertGreater(player.last_iterations, 0)  # Searched instead of solving
+
+    def test_plays_complete_match_as_computer(self):
+        simulator = Simulator([first_playable_policy, ISMCTSPlayer(budget=0.001, seed=2)])
+        result = simulator.play_match()
+        self.assertGreaterEqual(result.rounds, 1)
+
+    def test_replaces_computer_turn(self):
+        game = self.game
+        game.computer_strategy = ISMCTSPlayer(budget=0.001, seed=3)
+        game.current_player_index = 1
+        game.is_human_turn = False
+        before = len(game.players[1].hand) + len(game.deck.cards)
+        game.computer_turn()
+        self.assertEqual(len(game.players[1].hand) + len(game.deck.cards) + len(game.table_cards), before)
+
+    def test_does_not_reorder_the_hand(self):
+        game = self.game
+        game.computer_strategy = ISMCTSPlayer(budget=0.001, seed=3)
+        game.current_player_index = 1
+        game.is_human_turn = False
+        hand = game.players[1].hand
+        before = list(hand)
+        game.computer_turn()
+        self.assertIs(game.players[1].hand, hand)
+        self.assertEqual(list(hand), [card for card in before if card in hand])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+import pygame
+from src.game.events import EventBus, MessageLog
+from src.gui.message_log_view import MessageLogView
+
+class CountingFont:
+    """A real font that counts the lines rendered with it"""
+
+    def __init__(self):
+        self.font = pygame.font.Font(None, 22)
+        self.rendered = 0
+
+    def size(self, text):
+        return self.font.size(text)
+
+    def render(self, text, antialias, color):
+        self.rendered += 1
+        return self.font.render(text, antialias, color)
+
+class TestMessageLogView(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.font.init()
+
+    def setUp(self):
+        self.bus = EventBus()
+        self.log = self.bus.subscribe(MessageLog(10))
+        self.font = CountingFont()
+        self.view = MessageLogView(self.log, self.font, (255, 255, 255), 200, visible_messages=3)
+
+    def test_messages_are_rendered_once(self):
+        self.bus.publish("Played 7 of Hearts")
+        self.view.sync()
+        rendered = self.font.rendered
+        self.view.sync()
+        self.view.draw(pygame.Surface((200, 400)), 0, 0, 400)
+        self.assertEqual(self.font.rendered, rendered)
+        self.bus.publish("Computer drew a card")
+        self.view.sync()
+        self.assertEqual(len(self.view.messages), 2)
+
+    def test_long_messages_wrap_under_the_width(self):
+        self.bus.publish("Effect: Player played 1 6s - Only they can cover them during their turn")
+        self.view.sync()
+        lines = self.view.messages[0]
+        self.assertGreater(len(lines), 1)
+        self.assertTrue(all(line.get_width() < 200 for line in lines))
+
+    def test_ring_buffer_follows_the_log(self):
+        for i in range(15):
+            self.bus.publish("Message {i}", i=i)
+        self.view.sync()
+        self.assertEqual(len(self.view.messages), 10)
+        self.assertEqual(self.font.rendered, 10)  # Messages already gone from the log are skipped
+
+    def test_clear_starts_over(self):
+        self.bus.publish("Before")
+        self.view.sync()
+        self.log.clear()
+        self.bus.publish("After")
+        self.view.sync()
+        self.assertEqual(len(self.view.messages), 1)
+
+    def test_scroll_is_bounded(self):
+        for i in range(5):
+            self.bus.publish("Message {i}", i=i)
+        self.view.scroll_by(10)
+        self.assertEqual(self.view.scroll, 2)
+        self.view.scroll_by(-10)
+        self.assertEqual(self.view.scroll, 0)
+
+if __name__ == '__main__':
+    unittest.main()
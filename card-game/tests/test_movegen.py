@@ -0,0 +1,65 @@
+import random
+import unittest
+from itertools import permutations
+from src.game.game import Game
+from src.game.movegen import legal_moves
+from src.game.state import GameState, Move, DRAW
+
+def canonical(move):
+    """First card, middle cards in id order, top card: the parts of a play that matter"""
+    cards = move.cards
+    if len(cards) > 2:
+        cards = (cards[0],) + tuple(sorted(cards[1:-1])) + (cards[-1],)
+    return Move(cards, move.suit)
+
+def brute_force_moves(state):
+    """Every ordered same-rank group and suit choice that GameState.apply accepts"""
+    hand = state.hands[state.current]
+    found = set()
+    for size in range(1, 5):
+        for cards in permutations(hand, size):
+            if len({card % 13 for card in cards}) != 1:
+                continue
+            suits = range(4) if cards[0] % 13 == 10 else (None,)
+            for suit in suits:
+                move = Move(cards, suit)
+                try:
+                    state.apply(move)
+                except ValueError:
+                    continue
+                found.add(canonical(move))
+    if not found or state.can_optional_draw():
+        found.add(DRAW)
+    return found
+
+class TestMoveGenerator(unittest.TestCase):
+
+    def test_matches_brute_force(self):
+        rng = random.Random(7)
+        for seed in range(30):
+            random.seed(seed)
+            game = Game(headless=True)
+            game.start_game()
+            state = GameState.from_game(game, seed=seed)
+            while not state.round_over:
+                moves = legal_moves(state)
+                self.assertEqual(len(moves), len(set(moves)), "duplicate moves")
+                if len(state.hands[state.current]) <= 9:
+                    self.assertEqual(set(moves), brute_force_moves(state), f"seed {seed}")
+                state = state.apply(rng.choice(moves))
+
+    def test_forced_draw_is_the_only_move(self):
+        random.seed(1)
+        game = Game(headless=True)
+        game.start_game()
+        state = GameState.from_game(game, seed=1)
+        rng = random.Random(1)
+        while not state.round_over:
+            moves = legal_moves(state)
+            if not state.playable_mask() & state.masks[state.current]:
+                self.assertEqual(moves, [DRAW])
+            state = state.apply(rng.choice(moves))
+        self.assertEqual(legal_moves(state), [])
+
+if __name__ == '__main__':
+    unittest.main()
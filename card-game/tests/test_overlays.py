@@ -0,0 +1,32 @@
+import unittest
+import pygame
+from src.gui.overlays import OverlayCache
+
+class TestOverlayCache(unittest.TestCase):
+
+    def test_surfaces_are_reused(self):
+        cache = OverlayCache()
+        overlay = cache.rect((800, 600), (0, 0, 0, 128))
+        self.assertIs(cache.rect((800.0, 600), (0, 0, 0, 128)), overlay)
+        self.assertIsNot(cache.rect((800, 600), (0, 0, 0, 180)), overlay)
+        self.assertIs(cache.circle(120, (255, 100, 0, 50)), cache.circle(120, (255, 100, 0, 50)))
+        self.assertEqual(cache.created, 3)
+
+    def test_matches_a_fresh_surface(self):
+        cache = OverlayCache()
+        fresh = pygame.Surface((90, 130), pygame.SRCALPHA)
+        pygame.draw.rect(fresh, (120, 120, 255, 120), (0, 0, 90, 130), 0, 10)
+        cached = cache.rect((90, 130), (120, 120, 255, 120), 10)
+        self.assertEqual(pygame.image.tostring(cached, 'RGBA'), pygame.image.tostring(fresh, 'RGBA'))
+
+    def test_resolution_change_empties_the_cache(self):
+        cache = OverlayCache()
+        cache.set_resolution((800, 600))
+        cache.rect((800, 600), (0, 0, 0, 128))
+        cache.set_resolution((800, 600))
+        self.assertEqual(len(cache), 1)
+        cache.set_resolution((1920, 1080))
+        self.assertEqual(len(cache), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+from src.game.card import Card
+from src.game.effects import PendingEffects
+from src.game.game import Game
+from src.game.state import GameState
+
+class TestPendingEffects(unittest.TestCase):
+
+    def setUp(self):
+        self.game = Game(headless=True, seed=5)
+        self.game.start_game()
+
+    def test_transitions(self):
+        effects = PendingEffects()
+        effects.add_draw(2, skip=True)
+        effects.add_draw(1)
+        self.assertEqual(effects.take_draw(), 3)
+        self.assertEqual(effects.draw_cards, 0)
+        self.assertTrue(effects.take_skip())
+        self.assertFalse(effects.skip_turn)
+        effects.play_six(1, 'H', 2)
+        effects.play_six(1, 'S')
+        self.assertEqual((effects.requires_six, effects.six_chain, effects.six_owner, effects.six_suit),
+                         (True, 3, 1, 'S'))
+        copy = effects.copy()
+        effects.cover_six()
+        self.assertEqual((effects.requires_six, effects.six_chain, effects.six_owner), (False, 0, None))
+        self.assertNotEqual(copy, effects)
+        effects.enforce_suit('D')
+        effects.release_suit()
+        self.assertEqual(effects, PendingEffects())
+
+    def test_dict_view_maps_six_player_to_seat(self):
+        game = self.game
+        game.pending_effects['six_player'] = game.players[1]
+        self.assertEqual(game.effects.six_owner, 1)
+        self.assertIs(game.pending_effects['six_player'], game.players[1])
+        self.assertEqual(set(game.pending_effects), {
+            'draw_cards', 'skip_turn', 'requires_six', 'six_chain', 'six_player',
+            'six_suit', 'chosen_suit', 'suit_enforced', 'computer_choosing_suit'})
+        self.assertFalse(game.pending_effects.get('computer_choosing_suit', False))
+        with self.assertRaises(KeyError):
+            game.pending_effects['unknown'] = 1
+
+    def test_game_plays_drive_the_effects(self):
+        game = self.game
+        human = game.players[0]
+        game.table_cards = [Card(5, 'H')]
+        human_six = Card(6, 'H')
+        human.hand = [human_six]
+        self.assertTrue(game.play_cards(human, [0]))
+        effects = game.effects
+        self.assertEqual((effects.requires_six, effects.six_owner, effects.six_suit), (True, 0, human_six.suit))
+        # The state snapshot and restore carry the seat, not a Player
+        state = GameState.from_game(game, seed=1)
+        self.assertEqual(state.six_owner, 0)
+        other = Game(headless=True)
+        other.start_game()
+        state.restore(other)
+        self.assertEqual(other.effects, effects)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import random
+import unittest
+from src.game.card import Card, CARDS
+from src.game.game import Game
+from src.game.hand import Hand
+from src.game.player import Player
+
+class TestPlayer(unittest.TestCase):
+
+    def setUp(self):
+        self.player = Player("Alice")
+        for card in (Card(1, 'H'), Card(10, 'C'), Card(11, 'S'), Card(5, 'H')):
+            self.player.add_card(card)
+
+    def test_hand_is_a_list(self):
+        self.assertIsInstance(self.player.hand, list)
+        self.assertEqual(len(self.player.hand), 4)
+        self.player.hand = [Card(2, 'D')]
+        self.assertIsInstance(self.player.hand, Hand)
+        self.assertTrue(self.player.has_card_of_suit('Diamonds'))
+
+    def test_mask_follows_mutations(self):
+        hand = self.player.hand
+        self.assertEqual(self.player.calculate_hand_points(), 45)
+        hand.pop(0)
+        hand.remove(Card(10, 'C'))
+        self.assertFalse(self.player.has_card_of_rank(1))
+        self.assertFalse(self.player.has_card_of_suit('C'))
+        self.assertTrue(self.player.has_card_of_suit('H'))
+        self.assertEqual(self.player.calculate_hand_points(), 20)
+        hand.extend([Card(13, 'D')])
+        self.assertEqual(hand.mask, Card(11, 'S').bit | Card(5, 'H').bit | Card(13, 'D').bit)
+        hand.clear()
+        self.assertEqual((hand.mask, hand.points), (0, 0))
+
+    def test_positions_follow_mutations(self):
+        rng = random.Random(11)
+        hand = self.player.hand
+        for _ in range(300):
+            operation = rng.random()
+            if operation < 0.5 or not hand:
+                hand.append(rng.choice(CARDS))
+            elif operation < 0.7:
+                hand.pop(rng.randrange(len(hand)))
+            elif operation < 0.8:
+                hand.insert(rng.randrange(len(hand) + 1), rng.choice(CARDS))
+            elif operation < 0.9:
+                hand.extend(rng.sample(CARDS, 2))
+            else:
+                hand.sort(key=lambda card: card.id)
+            for rank in (1, 6, 11):
+                self.assertEqual(hand.rank_positions(rank), [i for i, card in enumerate(hand) if card.rank == rank])
+            self.assertEqual(hand.suit_positions('H'), [i for i, card in enumerate(hand) if card.suit_index == 0])
+            self.assertEqual(hand.suit_counts, [sum(card.suit_index == suit for card in hand) for suit in range(4)])
+            for i, card in enumerate(hand):
+                if card.rank == 6:
+                    self.assertEqual(hand.can_cover_six(i), any(
+                        j != i and (other.rank == 6 or other.suit == card.suit) for j, other in enumerate(hand)))
+
+    def test_playable_queries_match_rules(self):
+        rng = random.Random(7)
+        game = Game(headless=True)
+        game.start_game()
+        for _ in range(200):
+            game.table_cards = [rng.choice(CARDS)]
+            game.pending_effects['suit_enforced'] = rng.random() < 0.3
+            game.pending_effects['chosen_suit'] = rng.choice('HDCS')
+            game.pending_effects['requires_six'] = rng.random() < 0.3
+            game.pending_effects['six_player'] = rng.choice(game.players)
+            game.pending_effects['six_suit'] = rng.choice('HDCS')
+            self.player.hand = rng.sample(CARDS, 8)
+            expected = [card for card in self.player.hand if game.can_play_card(card)]
+            self.assertEqual(self.player.get_playable_cards(game), expected)
+            self.assertEqual(self.player.count_playable_cards(game), len(expected))
+            self.assertEqual(game.has_valid_play(self.player), bool(expected))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,35 @@
+import random
+import unittest
+from src.game.game import Game
+from src.game.rng import RandomStream, derive_seed
+from src.game.simulation import Simulator, computer_policy, first_playable_policy
+
+class TestRandomStreams(unittest.TestCase):
+
+    def test_same_seed_same_deal(self):
+        games = [Game(headless=True, seed=42) for _ in range(2)]
+        for game in games:
+            random.seed()  # The global module must not matter
+            game.start_game()
+        self.assertEqual([card.id for card in games[0].deck.cards], [card.id for card in games[1].deck.cards])
+        self.assertEqual([card.id for card in games[0].players[0].hand],
+                         [card.id for card in games[1].players[0].hand])
+
+    def test_children_are_reproducible_and_distinct(self):
+        root = RandomStream(7)
+        self.assertEqual(root.child(3).random(), RandomStream(7).child(3).random())
+        self.assertNotEqual(root.child(3).seed_value, root.child(4).seed_value)
+        spawned = [root.spawn().seed_value for _ in range(3)]
+        self.assertEqual(len(set(spawned)), 3)
+        self.assertEqual(spawned[0], RandomStream(7).spawn().seed_value)
+        self.assertEqual(derive_seed(7, 'spawn', 0), spawned[0])
+
+    def test_match_from_batch_replays_from_its_seed(self):
+        simulator = Simulator([computer_policy, first_playable_policy])
+        stream = RandomStream(11)
+        results = [simulator.play_match(stream.spawn().seed_value) for _ in range(3)]
+        for result in results:
+            self.assertEqual(simulator.play_match(result.seed), result)
+
+if __name__ == '__main__':
+    unittest.main()
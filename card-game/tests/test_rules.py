@@ -0,0 +1,63 @@
+import unittest
+from src.game.card import Card, CARDS, SUIT_INDEX
+from src.game.game import Game
+from src.game.rules import PLAYABLE_MASKS, TOP_STATES, ENFORCED_STATES, SIX_STATES
+
+def reference_can_play_card(game, card):
+    """The branch-by-branch rules the lookup table replaces"""
+    if not game.table_cards:
+        return True
+    top_card = game.table_cards[-1]
+    effects = game.pending_effects
+    if effects['requires_six']:
+        if game.players[game.current_player_index] != effects['six_player']:
+            return False
+        return card.rank == 6 or card.suit_index == SUIT_INDEX.get(effects['six_suit']) or card.rank == 11
+    if card.rank == 11:
+        return True
+    if effects['suit_enforced'] and effects['chosen_suit']:
+        return card.suit_index == SUIT_INDEX.get(effects['chosen_suit'])
+    return card.suit == top_card.suit or card.rank == top_card.rank
+
+class TestRules(unittest.TestCase):
+
+    def setUp(self):
+        self.game = Game(headless=True)
+        self.game.start_game()
+
+    def test_table_size(self):
+        self.assertEqual(len(PLAYABLE_MASKS), TOP_STATES * ENFORCED_STATES * SIX_STATES)
+
+    def test_lookup_matches_reference_rules(self):
+        game = self.game
+        effects = game.pending_effects
+        tops = [None] + list(CARDS)
+        six_states = [(False, None, None)] + [(True, owner, suit) for owner in (0, 1) for suit in 'HDCS']
+        enforced_states = [(False, None)] + [(True, suit) for suit in 'HDCS']
+        for top in tops:
+            game.table_cards = [] if top is None else [top]
+            for requires_six, owner, six_suit in six_states:
+                effects['requires_six'] = requires_six
+                effects['six_player'] = None if owner is None else game.players[owner]
+                effects['six_suit'] = six_suit
+                for suit_enforced, chosen_suit in enforced_states:
+                    effects['suit_enforced'] = suit_enforced
+                    effects['chosen_suit'] = chosen_suit
+                    for current in (0, 1):
+                        game.current_player_index = current
+                        for card in CARDS:
+                            self.assertEqual(game.can_play_card(card),
+                                             reference_can_play_card(game, card),
+                                             (top, requires_six, owner, six_suit, chosen_suit, current, card))
+
+    def test_suit_codes_and_names_are_equivalent(self):
+        game = self.game
+        game.table_cards = [Card(11, 'H')]
+        game.pending_effects['suit_enforced'] = True
+        game.pending_effects['chosen_suit'] = 'Hearts'
+        by_name = game.playable_mask()
+        game.pending_effects['chosen_suit'] = 'H'
+        self.assertEqual(game.playable_mask(), by_name)
+
+if __name__ == '__main__':
+    unittest.main()
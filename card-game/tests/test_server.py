@@ -0,0 +1,169 @@
+import asyncio
+import json
+import threading
+import unittest
+from src.game.loadgen import run_load
+from src.game.server import CLIENT, GameServer, TableSession
+
+class TestTableSession(unittest.TestCase):
+
+    def play_out(self, session, moves=2000):
+        state = session.state()
+        for _ in range(moves):
+            if not state['running']:
+                break
+            if state['playable']:
+                reply = session.handle({'op': 'play', 'cards': state['playable'][:1]})
+            else:
+                reply = session.handle({'op': 'draw'})
+            self.assertTrue(reply['ok'], reply)
+            state = reply['state']
+        return state
+
+    def test_new_table_is_the_clients_turn(self):
+        session = TableSession(1, seed=3)
+        state = session.state()
+        self.assertTrue(state['turn'])
+        self.assertTrue(set(state['playable']) <= set(range(len(state['hand']))))
+        self.assertEqual(state['opponent'], len(session.game.players[1].hand))
+        self.assertEqual(state['table'], 1)
+
+    def test_plays_a_game_to_the_end(self):
+        session = TableSession(1, seed=5)
+        rounds = []
+        state = session.state()
+        while state['running']:
+            state = self.play_out(session, 1)
+            rounds.extend(state['rounds'])
+        self.assertTrue(rounds)
+        self.assertEqual(rounds[-1]['points'], state['points'])
+
+    def test_same_seed_same_game(self):
+        first = self.play_out(TableSession(1, seed=11), 40)
+        second = self.play_out(TableSession(2, seed=11), 40)
+        first.pop('table')
+        second.pop('table')
+        self.assertEqual(first, second)
+
+    def test_rejects_bad_requests(self):
+        session = TableSession(1, seed=2)
+        self.assertFalse(session.handle({'op': 'fold'})['ok'])
+        self.assertFalse(session.handle({'op': 'play', 'cards': 'all'})['ok'])
+        self.assertFalse(session.handle({'op': 'play', 'cards': [99]})['ok'])
+        session.game.current_player_index = 1 - CLIENT
+        reply = session.handle({'op': 'draw'})
+        self.assertEqual(reply['error'], "It is not your turn")
+
+    def test_rejects_bad_card_lists_without_playing(self):
+        session = TableSession(1, seed=2)
+        hand = list(session.state()['hand'])
+        for cards in ([0, 0, 0], [True], [], [0, 1, 2, 3, 4], [0.0], [-1]):
+            reply = session.handle({'op': 'play', 'cards': cards})
+            self.assertFalse(reply['ok'], cards)
+        self.assertEqual(session.state()['hand'], hand)
+
+    def test_rejects_bad_suits_before_playing(self):
+        session = TableSession(1, seed=2)
+        state = session.state()
+        for suit in ({'x': 1}, ['H'], 'Hearts', 1):
+            reply = session.handle({'op': 'play', 'cards': state['playable'][:1], 'suit': suit})
+            self.assertFalse(reply['ok'], suit)
+        self.assertEqual(session.state()['hand'], state['hand'])
+
+    def test_table_survives_an_unexpected_error(self):
+        session = TableSession(1, seed=2)
+        replies = []
+
+        class Recorder:
+            def send(self, reply):
+                replies.append(reply)
+
+        def broken(request):
+            raise RuntimeError("boom")
+
+        async def serve():
+            task = asyncio.get_running_loop().create_task(session.run())
+            handle = session.handle
+            session.handle = broken
+            session.requests.put_nowait(({'id': 1, 'op': 'state'}, Recorder()))
+            await asyncio.sleep(0)
+            session.handle = handle
+            session.requests.put_nowait(({'id': 2, 'op': 'state'}, Recorder()))
+            session.requests.put_nowait((None, None))
+            await task
+
+        asyncio.run(serve())
+        self.assertFalse(replies[0]['ok'])
+        self.assertTrue(replies[1]['ok'])
+
+    def test_search_bots_move_off_the_event_loop(self):
+        session = TableSession(1, seed=2, bot='ismcts')
+        self.assertTrue(session.threaded)
+        self.assertFalse(TableSession(2, seed=2).threaded)
+        replies = []
+        threads = []
+
+        class Recorder:
+            def send(self, reply):
+                replies.append(reply)
+
+        handle = session.handle
+
+        def recording(request):
+            threads.append(threading.current_thread())
+            return handle(request)
+
+        async def serve():
+            task = asyncio.get_running_loop().create_task(session.run())
+            session.handle = recording
+            playable = session.state()['playable']
+            request = {'id': 1, 'op': 'play', 'cards': playable[:1]} if playable else {'id': 1, 'op': 'draw'}
+            session.requests.put_nowait((request, Recorder()))
+            session.requests.put_nowait((None, None))
+            await task
+
+        asyncio.run(serve())
+        self.assertTrue(replies[0]['ok'], replies[0])
+        self.assertIsNot(threads[0], threading.main_thread())
+
+    def test_messages_are_collected_on_request(self):
+        session = TableSession(1, seed=4, messages=True)
+        self.assertIn('messages', session.state())
+        self.assertNotIn('messages', TableSession(2, seed=4).state())
+
+    def test_unknown_bot(self):
+        with self.assertRaises(ValueError):
+            TableSession(1, bot='nobody')
+
+class TestGameServer(unittest.TestCase):
+
+    def test_bad_table_ids_do_not_close_the_connection(self):
+        async def exchange():
+            listener = await GameServer().start(port=0)
+            port = listener.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            requests = [{'id': 1, 'op': 'new', 'seed': 3},
+                        {'id': 2, 'op': 'state', 'table': [1]},
+                        {'id': 3, 'op': 'state', 'table': {'id': 1}},
+                        {'id': 4, 'op': 'state', 'table': 1}]
+            replies = []
+            for request in requests:
+                writer.write(json.dumps(request).encode() + b'\n')
+                replies.append(json.loads(await reader.readline()))
+            writer.close()
+            listener.close()
+            await listener.wait_closed()
+            return replies
+
+        replies = asyncio.run(exchange())
+        self.assertEqual([reply['ok'] for reply in replies], [True, False, False, True])
+        self.assertEqual(replies[1]['error'], "Unknown table")
+
+    def test_load_over_loopback(self):
+        summary = asyncio.run(run_load(tables=20, seconds=0.5, connections=2))
+        self.assertEqual(summary.errors, 0)
+        self.assertGreater(summary.moves, 0)
+        self.assertGreater(summary.games, 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import io
+import unittest
+from contextlib import redirect_stdout
+from src.game.card import Card
+from src.game.simulation import Simulator, MatchResult, computer_policy, first_playable_policy
+from src.game.game import Game
+
+class TestSimulation(unittest.TestCase):
+
+    def setUp(self):
+        self.simulator = Simulator()
+
+    def test_play_match_finishes_game(self):
+        result = self.simulator.play_match()
+        self.assertIsInstance(result, MatchResult)
+        self.assertGreaterEqual(result.rounds, 1)
+        self.assertGreater(result.turns, 0)
+        if result.winner is not None:
+            self.assertTrue(max(result.points) > 125)
+            self.assertLess(result.points[result.winner], result.points[1 - result.winner])
+
+    def test_run_is_silent(self):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            summary = self.simulator.run(5)
+        self.assertEqual(output.getvalue(), "")
+        self.assertEqual(summary.games, 5)
+        self.assertLessEqual(sum(summary.wins) + summary.abandoned, 5)
+        self.assertGreater(summary.games_per_second, 0)
+
+    def test_round_is_scored_once(self):
+        game = Game(headless=True)
+        game.start_game()
+        game.players[0].hand = []
+        self.assertTrue(game.check_round_over())
+        points = game.players[1].points
+        self.assertTrue(game.check_round_over())
+        self.assertEqual(game.players[1].points, points)
+
+    def test_policy_returns_playable_move(self):
+        game = Game(headless=True)
+        game.start_game()
+        player = game.players[0]
+        indices, _ = first_playable_policy(game, player)
+        self.assertTrue(game.play_cards(player, indices))
+
+    def test_computer_lays_a_playable_card_of_a_set_first(self):
+        game = Game(headless=True, seed=1)
+        game.start_game()
+        game.table_cards = [Card(2, 'S')]
+        player = game.players[1]
+        player.hand = [Card(8, 'S'), Card(8, 'H'), Card(8, 'C'), Card(3, 'D')]
+        game.current_player_index = 1
+        game.optional_draw_used = True
+        computer_policy(game, player)
+        self.assertEqual([str(card) for card in game.table_cards[1:]],
+                         [str(Card(8, 'S')), str(Card(8, 'H')), str(Card(8, 'C'))])
+        self.assertEqual(len(player.hand), 1)
+
+if __name__ == '__main__':
+    unittest.main()
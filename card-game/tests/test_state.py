@@ -0,0 +1,82 @@
+import unittest
+from src.game.card import Card, SUIT_INDEX
+from src.game.game import Game
+from src.game.simulation import first_playable_policy
+from src.game.state import GameState, Move, DRAW
+
+class TestGameState(unittest.TestCase):
+
+    def setUp(self):
+        self.game = Game(headless=True, seed=3)
+        self.game.start_game()
+
+    def test_snapshot_and_restore_round_trip(self):
+        game = self.game
+        game.table_cards = [Card(6, 'H')]
+        game.pending_effects['requires_six'] = True
+        game.pending_effects['six_player'] = game.players[1]
+        game.pending_effects['six_suit'] = 'Hearts'
+        state = GameState.from_game(game, seed=1)
+
+        other = Game(headless=True)
+        other.start_game()
+        state.restore(other)
+        self.assertEqual(GameState.from_game(other, seed=1), state)
+        self.assertEqual([card.id for card in other.players[0].hand], list(state.hands[0]))
+        self.assertIs(other.pending_effects['six_player'], other.players[1])
+
+    def test_apply_returns_new_state(self):
+        state = GameState.from_game(self.game, seed=1)
+        hand = state.hands[0]
+        after = state.apply(Move((hand[0],)))
+        self.assertEqual(state.hands[0], hand)
+        self.assertEqual(after.table[-1], hand[0])
+        self.assertNotIn(hand[0], after.hands[0])
+
+    def test_illegal_move_is_rejected(self):
+        game = self.game
+        game.table_cards = [Card(2, 'H')]
+        game.players[0].hand = [Card(3, 'C'), Card(4, 'S')]
+        state = GameState.from_game(game, seed=1)
+        with self.assertRaises(ValueError):
+            state.apply(Move((Card(3, 'C').id,)))
+        with self.assertRaises(ValueError):
+            state.apply(Move((Card(2, 'H').id,)))
+
+    def test_apply_matches_game_rules(self):
+        reshuffled = [self.play_in_lockstep(seed) for seed in range(20)]
+        self.assertTrue(any(reshuffled))  # Reshuffles were compared too
+
+    def play_in_lockstep(self, seed):
+        """
+        Drive a Game and a GameState with the same moves and compare after
+        each one, through the whole round. Returns whether it reshuffled.
+        """
+        game = Game(headless=True, seed=seed)
+        game.start_game()
+        state = GameState.from_game(game)
+
+        while not state.round_over:
+            player = game.players[game.current_player_index]
+            effects = game.pending_effects
+            if game.has_valid_play(player):
+                indices, suit = first_playable_policy(game, player)
+                move = Move(tuple(player.hand[i].id for i in sorted(indices, reverse=True)), SUIT_INDEX.get(suit))
+                game.play_cards(player, indices, suit)
+                state = state.apply(move)
+                if not (effects['requires_six'] and effects['six_player'] is player and player.hand):
+                    game.next_turn()
+            else:
+                if effects['requires_six']:
+                    found = game.draw_until_six_covered(player)
+                else:
+                    found = game.draw_until_playable(player)
+                state = state.apply(DRAW)
+                if not found:
+                    game.next_turn()
+
+            self.assertEqual(GameState.from_game(game), state, f"seed {seed}")
+        return game.point_multiplier > 1
+
+if __name__ == '__main__':
+    unittest.main()
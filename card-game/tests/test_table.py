@@ -0,0 +1,50 @@
+import random
+import unittest
+from src.game.card import Card, CARDS
+from src.game.game import Game
+from src.game.table import Table
+
+def scan_trailing_jacks(cards):
+    count = 0
+    for card in reversed(cards):
+        if card.rank != 11:
+            break
+        count += 1
+    return count
+
+class TestTable(unittest.TestCase):
+
+    def test_trailing_jacks_follow_every_change(self):
+        rng = random.Random(3)
+        jacks = [card for card in CARDS if card.rank == 11]
+        table = Table()
+        for _ in range(2000):
+            operation = rng.random()
+            if operation < 0.6 or not table:
+                table.append(rng.choice(jacks if rng.random() < 0.5 else CARDS))
+            elif operation < 0.8:
+                table.pop()
+            elif operation < 0.9:
+                table.pop(rng.randrange(len(table)))
+            else:
+                table[rng.randrange(len(table))] = rng.choice(CARDS)
+            self.assertEqual(table.trailing_jacks, scan_trailing_jacks(table))
+        table.clear()
+        self.assertEqual(table.trailing_jacks, 0)
+
+    def test_going_out_on_jacks_scores_the_run(self):
+        game = Game(headless=True, seed=4)
+        game.start_game()
+        human, computer = game.players
+        game.table_cards = [Card(5, 'H'), Card(11, 'S')]
+        self.assertEqual(game.table_cards.trailing_jacks, 1)
+        human.hand = [Card(11, 'H'), Card(11, 'D')]
+        computer.hand = [Card(13, 'C')]
+        self.assertTrue(game.play_cards(human, [0, 1], 'C'))
+        self.assertEqual(game.table_cards.trailing_jacks, 3)
+        self.assertTrue(game.check_round_over())
+        self.assertEqual(human.points, -60)
+        self.assertEqual(computer.points, 10)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+import pygame
+from src.gui.text_cache import TextCache
+
+class TestTextCache(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.font.init()
+        cls.font = pygame.font.Font(None, 24)
+
+    def test_hit_returns_the_same_surface(self):
+        cache = TextCache()
+        first = cache.render(self.font, "Your cards: 7", True, (255, 255, 255))
+        second = cache.render(self.font, "Your cards: 7", True, [255, 255, 255])
+        self.assertIs(first, second)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_key_includes_colour_and_antialias(self):
+        cache = TextCache()
+        cache.render(self.font, "Round: 1", True, (255, 255, 255))
+        cache.render(self.font, "Round: 1", True, (255, 0, 0))
+        cache.render(self.font, "Round: 1", False, (255, 255, 255))
+        self.assertEqual(cache.misses, 3)
+        self.assertEqual(len(cache), 3)
+
+    def test_evicts_least_recently_used(self):
+        cache = TextCache(max_entries=2)
+        cache.render(self.font, "a", True, (0, 0, 0))
+        cache.render(self.font, "b", True, (0, 0, 0))
+        cache.render(self.font, "a", True, (0, 0, 0))
+        cache.render(self.font, "c", True, (0, 0, 0))  # Evicts "b"
+        self.assertEqual(cache.evictions, 1)
+        cache.render(self.font, "a", True, (0, 0, 0))
+        self.assertEqual(cache.hits, 2)
+        cache.render(self.font, "b", True, (0, 0, 0))
+        self.assertEqual(cache.misses, 4)
+
+    def test_matches_font_render(self):
+        cache = TextCache()
+        cached = cache.render(self.font, "Game Information", True, (255, 180, 80), (0, 0, 0))
+        direct = self.font.render("Game Information", True, (255, 180, 80), (0, 0, 0))
+        self.assertEqual(cached.get_size(), direct.get_size())
+        self.assertEqual(pygame.image.tostring(cached, 'RGB'), pygame.image.tostring(direct, 'RGB'))
+
+    def test_clear_resets_counters(self):
+        cache = TextCache()
+        cache.render(self.font, "x", True, (0, 0, 0))
+        cache.clear()
+        self.assertEqual(cache.stats()['entries'], 0)
+        self.assertEqual(cache.hit_rate, 0.0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+import unittest
+from src.game.simulation import MatchResult
+from src.game.tournament import Standings, run_tournament
+
+class TestTournament(unittest.TestCase):
+
+    def test_standings_follow_contestants_across_seats(self):
+        standings = Standings()
+        standings.add(MatchResult(0, (20, 130), 3, 40))
+        standings.add(MatchResult(0, (15, 140), 2, 30), swapped=True)
+        standings.add(MatchResult(None, (60, 60), 4, 5000), abandoned=True)
+        self.assertEqual(standings.wins, [1, 1])
+        self.assertEqual(standings.points, [20 + 140, 130 + 15])
+        self.assertEqual(standings.abandoned, 1)
+        self.assertEqual(standings.draws, 0)
+
+    def test_averages_leave_out_abandoned_matches(self):
+        standings = Standings()
+        standings.add(MatchResult(0, (20, 130), 3, 40))
+        standings.add(MatchResult(1, (140, 40), 5, 60))
+        standings.add(MatchResult(None, (900, 900), 40, 5000), abandoned=True)
+        summary = standings.summary(('a', 'b'), 1.0)
+        self.assertEqual(summary.games, 3)
+        self.assertEqual(summary.average_points, (80, 85))
+        self.assertEqual(summary.average_rounds, 4)
+
+    def test_results_do_not_depend_on_worker_count(self):
+        serial = run_tournament(('computer', 'first-playable'), games=12, workers=1, seed=5, shard_size=4)
+        pooled = run_tournament(('computer', 'first-playable'), games=12, workers=2, seed=5, shard_size=4)
+        self.assertEqual(serial.games, 12)
+        self.assertEqual(sum(serial.wins) + serial.draws + serial.abandoned, 12)
+        self.assertEqual(serial[:8], pooled[:8])
+
+    def test_computer_mirror_matches_finish(self):
+        summary = run_tournament(('computer', 'computer'), games=60, workers=1, seed=0, shard_size=30)
+        self.assertEqual(summary.abandoned, 0)
+
+    def test_unknown_contestant(self):
+        with self.assertRaises(ValueError):
+            run_tournament(('computer', 'nobody'), games=1, workers=1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import unittest
+from src.game.events import EventBus
+from src.game.game import Game
+
+class SkippingStrategy:
+    """Plays nothing but leaves a skip for the human a fixed number of times"""
+
+    def __init__(self, turns):
+        self.turns = turns
+        self.played = 0
+
+    def play_turn(self, game, player):
+        if self.played == self.turns:
+            return None
+        self.played += 1
+        game.effects.add_skip()
+        return player.hand
+
+class TestTurnScheduler(unittest.TestCase):
+
+    def make_game(self, turns):
+        game = Game(seed=9, event_bus=EventBus())
+        game.start_game()
+        game.computer_strategy = SkippingStrategy(turns)
+        return game
+
+    def test_long_effect_chains_do_not_recurse(self):
+        game = self.make_game(5000)
+        game.next_turn()
+        self.assertEqual(game.computer_strategy.played, 5000)
+        self.assertTrue(game.is_human_turn)
+        self.assertEqual(game.current_player_index, 0)
+
+    def test_step_plays_one_computer_turn(self):
+        game = self.make_game(3)
+        steps = []
+        while True:
+            steps.append(game.computer_strategy.played)
+            if not game.step():
+                break
+        self.assertEqual(steps, [0, 1, 2, 3])
+        self.assertTrue(game.is_human_turn)
+
+    def test_headless_step_only_changes_turn(self):
+        game = Game(headless=True, seed=9)
+        game.start_game()
+        game.computer_strategy = SkippingStrategy(1)
+        self.assertFalse(game.step())
+        self.assertEqual(game.current_player_index, 1)
+        self.assertEqual(game.computer_strategy.played, 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import random
+import unittest
+from src.game.game import Game
+from src.game.movegen import legal_moves
+from src.game.state import GameState
+from src.game.transposition import TranspositionTable, EXACT, LOWER
+from src.game.zobrist import hash_state
+
+class TestZobrist(unittest.TestCase):
+
+    def test_incremental_hash_matches_full_hash(self):
+        rng = random.Random(5)
+        for seed in range(10):
+            random.seed(seed)
+            game = Game(headless=True)
+            game.start_game()
+            state = GameState.from_game(game, seed=seed)
+            while not state.round_over:
+                self.assertEqual(state.zobrist_hash(), hash_state(state))
+                state = state.apply(rng.choice(legal_moves(state)))
+            self.assertEqual(state.zobrist_hash(), hash_state(state))
+
+    def test_commuting_lines_transpose(self):
+        random.seed(1)
+        game = Game(headless=True)
+        game.start_game()
+        state = GameState.from_game(game, seed=1)
+        moved = state.replace(current=1).replace(current=0)
+        self.assertEqual(moved.zobrist_hash(), state.zobrist_hash())
+        other = state.replace(current=1)
+        self.assertNotEqual(other.zobrist_hash(), state.zobrist_hash())
+
+    def test_cached_hash_is_not_part_of_equality(self):
+        game = Game(headless=True, seed=2)
+        game.start_game()
+        state = GameState.from_game(game)
+        other = GameState.from_game(game)
+        state.zobrist_hash()
+        self.assertEqual(state, other)
+        self.assertEqual(hash(state), hash(other))
+        moved = state.apply(legal_moves(state)[0])
+        self.assertEqual(moved.zobrist_hash(), hash_state(moved))
+
+class TestTranspositionTable(unittest.TestCase):
+
+    def test_store_and_probe(self):
+        table = TranspositionTable(capacity=64)
+        table.put(12345, 7, depth=3, flag=LOWER)
+        entry = table.get(12345)
+        self.assertEqual((entry.value, entry.depth, entry.flag), (7, 3, LOWER))
+        self.assertIsNone(table.get(999))
+        stats = table.stats()
+        self.assertEqual((stats.probes, stats.hits, stats.entries), (2, 1, 1))
+        self.assertEqual(stats.hit_rate, 0.5)
+
+    def test_replacement_keeps_deeper_entries(self):
+        table = TranspositionTable(capacity=2)  # A single bucket
+        table.put(1, 'deep', depth=5)
+        table.put(2, 'shallow', depth=1)
+        table.put(3, 'newer', depth=1)
+        self.assertEqual(table.get(1).value, 'deep')
+        self.assertIsNone(table.get(2))
+        self.assertEqual(table.get(3).value, 'newer')
+        self.assertEqual(len(table), 2)
+
+        table.new_search()
+        table.put(4, 'fresh', depth=0, flag=EXACT)
+        self.assertIsNone(table.get(1))
+        self.assertEqual(table.get(4).value, 'fresh')
+
+    def test_entry_count_follows_the_slots(self):
+        table = TranspositionTable(capacity=64)
+        rng = random.Random(3)
+        for _ in range(500):
+            table.put(rng.randrange(200), 0, depth=rng.randrange(4))
+            if rng.random() < 0.05:
+                table.new_search()
+            self.assertEqual(len(table), sum(entry is not None for entry in table._slots))
+        self.assertEqual(table.stats().entries, len(table))
+        table.clear()
+        self.assertEqual(len(table), 0)
+
+if __name__ == '__main__':
+    unittest.main()